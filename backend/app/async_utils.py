@@ -0,0 +1,46 @@
+"""Helpers for bridging the async fetchers into synchronous call sites.
+
+WHY: Fetchers issue their HTTP calls concurrently on asyncio, but the
+     orchestrator and existing callers are synchronous.  All bridged work runs
+     on one long-lived background loop so module-level `httpx.AsyncClient`
+     pools (which are bound to the loop that first uses them) keep their
+     connections alive across calls instead of being rebuilt per request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="async-bridge", daemon=True).start()
+            _loop = loop
+    return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the shared background loop.
+
+    Safe to call from plain threads and from inside another running loop
+    (e.g. a FastAPI handler); the caller blocks until the result is ready.
+    """
+    loop = _background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync() called from the bridge loop; await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
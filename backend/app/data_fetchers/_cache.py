@@ -0,0 +1,124 @@
+"""In-process TTL cache for upstream fetcher responses.
+
+WHY: DFF/NFCI move at most daily and 1Y daily bars only change after the
+     close, yet every pipeline run re-fetched them.  SPY history in particular
+     is identical for every ticker.  Caching the raw upstream payloads (never
+     gate outputs) removes whole HTTP round-trips without changing any math.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+_MISSING = object()
+
+
+def make_key(*parts: Any) -> str:
+    """Hash a canonical parameter tuple into a compact cache key."""
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class TTLCache:
+    """Thread-safe key/value store with per-entry expiry and a size bound."""
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = maxsize
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            if len(self._entries) >= self.maxsize and key not in self._entries:
+                self._evict()
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+        if len(self._entries) >= self.maxsize:
+            # dicts keep insertion order, so the first entry is the oldest write
+            del self._entries[next(iter(self._entries))]
+
+
+response_cache = TTLCache()
+
+
+def cached(
+    ttl: float | Callable[[dict[str, Any]], float],
+    *,
+    ignore: Iterable[str] = ("client",),
+    cache: TTLCache | None = None,
+    cache_if: Callable[[Any], bool] | None = None,
+) -> Callable:
+    """Cache a fetch helper's return value keyed on its bound arguments.
+
+    `ttl` is either seconds or a callable receiving the bound arguments.
+    Parameters named in `ignore` (e.g. the HTTP client) are left out of the
+    key.  Callers may pass `force_refresh=True` to bypass and overwrite the
+    entry.  Exceptions are never cached, nor are results rejected by
+    `cache_if` (e.g. error envelopes).  Works for sync and async functions.
+    """
+    ignored = frozenset(ignore)
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        store = cache if cache is not None else response_cache
+
+        def _key_and_ttl(args: tuple, kwargs: dict) -> tuple[str, float]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = {name: value for name, value in bound.arguments.items() if name not in ignored}
+            key = make_key(func.__module__, func.__qualname__, sorted(params.items()))
+            return key, (ttl(params) if callable(ttl) else ttl)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, force_refresh: bool = False, **kwargs: Any) -> Any:
+                key, seconds = _key_and_ttl(args, kwargs)
+                if not force_refresh:
+                    value = store.get(key, _MISSING)
+                    if value is not _MISSING:
+                        return value
+                value = await func(*args, **kwargs)
+                if cache_if is None or cache_if(value):
+                    store.set(key, value, seconds)
+                return value
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, force_refresh: bool = False, **kwargs: Any) -> Any:
+            key, seconds = _key_and_ttl(args, kwargs)
+            if not force_refresh:
+                value = store.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+            value = func(*args, **kwargs)
+            if cache_if is None or cache_if(value):
+                store.set(key, value, seconds)
+            return value
+
+        return wrapper
+
+    return decorator
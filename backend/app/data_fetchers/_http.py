@@ -0,0 +1,143 @@
+"""HTTP helpers shared by the async fetchers: host throttling, retry, JSON decode.
+
+WHY: one pipeline run fans out to several Polygon and Dome requests at once,
+     and many runs share the same pooled clients.  Unbounded fan-out trips
+     upstream rate limits (429), so concurrency is capped per host and
+     throttled/transient responses are retried with backoff, honouring
+     `Retry-After` when the server sends it.  Hosts with a published rate
+     limit (SEC: 10 req/s) additionally get a token bucket, since a burst of
+     429s and backoffs costs far more than pacing requests up front.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+import orjson
+
+# In-flight request caps per upstream host; anything else gets the default.
+HOST_CONCURRENCY = {
+    "api.polygon.io": 8,
+    "api.domeapi.io": 4,
+    # SEC fair-access policy allows ~10 req/s per client; stay well under it.
+    "data.sec.gov": 5,
+    "www.sec.gov": 5,
+}
+DEFAULT_HOST_CONCURRENCY = 16
+
+# 500 is usually a hard failure on these APIs (and Dome's proxy 500s are
+# handled by falling back to Polygon direct), so only throttling and
+# gateway-style errors are retried.
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+MAX_RETRIES = 2
+MAX_RETRY_DELAY_SECONDS = 10.0
+
+
+def read_json(response: httpx.Response) -> Any:
+    """Decode a buffered JSON body with orjson (faster than `response.json()`)."""
+    return orjson.loads(response.content)
+
+
+class AsyncTokenBucket:
+    """Pace requests to `rate` per second, allowing bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock, so tokens are handed out in arrival order.
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_seconds(attempt: int, response: httpx.Response) -> float:
+    delay = _retry_after_seconds(response)
+    if delay is None:
+        delay = 2 ** attempt + random.uniform(0.0, 0.5)
+    return min(delay, MAX_RETRY_DELAY_SECONDS)
+
+
+class ThrottledTransport(httpx.AsyncBaseTransport):
+    """Wrap an async transport with per-host semaphores and retry-on-429/5xx."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        max_retries: int = MAX_RETRIES,
+        rate_limiter: AsyncTokenBucket | None = None,
+    ) -> None:
+        self._transport = transport
+        self._max_retries = max_retries
+        self._rate_limiter = rate_limiter
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY))
+            self._semaphores[host] = semaphore
+        return semaphore
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore(request.url.host)
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            async with semaphore:
+                response = await self._transport.handle_async_request(request)
+            if response.status_code not in RETRY_STATUSES or attempt >= self._max_retries:
+                return response
+            # The slot is released while sleeping so other requests can proceed.
+            delay = _backoff_seconds(attempt, response)
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def throttled_async_transport(
+    limits: httpx.Limits,
+    rate_limiter: AsyncTokenBucket | None = None,
+) -> ThrottledTransport:
+    """Pooled HTTP/2 transport wrapped with host throttling and retries."""
+    return ThrottledTransport(
+        httpx.AsyncHTTPTransport(http2=True, limits=limits),
+        rate_limiter=rate_limiter,
+    )
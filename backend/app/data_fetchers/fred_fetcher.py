@@ -8,18 +8,32 @@ WHY: FRED provides the macro regime context (interest rates, credit conditions).
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from typing import Any
 
 import httpx
 
+from app.async_utils import run_sync
+from app.data_fetchers._cache import cached
+from app.data_fetchers._http import read_json, throttled_async_transport
 from app.response_utils import error_response, ok_response, round_float, structured_log
 
 logger = logging.getLogger(__name__)
 
 GATE_NAME = "Data Fetcher – FRED"
 
+# Shared across calls so keep-alive/HTTP/2 connections to FRED are reused.
+# Lives on the `run_sync` background loop.
+_CLIENT = httpx.AsyncClient(
+    timeout=10.0,
+    transport=throttled_async_transport(httpx.Limits(max_connections=16, max_keepalive_connections=8)),
+)
+
+# DFF prints daily; NFCI is a weekly series.
+_SERIES_TTL_SECONDS = {"DFF": 60 * 60, "NFCI": 6 * 60 * 60}
+
 
 def _latest_observation(series_json: dict[str, Any]) -> dict[str, Any] | None:
     observations = series_json.get("observations", [])
@@ -53,8 +67,25 @@ def _credit_stress_regime(nfci_value: float) -> str:
     return "EASY"
 
 
-def fetch_fred_data() -> dict[str, Any]:
-    """Fetch interest-rate and financial-condition data from FRED."""
+@cached(ttl=lambda params: _SERIES_TTL_SECONDS.get(params["series_id"], 60 * 60))
+async def _fetch_latest_observation(
+    client: httpx.AsyncClient,
+    base_url: str,
+    common_params: dict[str, Any],
+    series_id: str,
+) -> dict[str, Any] | None:
+    response = await client.get(base_url, params={**common_params, "series_id": series_id})
+    response.raise_for_status()
+    return _latest_observation(read_json(response))
+
+
+async def fetch_fred_data_async(force_refresh: bool = False) -> dict[str, Any]:
+    """Fetch interest-rate and financial-condition data from FRED.
+
+    DFF and NFCI are independent series, so both requests are issued
+    concurrently over the shared pooled client.  Observations are cached per series;
+    `force_refresh=True` bypasses the cache.
+    """
     inputs_used = ["DFF", "NFCI", "FRED_API_KEY"]
 
     try:
@@ -75,14 +106,11 @@ def fetch_fred_data() -> dict[str, Any]:
             "sort_order": "desc",
         }
 
-        dff_response = httpx.get(base_url, params={**common_params, "series_id": "DFF"}, timeout=10.0)
-        dff_response.raise_for_status()
-        dff_obs = _latest_observation(dff_response.json())
+        dff_obs, nfci_obs = await asyncio.gather(
+            _fetch_latest_observation(_CLIENT, base_url, common_params, "DFF", force_refresh=force_refresh),
+            _fetch_latest_observation(_CLIENT, base_url, common_params, "NFCI", force_refresh=force_refresh),
+        )
         dff_value = _to_value(dff_obs)
-
-        nfci_response = httpx.get(base_url, params={**common_params, "series_id": "NFCI"}, timeout=10.0)
-        nfci_response.raise_for_status()
-        nfci_obs = _latest_observation(nfci_response.json())
         nfci_value = _to_value(nfci_obs)
 
         if dff_value is None:
@@ -160,3 +188,8 @@ def fetch_fred_data() -> dict[str, Any]:
             message=f"FRED data fetch failed: {error}",
             inputs_used=inputs_used,
         )
+
+
+def fetch_fred_data(force_refresh: bool = False) -> dict[str, Any]:
+    """Synchronous entry point for `fetch_fred_data_async`."""
+    return run_sync(fetch_fred_data_async(force_refresh=force_refresh))
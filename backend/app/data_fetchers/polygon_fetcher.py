@@ -4,23 +4,131 @@ Fetch market data (price, volume, volatility, etc.).
 Distinguishes 'primary' (Polygon direct / Dome proxy) from 'proxy' (Stooq fallback)
 so downstream consumers know exactly what data path produced the numbers.
 """
+import asyncio
+from dataclasses import dataclass
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
 import httpx
 import os
 from datetime import date, timedelta
 import math
-import csv
 import io
 
-from app.response_utils import error_response, ok_response, round_float, structured_log
+import ijson
+import numpy as np
+import pandas as pd
+
+from app.async_utils import run_sync
+from app.data_fetchers._cache import cached, make_key, response_cache
+from app.data_fetchers._http import read_json, throttled_async_transport
+from app.response_utils import error_response, ok_response, structured_log
 
 logger = logging.getLogger(__name__)
 
 GATE_NAME = "Data Fetcher – Polygon"
+# Shared across calls so keep-alive/HTTP/2 connections to Polygon, Dome and
+# Stooq are reused.  Lives on the `run_sync` background loop; per-host caps
+# and 429/5xx retries come from the throttled transport.
+_CLIENT = httpx.AsyncClient(
+    transport=throttled_async_transport(httpx.Limits(max_connections=64, max_keepalive_connections=32)),
+)
+
+# Daily bars only change after the close, and range keys carry the end date,
+# so a day-long TTL is safe; prev close and Stooq (which backs the prev-close
+# fallback) refresh sooner.
+_PREV_CLOSE_TTL_SECONDS = 10 * 60
+_RANGE_TTL_SECONDS = 24 * 60 * 60
+_STOOQ_TTL_SECONDS = 15 * 60
+# Prediction-market prices move intraday; a minute still absorbs repeat
+# analyses of the same ticker.
+_DOME_TTL_SECONDS = 60
+
+_SQRT_252 = math.sqrt(252.0)  # trading days per year, for annualizing daily vol
+
+# Serialises SPY cache misses so concurrent tickers share one fetch.
+_SPY_CLOSES_LOCK = asyncio.Lock()
+
+# Optional sections of the payload; market_price is always fetched.
+ALL_SECTIONS = frozenset({"flow", "risk", "correlation", "dome"})
+_EMPTY_FLOW_METRICS = dict.fromkeys([
+    "last_price", "last_volume", "avg_volume", "volume_spike",
+    "volume_spike_flag", "price_direction", "flow_signal",
+])
+_EMPTY_RISK_METRICS = dict.fromkeys([
+    "volatility_daily", "volatility_annualized", "max_drawdown", "max_drawdown_window_trading_days",
+])
+
+
+# Outcome labels Dome uses for each side of a binary market.
+_OUTCOME_SIDES = {"yes": "yes", "up": "yes", "no": "no", "down": "no"}
+
+
+def _outcome_index(market: dict) -> dict[str, str]:
+    """Map "yes"/"no" to the first matching outcome token id in one pass."""
+    index: dict[str, str] = {}
+    outcomes = market.get("outcomes") or market.get("tokens") or []
+    for outcome in outcomes:
+        label = str(
+            outcome.get("name")
+            or outcome.get("label")
+            or outcome.get("outcome")
+            or ""
+        ).strip().lower()
+        side = _OUTCOME_SIDES.get(label)
+        if side is None or side in index:
+            continue
+        token_id = outcome.get("id") or outcome.get("token_id")
+        if token_id:
+            index[side] = str(token_id)
+    return index
 
 
-def _extract_yes_token_id(market: dict) -> str | None:
+@dataclass(frozen=True)
+class Bars:
+    """Daily bars as parallel read-only arrays (struct-of-arrays).
+
+    WHY: list[dict] bars cost a hash table per bar and force per-bar `.get`
+         calls in every metric; parallel arrays are built once at the fetch
+         boundary and consumed directly by NumPy.
+    """
+
+    closes: np.ndarray  # float64; NaN where the upstream bar had no close
+    volumes: np.ndarray  # float64; 0 where the upstream bar had no volume
+    dates: np.ndarray | None = None  # ISO date strings, when the source has them
+
+    def __post_init__(self) -> None:
+        # Instances are shared through the response cache.
+        for array in (self.closes, self.volumes, self.dates):
+            if array is not None:
+                array.setflags(write=False)
+
+    def __len__(self) -> int:
+        return int(self.closes.size)
+
+    @classmethod
+    def from_columns(cls, closes: list, volumes: list) -> "Bars":
+        return cls(np.array(closes, dtype=np.float64), np.array(volumes, dtype=np.float64))
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "Bars":
+        closes: list = []
+        volumes: list = []
+        _append_bars(records, closes, volumes)
+        return cls.from_columns(closes, volumes)
+
+    def valid_closes(self) -> np.ndarray:
+        """Closes with missing values dropped, for risk and correlation math."""
+        return self.closes[~np.isnan(self.closes)]
+
+
+def _append_bars(records: Iterable[dict], closes: list, volumes: list) -> None:
+    for record in records:
+        close = record.get("c")
+        closes.append(np.nan if close is None else close)
+        volumes.append(record.get("v") or 0)
+
+
+def _extract_yes_token_id(market: dict, outcome_index: dict[str, str] | None = None) -> str | None:
     selected_market = market.get("selected_market") or {}
     if selected_market.get("yes_token_id"):
         return str(selected_market["yes_token_id"])
@@ -32,23 +140,12 @@ def _extract_yes_token_id(market: dict) -> str | None:
     if side_a.get("id"):
         return str(side_a["id"])
 
-    outcomes = market.get("outcomes") or market.get("tokens") or []
-    for outcome in outcomes:
-        label = str(
-            outcome.get("name")
-            or outcome.get("label")
-            or outcome.get("outcome")
-            or ""
-        ).strip().lower()
-        if label in {"yes", "up"}:
-            token_id = outcome.get("id") or outcome.get("token_id")
-            if token_id:
-                return str(token_id)
-
-    return None
+    if outcome_index is None:
+        outcome_index = _outcome_index(market)
+    return outcome_index.get("yes")
 
 
-def _extract_no_token_id(market: dict) -> str | None:
+def _extract_no_token_id(market: dict, outcome_index: dict[str, str] | None = None) -> str | None:
     selected_market = market.get("selected_market") or {}
     if selected_market.get("no_token_id"):
         return str(selected_market["no_token_id"])
@@ -60,20 +157,32 @@ def _extract_no_token_id(market: dict) -> str | None:
     if side_b.get("id"):
         return str(side_b["id"])
 
-    outcomes = market.get("outcomes") or market.get("tokens") or []
-    for outcome in outcomes:
-        label = str(
-            outcome.get("name")
-            or outcome.get("label")
-            or outcome.get("outcome")
-            or ""
-        ).strip().lower()
-        if label in {"no", "down"}:
-            token_id = outcome.get("id") or outcome.get("token_id")
-            if token_id:
-                return str(token_id)
-
-    return None
+    if outcome_index is None:
+        outcome_index = _outcome_index(market)
+    return outcome_index.get("no")
+
+
+async def _fetch_dome_price(
+    client: httpx.AsyncClient,
+    token_id: str | None,
+    headers: dict,
+    fallback_keys: tuple[str, str],
+) -> float | None:
+    if not token_id:
+        return None
+    response = await client.get(
+        f"https://api.domeapi.io/v1/polymarket/market-price/{token_id}",
+        headers=headers,
+        timeout=15.0,
+    )
+    response.raise_for_status()
+    payload = read_json(response)
+    price = (
+        payload.get("price")
+        or payload.get(fallback_keys[0])
+        or payload.get(fallback_keys[1])
+    )
+    return float(price) if price is not None else None
 
 
 def _market_tags(market: dict) -> list[str]:
@@ -85,8 +194,10 @@ def _stooq_symbol(symbol: str) -> str:
     return f"{symbol.lower()}.us"
 
 
-def _fetch_stooq_bars(symbol: str) -> list[dict]:
-    response = httpx.get(
+@cached(ttl=_STOOQ_TTL_SECONDS)
+async def _fetch_stooq_bars(client: httpx.AsyncClient, symbol: str) -> Bars:
+    """Fetch the full Stooq daily history as date-sorted `Bars`."""
+    response = await client.get(
         "https://stooq.com/q/d/l/",
         params={"s": _stooq_symbol(symbol), "i": "d"},
         timeout=20.0,
@@ -96,58 +207,152 @@ def _fetch_stooq_bars(symbol: str) -> list[dict]:
     if not response.text.strip() or "No data" in response.text:
         raise RuntimeError(f"No Stooq data returned for symbol {symbol}")
 
-    reader = csv.DictReader(io.StringIO(response.text))
-    bars: list[dict] = []
-    for row in reader:
-        try:
-            close = float(row["Close"])
-            volume = int(float(row["Volume"])) if row.get("Volume") not in (None, "") else 0
-        except (TypeError, ValueError, KeyError):
-            continue
+    # Parsed in C rather than a per-row DictReader loop; unparseable closes
+    # are dropped and missing volumes count as 0, as before.
+    frame = pd.read_csv(
+        io.StringIO(response.text),
+        usecols=lambda column: column in {"Date", "Close", "Volume"},
+        dtype={"Date": str},
+    )
+    if "Close" not in frame.columns:
+        raise RuntimeError(f"Unable to parse Stooq bars for symbol {symbol}")
 
-        bars.append({
-            "d": row.get("Date"),
-            "c": close,
-            "v": volume,
-        })
+    frame["Close"] = pd.to_numeric(frame["Close"], errors="coerce")
+    frame = frame.dropna(subset=["Date", "Close"])
+    if not frame["Date"].is_monotonic_increasing:
+        frame = frame.sort_values("Date", kind="stable")
+    if "Volume" in frame.columns:
+        frame["Volume"] = pd.to_numeric(frame["Volume"], errors="coerce").fillna(0).astype("int64")
+    else:
+        frame["Volume"] = 0
 
-    if not bars:
+    if frame.empty:
         raise RuntimeError(f"Unable to parse Stooq bars for symbol {symbol}")
 
-    return bars
+    return Bars(
+        closes=frame["Close"].to_numpy(dtype=np.float64),
+        volumes=frame["Volume"].to_numpy(dtype=np.float64),
+        dates=frame["Date"].to_numpy(dtype=object),
+    )
+
 
+async def _stream_range_bars(response: httpx.Response) -> Bars:
+    """Decode `results` items incrementally from a streamed aggregates body.
 
-def _filter_stooq_bars(stooq_bars: list[dict], start_date: date, end_date: date) -> list[dict]:
-    results: list[dict] = []
-    for bar in stooq_bars:
-        raw_date = bar.get("d")
-        if not raw_date:
-            continue
-        try:
-            bar_date = date.fromisoformat(raw_date)
-        except ValueError:
-            continue
-        if start_date <= bar_date <= end_date:
-            results.append({"c": bar["c"], "v": bar["v"]})
+    WHY: a 1Y range is up to 5000 bars; parsing chunk by chunk avoids holding
+         the raw body and the full decoded payload at once.  Only the close
+         and volume columns are kept since nothing downstream reads the rest.
+    """
+    decoded = ijson.sendable_list()
+    parser = ijson.items_coro(decoded, "results.item", use_float=True)
+    closes: list = []
+    volumes: list = []
+    async for chunk in response.aiter_bytes():
+        parser.send(chunk)
+        _append_bars(decoded, closes, volumes)
+        del decoded[:]
+    parser.close()
+    _append_bars(decoded, closes, volumes)
+    return Bars.from_columns(closes, volumes)
+
+
+def _filter_stooq_bars(stooq_bars: Bars, start_date: date, end_date: date) -> Bars:
+    # Dates are ISO-8601 strings kept in ascending order, so the window is a
+    # binary-search slice with no per-row date parsing or full-length mask.
+    lo = int(np.searchsorted(stooq_bars.dates, start_date.isoformat(), side="left"))
+    hi = int(np.searchsorted(stooq_bars.dates, end_date.isoformat(), side="right"))
+    return Bars(
+        closes=stooq_bars.closes[lo:hi],
+        volumes=stooq_bars.volumes[lo:hi],
+        dates=stooq_bars.dates[lo:hi],
+    )
 
-    return results
 
+@cached(ttl=_PREV_CLOSE_TTL_SECONDS)
+async def _get_prev_close(
+    client: httpx.AsyncClient,
+    symbol: str,
+    api_key: str | None,
+    dome_key: str | None,
+    dome_polygon_base: str,
+) -> tuple[Bars, str]:
+    dome_error = None
+    if dome_key:
+        dome_headers = {"Authorization": f"Bearer {dome_key}"}
+        dome_url = f"{dome_polygon_base}/aggs/ticker/{symbol}/prev"
+        response = await client.get(dome_url, headers=dome_headers, timeout=15.0)
+        if response.status_code < 400:
+            return Bars.from_records(read_json(response).get("results") or []), "DOME_POLYGON_PROXY"
+        dome_error = f"Dome prev-close route failed ({response.status_code}): {dome_url}"
+
+    if api_key:
+        direct_url = f"https://api.polygon.io/v2/aggs/ticker/{symbol}/prev"
+        response = await client.get(direct_url, params={"apiKey": api_key}, timeout=15.0)
+        response.raise_for_status()
+        return Bars.from_records(read_json(response).get("results") or []), "POLYGON_DIRECT"
+
+    stooq_bars = await _fetch_stooq_bars(client, symbol)
+    return Bars.from_columns([stooq_bars.closes[-1]], [0]), "STOOQ_FALLBACK"
+
+
+@cached(ttl=_RANGE_TTL_SECONDS)
+async def _get_range(
+    client: httpx.AsyncClient,
+    symbol: str,
+    start_date: date,
+    end_date: date,
+    limit: int,
+    api_key: str | None,
+    dome_key: str | None,
+    dome_polygon_base: str,
+) -> tuple[Bars, str]:
+    dome_error = None
+    if dome_key:
+        dome_headers = {"Authorization": f"Bearer {dome_key}"}
+        dome_url = (
+            f"{dome_polygon_base}/aggs/ticker/{symbol}/range/1/day/"
+            f"{start_date.isoformat()}/{end_date.isoformat()}"
+        )
+        async with client.stream(
+            "GET",
+            dome_url,
+            headers=dome_headers,
+            params={"adjusted": "true", "sort": "asc", "limit": limit},
+            timeout=25.0,
+        ) as response:
+            if response.status_code < 400:
+                return await _stream_range_bars(response), "DOME_POLYGON_PROXY"
+        dome_error = f"Dome range route failed ({response.status_code}): {dome_url}"
+
+    if api_key:
+        direct_url = (
+            f"https://api.polygon.io/v2/aggs/ticker/{symbol}/range/1/day/"
+            f"{start_date.isoformat()}/{end_date.isoformat()}"
+        )
+        async with client.stream(
+            "GET",
+            direct_url,
+            params={"adjusted": "true", "sort": "asc", "limit": limit, "apiKey": api_key},
+            timeout=25.0,
+        ) as response:
+            response.raise_for_status()
+            return await _stream_range_bars(response), "POLYGON_DIRECT"
 
-def _compute_flow_metrics(bars: list[dict]) -> Dict[str, Any]:
+    stooq_bars = await _fetch_stooq_bars(client, symbol)
+    return _filter_stooq_bars(stooq_bars, start_date, end_date), "STOOQ_FALLBACK"
+
+
+def _compute_flow_metrics(bars: Bars) -> Dict[str, Any]:
     if len(bars) < 3:
         raise ValueError("Need at least 3 bars to compute flow signal")
 
-    last = bars[-1]
-    prev = bars[-2]
-    base_bars = bars[:-1]
-
-    avg_volume = sum(bar.get("v", 0) for bar in base_bars) / len(base_bars)
-    last_volume = last.get("v", 0)
+    avg_volume = float(bars.volumes[:-1].mean())
+    last_volume = float(bars.volumes[-1])
     volume_ratio = (last_volume / avg_volume) if avg_volume else 0
     volume_spike = last_volume > (avg_volume * 1.5) if avg_volume else False
 
-    last_close = last.get("c")
-    prev_close = prev.get("c")
+    last_close = float(bars.closes[-1])
+    prev_close = float(bars.closes[-2])
 
     price_up = last_close > prev_close
     price_down = last_close < prev_close
@@ -160,7 +365,7 @@ def _compute_flow_metrics(bars: list[dict]) -> Dict[str, Any]:
         flow_signal = "NEGATIVE"
 
     return {
-        "last_price": float(last_close),
+        "last_price": last_close,
         "last_volume": int(last_volume),
         "avg_volume": int(avg_volume),
         "volume_spike": float(volume_ratio),
@@ -170,76 +375,181 @@ def _compute_flow_metrics(bars: list[dict]) -> Dict[str, Any]:
     }
 
 
-def _compute_risk_metrics(bars: list[dict]) -> Dict[str, Any]:
-    if len(bars) < 30:
-        raise ValueError("Not enough price history to compute volatility and drawdown")
+async def _get_spy_closes(
+    client: httpx.AsyncClient,
+    start_date: date,
+    end_date: date,
+    force_refresh: bool = False,
+    **credentials: Any,
+) -> tuple[np.ndarray, str]:
+    """SPY closes for the benchmark window, parsed once and shared by every ticker.
 
-    closes = [bar.get("c") for bar in bars if bar.get("c") is not None]
-    if len(closes) < 30:
+    WHY: the benchmark series is identical for all tickers on a given day, so
+         the parsed array (not just the raw bars) is cached process-wide.
+    """
+    key = make_key("spy_closes", start_date, end_date, sorted(credentials.items()))
+    async with _SPY_CLOSES_LOCK:
+        entry = None if force_refresh else response_cache.get(key)
+        if entry is None:
+            # Bypass the bar-level cache; only the array is worth keeping.
+            spy_bars, spy_source = await _get_range.__wrapped__(
+                client, "SPY", start_date, end_date, 5000, **credentials
+            )
+            entry = (spy_bars.valid_closes(), spy_source)
+            response_cache.set(key, entry, _RANGE_TTL_SECONDS)
+    return entry
+
+
+def _compute_risk_metrics(closes: np.ndarray) -> Dict[str, Any]:
+    if closes.size < 30:
         raise ValueError("Not enough valid closing prices")
 
-    returns = []
-    for idx in range(1, len(closes)):
-        prev = closes[idx - 1]
-        curr = closes[idx]
-        if prev == 0:
-            continue
-        returns.append((curr - prev) / prev)
+    prev = closes[:-1]
+    valid = prev != 0
+    returns = np.diff(closes)[valid] / prev[valid]
 
-    if len(returns) < 10:
+    if returns.size < 10:
         raise ValueError("Not enough return points for volatility")
 
-    mean_return = sum(returns) / len(returns)
-    variance = sum((value - mean_return) ** 2 for value in returns) / len(returns)
-    volatility_daily = math.sqrt(variance)
-    volatility_annualized = volatility_daily * math.sqrt(252)
+    volatility_daily = float(returns.std())
+    volatility_annualized = volatility_daily * _SQRT_252
 
-    peak = closes[0]
-    max_drawdown = 0.0
-    for close in closes:
-        if close > peak:
-            peak = close
-        if peak > 0:
-            drawdown = (peak - close) / peak
-            max_drawdown = max(max_drawdown, drawdown)
+    # Branchless: non-positive peaks contribute 0 instead of being masked out.
+    peaks = np.maximum.accumulate(closes)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdowns = np.where(peaks > 0, 1.0 - closes / peaks, 0.0)
+    max_drawdown = max(0.0, float(drawdowns.max()))
 
     return {
-        "volatility_daily": float(volatility_daily),
-        "volatility_annualized": float(volatility_annualized),
+        "volatility_daily": volatility_daily,
+        "volatility_annualized": volatility_annualized,
         "max_drawdown": float(max_drawdown),
-        "max_drawdown_window_trading_days": len(closes),
+        "max_drawdown_window_trading_days": int(closes.size),
     }
 
 
-def _correlation_index(series_a: list[float], series_b: list[float]) -> tuple[float, int, bool]:
+def _correlation_index(series_a: np.ndarray, series_b: np.ndarray) -> tuple[float, int, bool]:
     n = min(len(series_a), len(series_b))
     if n < 30:
         return 0.65, n, True
 
-    a = series_a[-n:]
-    b = series_b[-n:]
-
-    mean_a = sum(a) / n
-    mean_b = sum(b) / n
+    a = np.asarray(series_a[-n:], dtype=np.float64)
+    b = np.asarray(series_b[-n:], dtype=np.float64)
 
-    cov = sum((x - mean_a) * (y - mean_b) for x, y in zip(a, b)) / n
-    var_a = sum((x - mean_a) ** 2 for x in a) / n
-    var_b = sum((y - mean_b) ** 2 for y in b) / n
-
-    if var_a == 0 or var_b == 0:
+    # Zero variance on either side makes corrcoef NaN — keep the fallback.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = float(np.corrcoef(a, b)[0, 1])
+    if np.isnan(corr):
         return 0.65, n, True
 
-    corr = cov / math.sqrt(var_a * var_b)
     corr = max(-1.0, min(1.0, corr))
     return abs(float(corr)), n, False
 
 
-def fetch_polygon_data(ticker: str) -> Dict[str, Any]:
+_NO_DOME_SIGNAL = {
+    "yes_price": None,
+    "no_price": None,
+    "macro_signal": "NEUTRAL",
+    "auxiliary_signal_type": None,
+    "auxiliary_signal_source": None,
+    "auxiliary_signal_sentiment": None,
+}
+
+
+@cached(ttl=_DOME_TTL_SECONDS, ignore=("client", "dome_key"))
+async def _fetch_dome_signal(client: httpx.AsyncClient, ticker: str, dome_key: str) -> Dict[str, Any]:
+    """Dome Polymarket auxiliary signal (optional; uses Dome Polymarket routes)."""
+    dome_headers = {"Authorization": f"Bearer {dome_key}"}
+    market_resp = await client.get(
+        "https://api.domeapi.io/v1/polymarket/markets",
+        params={"limit": 10, "search": ticker, "status": "open"},
+        headers=dome_headers,
+        timeout=15.0,
+    )
+    market_resp.raise_for_status()
+    market_payload = read_json(market_resp)
+    markets = market_payload.get("markets") or market_payload.get("data") or []
+
+    filtered = []
+    for market in markets:
+        tags = _market_tags(market)
+        if "up or down" in tags and any(tag in tags for tag in ["stocks", "equities", "finance"]):
+            filtered.append(market)
+
+    if filtered:
+        filtered.sort(key=lambda market: market.get("volume_total", 0), reverse=True)
+        selected = filtered[0]
+    elif markets:
+        selected = markets[0]
+    else:
+        selected = None
+
+    if not selected:
+        return _NO_DOME_SIGNAL
+
+    outcome_index = _outcome_index(selected)
+    yes_token_id = _extract_yes_token_id(selected, outcome_index)
+    no_token_id = _extract_no_token_id(selected, outcome_index)
+
+    # YES and NO lookups are independent — overlap the round trips.
+    # Either failure still fails the fetch, as the sequential path did.
+    price_results = await asyncio.gather(
+        _fetch_dome_price(client, yes_token_id, dome_headers, ("yes_price", "yesPrice")),
+        _fetch_dome_price(client, no_token_id, dome_headers, ("no_price", "noPrice")),
+        return_exceptions=True,
+    )
+    for price_result in price_results:
+        if isinstance(price_result, BaseException):
+            raise price_result
+    yes_price, no_price = price_results
+
+    macro_signal = "NEUTRAL"
+    dome_sentiment = "NEUTRAL"
+    if yes_price is not None and no_price is not None:
+        if yes_price > no_price:
+            dome_sentiment = "BULLISH"
+            macro_signal = "SUPPORTIVE"
+        elif yes_price < no_price:
+            dome_sentiment = "BEARISH"
+            macro_signal = "HOSTILE"
+
+    return {
+        "yes_price": yes_price,
+        "no_price": no_price,
+        "macro_signal": macro_signal,
+        "auxiliary_signal_type": "AUXILIARY_SIGNAL",
+        "auxiliary_signal_source": "DOME_POLYMARKET",
+        "auxiliary_signal_sentiment": dome_sentiment,
+    }
+
+
+def _finalize_metrics(values: Dict[str, float | None], digits: int) -> Dict[str, float | None]:
+    """Round a group of scalar metrics with one vectorized call; None passes through."""
+    keys = [key for key, value in values.items() if value is not None]
+    rounded = np.round(np.array([float(values[key]) for key in keys], dtype=np.float64), digits)
+    finalized: Dict[str, float | None] = dict.fromkeys(values)
+    finalized.update(zip(keys, rounded.tolist()))
+    return finalized
+
+
+async def fetch_polygon_data_async(
+    ticker: str,
+    force_refresh: bool = False,
+    *,
+    include: Iterable[str] = ALL_SECTIONS,
+) -> Dict[str, Any]:
     """
     Fetch market data from Polygon.io
+
+    The prev-close, flow-window, 1Y history and SPY benchmark requests are
+    independent, so they are issued concurrently over the shared pooled client.
     
     Args:
         ticker: Stock ticker symbol
+        force_refresh: Bypass the shared response cache
+        include: Sections to compute, any of "flow", "risk", "correlation",
+            "dome".  Skipped sections issue no HTTP calls and their fields
+            come back as None.
         
     Returns:
         {
@@ -261,7 +571,20 @@ def fetch_polygon_data(ticker: str) -> Dict[str, Any]:
             "reason": str (if ERROR)
         }
     """
+    return await _fetch_polygon_data(_CLIENT, ticker, force_refresh, frozenset(include))
+
+
+async def _fetch_polygon_data(
+    client: httpx.AsyncClient,
+    ticker: str,
+    force_refresh: bool = False,
+    include: frozenset[str] = ALL_SECTIONS,
+) -> Dict[str, Any]:
     try:
+        unknown_sections = include - ALL_SECTIONS
+        if unknown_sections:
+            raise ValueError(f"Unknown Polygon sections requested: {', '.join(sorted(unknown_sections))}")
+
         api_key = os.getenv("POLYGON_API_KEY")
         dome_key = os.getenv("DOME_API_KEY")
         dome_polygon_base = os.getenv("DOME_POLYGON_BASE_URL", "https://api.domeapi.io/v1/polygon").rstrip("/")
@@ -282,63 +605,48 @@ def fetch_polygon_data(ticker: str) -> Dict[str, Any]:
                 inputs_used=inputs_used,
             )
 
-        def get_prev_close(symbol: str) -> tuple[dict, str]:
-            dome_error = None
-            if dome_key:
-                dome_headers = {"Authorization": f"Bearer {dome_key}"}
-                dome_url = f"{dome_polygon_base}/aggs/ticker/{symbol}/prev"
-                response = httpx.get(dome_url, headers=dome_headers, timeout=15.0)
-                if response.status_code < 400:
-                    return response.json(), "DOME_POLYGON_PROXY"
-                dome_error = f"Dome prev-close route failed ({response.status_code}): {dome_url}"
-
-            if api_key:
-                direct_url = f"https://api.polygon.io/v2/aggs/ticker/{symbol}/prev"
-                response = httpx.get(direct_url, params={"apiKey": api_key}, timeout=15.0)
-                response.raise_for_status()
-                return response.json(), "POLYGON_DIRECT"
-
-            stooq_bars = _fetch_stooq_bars(symbol)
-            return {"results": [{"c": float(stooq_bars[-1]["c"])}]}, "STOOQ_FALLBACK"
-
-        def get_range(symbol: str, start_date: date, end_date: date, limit: int = 5000) -> tuple[dict, str]:
-            dome_error = None
-            if dome_key:
-                dome_headers = {"Authorization": f"Bearer {dome_key}"}
-                dome_url = (
-                    f"{dome_polygon_base}/aggs/ticker/{symbol}/range/1/day/"
-                    f"{start_date.isoformat()}/{end_date.isoformat()}"
-                )
-                response = httpx.get(
-                    dome_url,
-                    headers=dome_headers,
-                    params={"adjusted": "true", "sort": "asc", "limit": limit},
-                    timeout=25.0,
-                )
-                if response.status_code < 400:
-                    return response.json(), "DOME_POLYGON_PROXY"
-                dome_error = f"Dome range route failed ({response.status_code}): {dome_url}"
-
-            if api_key:
-                direct_url = (
-                    f"https://api.polygon.io/v2/aggs/ticker/{symbol}/range/1/day/"
-                    f"{start_date.isoformat()}/{end_date.isoformat()}"
-                )
-                response = httpx.get(
-                    direct_url,
-                    params={"adjusted": "true", "sort": "asc", "limit": limit, "apiKey": api_key},
-                    timeout=25.0,
-                )
-                response.raise_for_status()
-                return response.json(), "POLYGON_DIRECT"
-
-            stooq_bars = _fetch_stooq_bars(symbol)
-            return {"results": _filter_stooq_bars(stooq_bars, start_date, end_date)}, "STOOQ_FALLBACK"
+        credentials = {"api_key": api_key, "dome_key": dome_key, "dome_polygon_base": dome_polygon_base}
+
+        def get_prev_close(symbol: str):
+            return _get_prev_close(client, symbol, **credentials, force_refresh=force_refresh)
+
+        def get_range(symbol: str, start_date: date, end_date: date, limit: int = 5000):
+            return _get_range(client, symbol, start_date, end_date, limit, **credentials, force_refresh=force_refresh)
+
+        # Last ~10 trading days for flow signal; 1Y history for volatility,
+        # max drawdown and SPY correlation (n8n parity)
+        end_flow = date.today()
+        start_flow = end_flow - timedelta(days=20)
+        end_hist = date.today()
+        start_hist = end_hist - timedelta(days=380)
+
+        # Only the requests the selected sections need are issued; the kept
+        # subset still runs concurrently.
+        need_history = "risk" in include or "correlation" in include
+        requests = {"prev": get_prev_close(ticker)}
+        if "flow" in include:
+            requests["flow"] = get_range(ticker, start_flow, end_flow, limit=500)
+        if need_history:
+            requests["hist"] = get_range(ticker, start_hist, end_hist, limit=5000)
+        if "correlation" in include:
+            requests["spy"] = _get_spy_closes(
+                client, start_hist, end_hist, force_refresh=force_refresh, **credentials
+            )
+        if dome_key and "dome" in include:
+            # Depends only on the ticker, so it overlaps the Polygon downloads
+            # rather than adding its round trips after them.
+            requests["dome"] = _fetch_dome_signal(client, ticker, dome_key, force_refresh=force_refresh)
+        responses = dict(zip(requests, await asyncio.gather(*requests.values())))
+        prev_bars, prev_source = responses["prev"]
+        flow_bars, flow_source = responses.get("flow", (None, None))
+        hist_bars, hist_source = responses.get("hist", (None, None))
+        closes_spy, spy_source = responses.get("spy", (None, None))
+        dome_signal = responses.get("dome", _NO_DOME_SIGNAL)
 
         # Market price from previous aggregate (n8n parity)
-        prev_json, prev_source = get_prev_close(ticker)
-        prev_result = (prev_json.get("results") or [{}])[0]
-        market_price = prev_result.get("c")
+        market_price = None
+        if len(prev_bars) and not np.isnan(prev_bars.closes[0]):
+            market_price = float(prev_bars.closes[0])
         if market_price is None:
             return error_response(
                 gate=GATE_NAME,
@@ -347,109 +655,29 @@ def fetch_polygon_data(ticker: str) -> Dict[str, Any]:
                 inputs_used=inputs_used,
             )
 
-        # Last ~10 trading days for flow signal
-        end_flow = date.today()
-        start_flow = end_flow - timedelta(days=20)
-        flow_json, flow_source = get_range(ticker, start_flow, end_flow, limit=500)
-        flow_bars = flow_json.get("results", [])
-        flow_metrics = _compute_flow_metrics(flow_bars)
+        flow_metrics = _EMPTY_FLOW_METRICS
+        if flow_bars is not None:
+            flow_metrics = _compute_flow_metrics(flow_bars)
 
-        # 1Y history for volatility and max drawdown (n8n parity)
-        end_hist = date.today()
-        start_hist = end_hist - timedelta(days=380)
-        hist_json, hist_source = get_range(ticker, start_hist, end_hist, limit=5000)
-        hist_bars = hist_json.get("results", [])
-        risk_metrics = _compute_risk_metrics(hist_bars)
+        risk_metrics = _EMPTY_RISK_METRICS
+        if hist_bars is not None:
+            if len(hist_bars) < 30:
+                raise ValueError("Not enough price history to compute volatility and drawdown")
+            closes_ticker = hist_bars.valid_closes()
+            if "risk" in include:
+                risk_metrics = _compute_risk_metrics(closes_ticker)
 
         # Correlation index vs SPY (required by Gate 5 contract)
-        spy_json, spy_source = get_range("SPY", start_hist, end_hist, limit=5000)
-        spy_bars = spy_json.get("results", [])
-
-        closes_ticker = [bar.get("c") for bar in hist_bars if bar.get("c") is not None]
-        closes_spy = [bar.get("c") for bar in spy_bars if bar.get("c") is not None]
-        correlation_index, correlation_window, correlation_fallback_used = _correlation_index(closes_ticker, closes_spy)
-
-        # Dome signal (optional; uses Dome Polymarket routes)
-        yes_price = None
-        no_price = None
-        macro_signal = "NEUTRAL"
-        auxiliary_signal_type = None
-        auxiliary_signal_source = None
-        dome_sentiment = None
-        if dome_key:
-            dome_headers = {"Authorization": f"Bearer {dome_key}"}
-            market_resp = httpx.get(
-                "https://api.domeapi.io/v1/polymarket/markets",
-                params={"limit": 10, "search": ticker, "status": "open"},
-                headers=dome_headers,
-                timeout=15.0,
-            )
-            market_resp.raise_for_status()
-            market_payload = market_resp.json()
-            markets = market_payload.get("markets") or market_payload.get("data") or []
-
-            filtered = []
-            for market in markets:
-                tags = _market_tags(market)
-                if "up or down" in tags and any(tag in tags for tag in ["stocks", "equities", "finance"]):
-                    filtered.append(market)
-
-            if filtered:
-                filtered.sort(key=lambda market: market.get("volume_total", 0), reverse=True)
-                selected = filtered[0]
-            elif markets:
-                selected = markets[0]
-            else:
-                selected = None
-
-            if selected:
-                yes_token_id = _extract_yes_token_id(selected)
-                no_token_id = _extract_no_token_id(selected)
-
-                if yes_token_id:
-                    price_resp = httpx.get(
-                        f"https://api.domeapi.io/v1/polymarket/market-price/{yes_token_id}",
-                        headers=dome_headers,
-                        timeout=15.0,
-                    )
-                    price_resp.raise_for_status()
-                    price_payload = price_resp.json()
-                    yes_price = (
-                        price_payload.get("price")
-                        or price_payload.get("yes_price")
-                        or price_payload.get("yesPrice")
-                    )
-                    if yes_price is not None:
-                        yes_price = float(yes_price)
-                if no_token_id:
-                    no_resp = httpx.get(
-                        f"https://api.domeapi.io/v1/polymarket/market-price/{no_token_id}",
-                        headers=dome_headers,
-                        timeout=15.0,
-                    )
-                    no_resp.raise_for_status()
-                    no_payload = no_resp.json()
-                    no_price = (
-                        no_payload.get("price")
-                        or no_payload.get("no_price")
-                        or no_payload.get("noPrice")
-                    )
-                    if no_price is not None:
-                        no_price = float(no_price)
-
-                auxiliary_signal_type = "AUXILIARY_SIGNAL"
-                auxiliary_signal_source = "DOME_POLYMARKET"
-                if yes_price is not None and no_price is not None:
-                    if yes_price > no_price:
-                        dome_sentiment = "BULLISH"
-                        macro_signal = "SUPPORTIVE"
-                    elif yes_price < no_price:
-                        dome_sentiment = "BEARISH"
-                        macro_signal = "HOSTILE"
-                    else:
-                        dome_sentiment = "NEUTRAL"
-                else:
-                    dome_sentiment = "NEUTRAL"
+        correlation_index, correlation_window, correlation_fallback_used = None, None, False
+        if closes_spy is not None:
+            correlation_index, correlation_window, correlation_fallback_used = _correlation_index(closes_ticker, closes_spy)
+
+        yes_price = dome_signal["yes_price"]
+        no_price = dome_signal["no_price"]
+        macro_signal = dome_signal["macro_signal"]
+        auxiliary_signal_type = dome_signal["auxiliary_signal_type"]
+        auxiliary_signal_source = dome_signal["auxiliary_signal_source"]
+        dome_sentiment = dome_signal["auxiliary_signal_sentiment"]
 
         # WHY: top-level price_source lets downstream consumers / UI know exactly
         # which data path was used for the equity price.
@@ -458,40 +686,60 @@ def fetch_polygon_data(ticker: str) -> Dict[str, Any]:
         # Distinguish primary vs proxy data for auditability
         data_source_type = "PROXY" if "STOOQ" in prev_source else "PRIMARY"
 
+        rounded_4 = _finalize_metrics(
+            {
+                "market_price": market_price,
+                "last_price": flow_metrics["last_price"],
+                "correlation_index": correlation_index,
+            },
+            4,
+        )
+        rounded_6 = _finalize_metrics(
+            {
+                "volume_spike": flow_metrics["volume_spike"],
+                "volatility_daily": risk_metrics["volatility_daily"],
+                "volatility_annualized": risk_metrics["volatility_annualized"],
+                "max_drawdown": risk_metrics["max_drawdown"],
+                "yes_price": yes_price,
+                "no_price": no_price,
+            },
+            6,
+        )
+
         data = {
-            "market_price": round_float(float(market_price), 4),
+            "market_price": rounded_4["market_price"],
             "price_source": price_source,
             "data_source_type": data_source_type,
-            "last_price": round_float(flow_metrics["last_price"], 4),
+            "last_price": rounded_4["last_price"],
             "last_volume": flow_metrics["last_volume"],
             "avg_volume": flow_metrics["avg_volume"],
-            "volume_spike": round_float(flow_metrics["volume_spike"], 6),
+            "volume_spike": rounded_6["volume_spike"],
             "volume_spike_flag": flow_metrics["volume_spike_flag"],
             "price_direction": flow_metrics["price_direction"],
             "flow_signal": flow_metrics["flow_signal"],
             "flow_metrics_raw": {
-                "last_price": round_float(flow_metrics["last_price"], 4),
+                "last_price": rounded_4["last_price"],
                 "last_volume": flow_metrics["last_volume"],
                 "avg_volume": flow_metrics["avg_volume"],
-                "volume_spike_ratio": round_float(flow_metrics["volume_spike"], 6),
+                "volume_spike_ratio": rounded_6["volume_spike"],
             },
             "flow_flags": {
                 "volume_spike_flag": flow_metrics["volume_spike_flag"],
                 "price_direction": flow_metrics["price_direction"],
                 "flow_signal": flow_metrics["flow_signal"],
             },
-            "volatility": round_float(risk_metrics["volatility_annualized"], 6),
-            "volatility_daily": round_float(risk_metrics["volatility_daily"], 6),
-            "volatility_annualized": round_float(risk_metrics["volatility_annualized"], 6),
+            "volatility": rounded_6["volatility_annualized"],
+            "volatility_daily": rounded_6["volatility_daily"],
+            "volatility_annualized": rounded_6["volatility_annualized"],
             "volatility_basis": "annualized_from_daily_stddev_252",
-            "max_drawdown": round_float(risk_metrics["max_drawdown"], 6),
+            "max_drawdown": rounded_6["max_drawdown"],
             "max_drawdown_window_trading_days": risk_metrics["max_drawdown_window_trading_days"],
-            "correlation_index": round_float(correlation_index, 4),
+            "correlation_index": rounded_4["correlation_index"],
             "correlation_benchmark": "SPY",
             "correlation_window_trading_days": correlation_window,
             "correlation_fallback_used": correlation_fallback_used,
-            "yes_price": round_float(float(yes_price), 6) if yes_price is not None else None,
-            "no_price": round_float(float(no_price), 6) if no_price is not None else None,
+            "yes_price": rounded_6["yes_price"],
+            "no_price": rounded_6["no_price"],
             "auxiliary_signal_type": auxiliary_signal_type,
             "auxiliary_signal_source": auxiliary_signal_source,
             "auxiliary_signal_sentiment": dome_sentiment,
@@ -532,10 +780,9 @@ def fetch_polygon_data(ticker: str) -> Dict[str, Any]:
         poly_confidence = 90 if is_primary else 70
         if correlation_fallback_used:
             poly_confidence -= 10
-        poly_one_liner = (
-            f"Market data loaded for {ticker} via {price_source} — "
-            f"price ${data['market_price']}, vol {data['volatility']:.2%}"
-        )
+        poly_one_liner = f"Market data loaded for {ticker} via {price_source} — price ${data['market_price']}"
+        if data["volatility"] is not None:
+            poly_one_liner += f", vol {data['volatility']:.2%}"
 
         return ok_response(
             gate=GATE_NAME,
@@ -562,3 +809,13 @@ def fetch_polygon_data(ticker: str) -> Dict[str, Any]:
             message=f"Polygon data fetch failed: {error}",
             inputs_used=["ticker"],
         )
+
+
+def fetch_polygon_data(
+    ticker: str,
+    force_refresh: bool = False,
+    *,
+    include: Iterable[str] = ALL_SECTIONS,
+) -> Dict[str, Any]:
+    """Synchronous entry point for `fetch_polygon_data_async`."""
+    return run_sync(fetch_polygon_data_async(ticker, force_refresh=force_refresh, include=include))
@@ -8,49 +8,251 @@ WHY: SEC is the authoritative source for fundamental data.  Missing fields
 
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+import atexit
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import functools
+import hashlib
 import logging
 import os
 import re
-from typing import Any
+import tempfile
+import threading
+from typing import Any, Iterable
 
 import httpx
+import numpy as np
+import orjson
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # regex fallback in _strip_html
+    HTMLParser = None
+
+from app.async_utils import run_sync
+from app.data_fetchers._cache import cached
+from app.data_fetchers._http import AsyncTokenBucket, read_json, throttled_async_transport
 from app.response_utils import error_response, ok_response, round_float, structured_log
 
 logger = logging.getLogger(__name__)
 
 GATE_NAME = "Data Fetcher – SEC"
+
+# Shared across calls so keep-alive/HTTP/2 connections to data.sec.gov and
+# www.sec.gov are reused.  Built lazily so SEC_USER_AGENT is read after .env
+# has been loaded.  Requests run on the `run_sync` background loop and go
+# through the throttled transport, which caps in-flight requests per SEC host
+# and paces them under the published rate limit.
+_CLIENT: httpx.AsyncClient | None = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _sec_client() -> httpx.AsyncClient:
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = httpx.AsyncClient(
+                headers={"User-Agent": os.getenv("SEC_USER_AGENT", "Mizan mizan@example.com")},
+                timeout=httpx.Timeout(15.0, read=30.0),
+                transport=throttled_async_transport(
+                    httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                    # SEC allows 10 req/s per client across its hosts; keep headroom.
+                    rate_limiter=AsyncTokenBucket(rate=8.0, capacity=8.0),
+                ),
+            )
+            atexit.register(_close_client)
+    return _CLIENT
+
+
+def _close_client() -> None:
+    if _CLIENT is None or _CLIENT.is_closed:
+        return
+    try:
+        run_sync(_CLIENT.aclose())
+    except Exception:
+        pass  # interpreter shutdown; the sockets are going away regardless
+
+
+def _cache_dir() -> str:
+    return os.path.expanduser(os.getenv("MIZAN_SEC_CACHE", "~/.cache/mizan-sec"))
+
+
+def _cache_paths(url: str) -> tuple[str, str]:
+    base = os.path.join(_cache_dir(), hashlib.sha1(url.encode("utf-8")).hexdigest())
+    return f"{base}.body", f"{base}.meta"
+
+
+def _write_atomic(path: str, content: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _store_cached(url: str, response: httpx.Response, content: bytes, **extra: Any) -> None:
+    body_path, meta_path = _cache_paths(url)
+    try:
+        os.makedirs(_cache_dir(), exist_ok=True)
+        _write_atomic(body_path, content)
+        _write_atomic(meta_path, orjson.dumps({
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_type": response.headers.get("Content-Type"),
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            **extra,
+        }))
+    except OSError as error:
+        structured_log(logger, "warning", "sec_cache_write_failed", gate=GATE_NAME, url=url, error=str(error))
+
+
+async def _cached_get(url: str) -> httpx.Response:
+    """GET through an on-disk conditional-request cache.
+
+    WHY: companyfacts/submissions JSON is multi-MB and changes at most daily.
+         Revalidating with If-None-Match / If-Modified-Since turns repeat
+         lookups into a 304 plus a local read.
+    Cache I/O failures fall back to a plain GET.
+    """
+    client = _sec_client()
+    body_path, meta_path = _cache_paths(url)
+
+    meta: dict[str, Any] | None = None
+    try:
+        with open(meta_path, "rb") as handle:
+            meta = orjson.loads(handle.read())
+    except (OSError, ValueError):
+        meta = None
+
+    def cached_response(request: httpx.Request) -> httpx.Response:
+        with open(body_path, "rb") as handle:
+            content = handle.read()
+        headers = {"Content-Type": meta["content_type"]} if meta.get("content_type") else {}
+        return httpx.Response(200, content=content, headers=headers, request=request)
+
+    headers: dict[str, str] = {}
+    if meta is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = await client.get(url, headers=headers)
+    if response.status_code == 304 and meta is not None:
+        try:
+            return cached_response(response.request)
+        except OSError:
+            response = await client.get(url)
+
+    if response.status_code == 200:
+        _store_cached(url, response, response.content)
+    return response
+
+
+async def _sec_get_json(url: str, *, missing_ok: bool = False) -> Any:
+    """GET a data.sec.gov JSON document through the disk cache and decode it.
+
+    Returns None for a 404 when `missing_ok`; other HTTP errors raise.
+    """
+    response = await _cached_get(url)
+    if missing_ok and response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return read_json(response)
+
+
+# Gate 1 only reads Item 1 / Item 1A, which end where Item 2 begins.
+FILING_TEXT_MAX_BYTES = 500_000
+_ITEM2_PATTERN = re.compile(rb"Item\s*2[.\s]*(?:-|\xe2\x80[\x93\x94])?\s*Properties", re.IGNORECASE)
+_ITEM2_OVERLAP_BYTES = 256  # re-scan this much of the previous chunk so split matches are found
+
+
+async def _fetch_filing_document(url: str) -> str:
+    """Download a filing document only as far as Gate 1 needs it.
+
+    WHY: the previous 500 KB buffered GET pulled (and later stripped) whole
+         10-Ks even when Business and Risk Factors end far earlier.  The body
+         is streamed and the download stops at the first "Item 2 Properties"
+         or at the size cap; a Range header asks the server for no more than
+         the cap in the first place (206, or 200 if Range is ignored).
+         Archive documents are immutable, so the prefix is cached on disk and
+         served without a request next time.
+    """
+    body_path, _ = _cache_paths(url)
+    try:
+        with open(body_path, "rb") as handle:
+            content = handle.read(FILING_TEXT_MAX_BYTES)
+    except OSError:
+        buffer = bytearray()
+        truncated = False
+        headers = {"Range": f"bytes=0-{FILING_TEXT_MAX_BYTES - 1}"}
+        async with _sec_client().stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(65536):
+                scan_from = max(0, len(buffer) - _ITEM2_OVERLAP_BYTES)
+                buffer += chunk
+                if len(buffer) >= FILING_TEXT_MAX_BYTES or _ITEM2_PATTERN.search(buffer, scan_from):
+                    truncated = True
+                    break
+        content = bytes(buffer[:FILING_TEXT_MAX_BYTES])
+        _store_cached(url, response, content, truncated=truncated)
+    return content.decode("utf-8", errors="replace")
+
+
 ANNUAL_FORMS = {"10-K", "20-F", "40-F"}
 QUARTERLY_FORMS = {"10-Q"}
 
+# Concept fallback orders, declared once instead of as per-call list literals.
+OPERATING_CASHFLOW_CONCEPTS = ("NetCashProvidedByUsedInOperatingActivities",)
+CAPEX_CONCEPTS = ("PaymentsToAcquirePropertyPlantAndEquipment",)
+CASH_CONCEPTS = ("CashAndCashEquivalentsAtCarryingValue",)
+LONG_TERM_DEBT_CONCEPTS = (
+    "LongTermDebt",
+    "LongTermDebtNoncurrent",
+    "LongTermDebtAndCapitalLeaseObligations",
+)
+CURRENT_DEBT_CONCEPTS = ("DebtCurrent", "ShortTermDebt", "ShortTermBorrowings", "CommercialPaper")
+OPERATING_INCOME_CONCEPTS = ("OperatingIncomeLoss",)
+
 # Interest expense fallback order for impairment gate safety.
-INTEREST_EXPENSE_CONCEPTS = [
+INTEREST_EXPENSE_CONCEPTS = (
     "InterestExpense",
     "InterestExpenseNet",
     "InterestAndDebtExpense",
-]
+)
 
 # Expanded alternate tags for shares outstanding — ordered by reliability
-SHARES_OUTSTANDING_DEI_CONCEPTS = [
+SHARES_OUTSTANDING_DEI_CONCEPTS = (
     "EntityCommonStockSharesOutstanding",
-]
-SHARES_OUTSTANDING_GAAP_CONCEPTS = [
+)
+SHARES_OUTSTANDING_GAAP_CONCEPTS = (
     "CommonStockSharesOutstanding",
     "WeightedAverageNumberOfDilutedSharesOutstanding",
     "WeightedAverageNumberOfSharesOutstandingBasic",
     "CommonStockSharesIssued",
     "SharesOutstanding",
-]
+)
 
 
-def _parse_date(value: str | None) -> datetime:
-    if not value:
-        return datetime.min
+def _parse_date(value: str | None) -> int:
+    """YYYY-MM-DD as a sortable YYYYMMDD int; 0 for missing/malformed dates.
+
+    SEC `filed`/`end` are always plain ISO dates, so slicing out the fields
+    orders identically to datetime comparison without fromisoformat's
+    validation and exception path.
+    """
+    if not value or len(value) < 10:
+        return 0
     try:
-        return datetime.fromisoformat(value)
+        return int(value[0:4]) * 10000 + int(value[5:7]) * 100 + int(value[8:10])
     except ValueError:
-        return datetime.min
+        return 0
 
 
 def _is_annual(item: dict[str, Any]) -> bool:
@@ -59,7 +261,7 @@ def _is_annual(item: dict[str, Any]) -> bool:
     return form in ANNUAL_FORMS or fiscal_period == "FY"
 
 
-def _fact_sort_key(item: dict[str, Any]) -> tuple[datetime, datetime, int]:
+def _fact_sort_key(item: dict[str, Any]) -> tuple[int, int, int]:
     return (
         _parse_date(item.get("filed")),
         _parse_date(item.get("end")),
@@ -67,56 +269,174 @@ def _fact_sort_key(item: dict[str, Any]) -> tuple[datetime, datetime, int]:
     )
 
 
-def _latest_fact(items: list[dict[str, Any]], prefer_annual: bool = True) -> dict[str, Any] | None:
-    usable = [item for item in items if item.get("val") is not None]
-    if not usable:
-        return None
+_FactFields = tuple[tuple[int, int, int], bool, str, str]
 
-    if prefer_annual:
-        annual = [item for item in usable if _is_annual(item)]
-        if annual:
-            return max(annual, key=_fact_sort_key)
 
-    quarterly = [item for item in usable if not _is_annual(item)]
-    if quarterly:
-        return max(quarterly, key=_fact_sort_key)
+def _fact_fields(item: dict[str, Any]) -> _FactFields:
+    """(sort key, is_annual, fy, FP) for a fact, normalised once and memoised on it.
 
-    return max(usable, key=_fact_sort_key)
+    WHY: the same unit lists are filtered by exact period and then by latest
+         period, so re-parsing dates and upper-casing strings per call added
+         up.  Computed lazily, so concepts that are never read cost nothing.
+    """
+    fields = item.get("_fields")
+    if fields is None:
+        fields = (
+            _fact_sort_key(item),
+            _is_annual(item),
+            str(item.get("fy", "")),
+            str(item.get("fp", "")).upper(),
+        )
+        item["_fields"] = fields
+    return fields
+
+
+# Unit lists at least this long are selected with NumPy reductions; shorter
+# ones are cheaper to scan in Python than to convert.
+_VECTORIZE_MIN_FACTS = 32
+
+
+@dataclass(frozen=True)
+class _FactTable:
+    """Column view of one unit list's usable facts (those with a `val`)."""
+
+    items: list[dict[str, Any]]
+    keys: np.ndarray  # (n, 3) int64 sort keys: filed, end, fy
+    annual: np.ndarray
+    fy: np.ndarray
+    fp: np.ndarray
+
+    @classmethod
+    def from_items(cls, items: list[dict[str, Any]]) -> "_FactTable":
+        usable = [item for item in items if item.get("val") is not None]
+        fields = [_fact_fields(item) for item in usable]
+        return cls(
+            items=usable,
+            keys=np.array([f[0] for f in fields], dtype=np.int64).reshape(-1, 3),
+            annual=np.array([f[1] for f in fields], dtype=bool),
+            fy=np.array([f[2] for f in fields], dtype=str),
+            fp=np.array([f[3] for f in fields], dtype=str),
+        )
 
+    def best(self, mask: np.ndarray) -> dict[str, Any] | None:
+        """Fact with the greatest sort key under `mask`; ties keep the first."""
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return None
+        for column in range(self.keys.shape[1]):
+            values = self.keys[candidates, column]
+            candidates = candidates[values == values.max()]
+        return self.items[int(candidates[0])]
+
+
+class FactIndex(dict):
+    """{(taxonomy, concept, unit): facts}, with long series tabulated on demand."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._tables: dict[tuple[str, str, str], _FactTable | None] = {}
+
+    def table(self, key: tuple[str, str, str]) -> _FactTable | None:
+        if key not in self._tables:
+            items = self.get(key) or []
+            self._tables[key] = _FactTable.from_items(items) if len(items) >= _VECTORIZE_MIN_FACTS else None
+        return self._tables[key]
+
+
+def _latest_fact(
+    items: list[dict[str, Any]],
+    prefer_annual: bool = True,
+    table: _FactTable | None = None,
+) -> dict[str, Any] | None:
+    """Latest usable fact, preferring annual (or non-annual) filings.
+
+    One pass tracks the best annual and best non-annual fact together, so
+    each item's sort key is built once.  Ties keep the first item, as `max`
+    did.
+    """
+    if table is not None:
+        first, second = (table.annual, ~table.annual) if prefer_annual else (~table.annual, table.annual)
+        best = table.best(first)
+        return best if best is not None else table.best(second)
+
+    best_annual = best_other = None
+    annual_key = other_key = None
+    for item in items:
+        if item.get("val") is None:
+            continue
+        key, is_annual, _, _ = _fact_fields(item)
+        if is_annual:
+            if annual_key is None or key > annual_key:
+                best_annual, annual_key = item, key
+        elif other_key is None or key > other_key:
+            best_other, other_key = item, key
 
-def _exact_period_fact(items: list[dict[str, Any]], fiscal_year: str, fiscal_period: str) -> dict[str, Any] | None:
-    usable = [item for item in items if item.get("val") is not None]
-    exact = [
-        item
-        for item in usable
-        if str(item.get("fy", "")) == fiscal_year and str(item.get("fp", "")).upper() == fiscal_period.upper()
-    ]
-    if not exact:
-        return None
-    return max(exact, key=_fact_sort_key)
+    if prefer_annual:
+        return best_annual if best_annual is not None else best_other
+    return best_other if best_other is not None else best_annual
+
+
+def _exact_period_fact(
+    items: list[dict[str, Any]],
+    fiscal_year: str,
+    fiscal_period: str,
+    table: _FactTable | None = None,
+) -> dict[str, Any] | None:
+    fiscal_period = fiscal_period.upper()
+    if table is not None:
+        return table.best((table.fy == fiscal_year) & (table.fp == fiscal_period))
+
+    best = None
+    best_key = None
+    for item in items:
+        if item.get("val") is None:
+            continue
+        key, _, fy, fp = _fact_fields(item)
+        if fy != fiscal_year or fp != fiscal_period:
+            continue
+        if best_key is None or key > best_key:
+            best, best_key = item, key
+    return best
+
+
+def _index_facts(facts: dict[str, Any]) -> FactIndex:
+    """Flatten companyfacts into {(taxonomy, concept, unit): facts} in one pass."""
+    index = FactIndex()
+    for taxonomy, concepts in facts.items():
+        if not isinstance(concepts, dict):
+            continue
+        for concept, body in concepts.items():
+            units = body.get("units") if isinstance(body, dict) else None
+            if not isinstance(units, dict):
+                continue
+            for unit, items in units.items():
+                index[(taxonomy, concept, unit)] = items
+    return index
 
 
 def _extract_metric(
-    facts: dict[str, Any],
+    index: FactIndex,
     taxonomy: str,
-    concepts: list[str],
+    concepts: tuple[str, ...],
     unit: str,
     fiscal_year: str,
     fiscal_period: str,
 ) -> tuple[float | None, str | None]:
     """Extract first available concept value for an exact fiscal period."""
     for concept in concepts:
-        units = facts.get(taxonomy, {}).get(concept, {}).get("units", {}).get(unit, [])
-        item = _exact_period_fact(units, fiscal_year=fiscal_year, fiscal_period=fiscal_period)
+        key = (taxonomy, concept, unit)
+        item = _exact_period_fact(
+            index.get(key, []), fiscal_year=fiscal_year, fiscal_period=fiscal_period, table=index.table(key),
+        )
         if item is not None:
             return float(item["val"]), concept
     return None, None
 
 
 def _extract_metric_any_period(
-    facts: dict[str, Any],
+    index: FactIndex,
     taxonomy: str,
-    concepts: list[str],
+    concepts: tuple[str, ...],
     unit: str,
 ) -> tuple[float | None, str | None, str]:
     """Fallback: extract the latest available value across ANY period.
@@ -125,20 +445,79 @@ def _extract_metric_any_period(
     Used for shares_outstanding when the exact fiscal period has no data.
     """
     for concept in concepts:
-        all_units = facts.get(taxonomy, {}).get(concept, {}).get("units", {}).get(unit, [])
-        fact = _latest_fact(all_units, prefer_annual=True)
+        key = (taxonomy, concept, unit)
+        fact = _latest_fact(index.get(key, []), prefer_annual=True, table=index.table(key))
+        if fact is not None:
+            period_note = f"FY{fact.get('fy', '?')} {fact.get('fp', '?')} (fallback)"
+            return float(fact["val"]), concept, period_note
+    return None, None, ""
+
+
+def _resolve_shares(
+    index: FactIndex,
+    fiscal_year: str,
+    fiscal_period: str,
+) -> tuple[float | None, str | None, str]:
+    """Shares outstanding: DEI then GAAP for the exact period, then any period.
+
+    Returns (value, concept_used, source_note).  One priority-ordered scan;
+    concepts absent from the filing are dropped up front so the any-period
+    pass only revisits series that exist.
+    """
+    keys = [("dei", concept, "shares") for concept in SHARES_OUTSTANDING_DEI_CONCEPTS]
+    keys += [("us-gaap", concept, "shares") for concept in SHARES_OUTSTANDING_GAAP_CONCEPTS]
+    candidates = [(key[1], index[key], index.table(key)) for key in keys if index.get(key)]
+
+    for concept, items, table in candidates:
+        item = _exact_period_fact(items, fiscal_year=fiscal_year, fiscal_period=fiscal_period, table=table)
+        if item is not None:
+            return float(item["val"]), concept, "exact_period"
+    for concept, items, table in candidates:
+        fact = _latest_fact(items, prefer_annual=True, table=table)
         if fact is not None:
             period_note = f"FY{fact.get('fy', '?')} {fact.get('fp', '?')} (fallback)"
             return float(fact["val"]), concept, period_note
     return None, None, ""
 
 
-def fetch_sec_data(cik: str) -> dict[str, Any]:
+_UNITS_TEMPLATE = {
+    "net_income": "USD",
+    "operating_cashflow": "USD",
+    "capex": "USD",
+    "free_cashflow": "USD",
+    "cash": "USD",
+    "total_debt": "USD",
+    "shares_outstanding": "shares",
+    "interest_expense": "USD",
+    "interest_coverage": "ratio",
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_cik(raw: str) -> tuple[str, str | None]:
+    """(10-digit zero-padded CIK, unpadded CIK or None when not a valid CIK)."""
+    normalized = str(raw).strip().zfill(10)
+    if not normalized.isdecimal() or len(normalized) != 10:
+        return normalized, None
+    return normalized, str(int(normalized))
+
+
+# In-process memo on top of the disk cache: repeat lookups within a run skip
+# the revalidation round-trip and the JSON decode/fact selection entirely.
+_RESPONSE_TTL_SECONDS = 3600
+
+
+def _is_ok_response(response: dict[str, Any]) -> bool:
+    return response.get("status") != "ERROR"
+
+
+@cached(ttl=_RESPONSE_TTL_SECONDS, cache_if=_is_ok_response)
+async def fetch_sec_data_async(cik: str) -> dict[str, Any]:
     """Fetch SEC company facts with a single selected fiscal period."""
-    normalized_cik = str(cik).strip().zfill(10)
+    normalized_cik, cik_number = _normalize_cik(cik)
     inputs_used = ["cik", "NetIncomeLoss", "OperatingIncomeLoss", "InterestExpense", "EntityCommonStockSharesOutstanding"]
 
-    if not normalized_cik.isdigit() or len(normalized_cik) != 10:
+    if cik_number is None:
         return error_response(
             gate=GATE_NAME,
             code="SEC_INVALID_CIK",
@@ -147,11 +526,10 @@ def fetch_sec_data(cik: str) -> dict[str, Any]:
         )
 
     try:
-        headers = {"User-Agent": os.getenv("SEC_USER_AGENT", "Mizan mizan@example.com")}
         url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{normalized_cik}.json"
-        response = httpx.get(url, headers=headers, timeout=15.0)
+        payload = await _sec_get_json(url, missing_ok=True)
 
-        if response.status_code == 404:
+        if payload is None:
             return error_response(
                 gate=GATE_NAME,
                 code="SEC_COMPANY_NOT_FOUND",
@@ -159,12 +537,11 @@ def fetch_sec_data(cik: str) -> dict[str, Any]:
                 inputs_used=inputs_used,
             )
 
-        response.raise_for_status()
-        payload = response.json()
-        facts = payload.get("facts", {})
+        fact_index = _index_facts(payload.get("facts", {}))
 
-        net_income_units = facts.get("us-gaap", {}).get("NetIncomeLoss", {}).get("units", {}).get("USD", [])
-        anchor = _latest_fact(net_income_units, prefer_annual=True)
+        net_income_key = ("us-gaap", "NetIncomeLoss", "USD")
+        net_income_units = fact_index.get(net_income_key, [])
+        anchor = _latest_fact(net_income_units, prefer_annual=True, table=fact_index.table(net_income_key))
         if anchor is None:
             return error_response(
                 gate=GATE_NAME,
@@ -187,75 +564,50 @@ def fetch_sec_data(cik: str) -> dict[str, Any]:
 
         net_income = float(anchor["val"])
         operating_cashflow, operating_cashflow_concept = _extract_metric(
-            facts,
+            fact_index,
             "us-gaap",
-            ["NetCashProvidedByUsedInOperatingActivities"],
+            OPERATING_CASHFLOW_CONCEPTS,
             "USD",
             fiscal_year,
             fiscal_period,
         )
         capex, capex_concept = _extract_metric(
-            facts,
+            fact_index,
             "us-gaap",
-            ["PaymentsToAcquirePropertyPlantAndEquipment"],
+            CAPEX_CONCEPTS,
             "USD",
             fiscal_year,
             fiscal_period,
         )
         cash, cash_concept = _extract_metric(
-            facts,
+            fact_index,
             "us-gaap",
-            ["CashAndCashEquivalentsAtCarryingValue"],
+            CASH_CONCEPTS,
             "USD",
             fiscal_year,
             fiscal_period,
         )
         long_term_debt, long_term_debt_concept = _extract_metric(
-            facts,
+            fact_index,
             "us-gaap",
-            ["LongTermDebt", "LongTermDebtNoncurrent", "LongTermDebtAndCapitalLeaseObligations"],
+            LONG_TERM_DEBT_CONCEPTS,
             "USD",
             fiscal_year,
             fiscal_period,
         )
         current_debt, current_debt_concept = _extract_metric(
-            facts,
+            fact_index,
             "us-gaap",
-            ["DebtCurrent", "ShortTermDebt", "ShortTermBorrowings", "CommercialPaper"],
+            CURRENT_DEBT_CONCEPTS,
             "USD",
             fiscal_year,
             fiscal_period,
         )
-        shares_outstanding, shares_concept = _extract_metric(
-            facts,
-            "dei",
-            SHARES_OUTSTANDING_DEI_CONCEPTS,
-            "shares",
-            fiscal_year,
-            fiscal_period,
+        shares_outstanding, shares_concept, shares_source_note = _resolve_shares(
+            fact_index, fiscal_year, fiscal_period,
         )
-        shares_source_note = "exact_period"
-        if shares_outstanding is None:
-            shares_outstanding, shares_concept = _extract_metric(
-                facts,
-                "us-gaap",
-                SHARES_OUTSTANDING_GAAP_CONCEPTS,
-                "shares",
-                fiscal_year,
-                fiscal_period,
-            )
-        # Fallback: try DEI across ANY period
-        if shares_outstanding is None:
-            shares_outstanding, shares_concept, shares_source_note = _extract_metric_any_period(
-                facts, "dei", SHARES_OUTSTANDING_DEI_CONCEPTS, "shares",
-            )
-        # Fallback: try GAAP concepts across ANY period
-        if shares_outstanding is None:
-            shares_outstanding, shares_concept, shares_source_note = _extract_metric_any_period(
-                facts, "us-gaap", SHARES_OUTSTANDING_GAAP_CONCEPTS, "shares",
-            )
         interest_expense, interest_expense_concept = _extract_metric(
-            facts,
+            fact_index,
             "us-gaap",
             INTEREST_EXPENSE_CONCEPTS,
             "USD",
@@ -268,13 +620,13 @@ def fetch_sec_data(cik: str) -> dict[str, Any]:
         if interest_expense is None:
             interest_expense, interest_expense_concept, interest_expense_fallback_note = (
                 _extract_metric_any_period(
-                    facts, "us-gaap", INTEREST_EXPENSE_CONCEPTS, "USD"
+                    fact_index, "us-gaap", INTEREST_EXPENSE_CONCEPTS, "USD"
                 )
             )
         operating_income, operating_income_concept = _extract_metric(
-            facts,
+            fact_index,
             "us-gaap",
-            ["OperatingIncomeLoss"],
+            OPERATING_INCOME_CONCEPTS,
             "USD",
             fiscal_year,
             fiscal_period,
@@ -283,16 +635,15 @@ def fetch_sec_data(cik: str) -> dict[str, Any]:
         capex_missing = capex is None
         free_cashflow = None
         if operating_cashflow is not None:
-            capex_for_fcf = float(capex) if capex is not None else 0.0
-            free_cashflow = float(operating_cashflow) - capex_for_fcf
+            free_cashflow = operating_cashflow - (capex if capex is not None else 0.0)
 
-        long_term_debt_value = float(long_term_debt) if long_term_debt is not None else 0.0
-        current_debt_value = float(current_debt) if current_debt is not None else 0.0
+        long_term_debt_value = long_term_debt if long_term_debt is not None else 0.0
+        current_debt_value = current_debt if current_debt is not None else 0.0
         total_debt = long_term_debt_value + current_debt_value
 
         interest_coverage = None
-        if interest_expense is not None and operating_income is not None and abs(float(interest_expense)) > 0.0:
-            interest_coverage = operating_income / abs(float(interest_expense))
+        if interest_expense is not None and operating_income is not None and abs(interest_expense) > 0.0:
+            interest_coverage = operating_income / abs(interest_expense)
 
         required_metrics = {
             "net_income": net_income,
@@ -326,16 +677,16 @@ def fetch_sec_data(cik: str) -> dict[str, Any]:
 
         data = {
             "net_income": round_float(net_income, 2),
-            "operating_cashflow": round_float(float(operating_cashflow), 2),
-            "capex": round_float(float(capex), 2) if capex is not None else None,
-            "free_cashflow": round_float(float(free_cashflow), 2),
-            "cash": round_float(float(cash), 2),
+            "operating_cashflow": round_float(operating_cashflow, 2),
+            "capex": round_float(capex, 2) if capex is not None else None,
+            "free_cashflow": round_float(free_cashflow, 2),
+            "cash": round_float(cash, 2),
             "long_term_debt": round_float(long_term_debt_value, 2),
             "current_debt": round_float(current_debt_value, 2),
             "total_debt": round_float(total_debt, 2),
-            "shares_outstanding": round_float(float(shares_outstanding), 2),
-            "interest_expense": round_float(float(interest_expense), 2) if interest_expense is not None else None,
-            "interest_coverage": round_float(float(interest_coverage), 6) if interest_coverage is not None else None,
+            "shares_outstanding": round_float(shares_outstanding, 2),
+            "interest_expense": round_float(interest_expense, 2) if interest_expense is not None else None,
+            "interest_coverage": round_float(interest_coverage, 6) if interest_coverage is not None else None,
             "source_filing": source_filing,
             "fiscal_year": fiscal_year,
             "fiscal_period": fiscal_period,
@@ -357,17 +708,7 @@ def fetch_sec_data(cik: str) -> dict[str, Any]:
                 "interest_expense": interest_expense_concept,
                 "operating_income": operating_income_concept,
             },
-            "units": {
-                "net_income": "USD",
-                "operating_cashflow": "USD",
-                "capex": "USD",
-                "free_cashflow": "USD",
-                "cash": "USD",
-                "total_debt": "USD",
-                "shares_outstanding": "shares",
-                "interest_expense": "USD",
-                "interest_coverage": "ratio",
-            },
+            "units": _UNITS_TEMPLATE.copy(),
         }
 
         structured_log(
@@ -417,32 +758,65 @@ GATE_NAME_CONTEXT = "Data Fetcher – SEC Business Context"
 
 
 def _strip_html(html: str) -> str:
-    """Remove HTML tags and normalise whitespace."""
-    text = re.sub(r"<style[^>]*>.*?</style>", " ", html, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<script[^>]*>.*?</script>", " ", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"&[a-zA-Z]+;", " ", text)   # HTML entities
-    text = re.sub(r"&#\d+;", " ", text)
-    text = re.sub(r"\s+", " ", text)
+    """Remove HTML tags and normalise whitespace.
+
+    WHY: selectolax walks the DOM once in C and decodes entities, instead of
+         six regex passes that each copy the whole ~500 KB document.
+    """
+    if HTMLParser is None:
+        return _strip_html_regex(html)
+    tree = HTMLParser(html)
+    for node in tree.css("script, style"):
+        node.decompose()
+    root = tree.body if tree.body is not None else tree.root
+    text = root.text(separator=" ") if root is not None else ""
+    return " ".join(text.split())
+
+
+_RE_STYLE = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL | re.IGNORECASE)
+_RE_SCRIPT = re.compile(r"<script[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
+_RE_TAG = re.compile(r"<[^>]+>")
+_RE_ENTITY_NAMED = re.compile(r"&[a-zA-Z]+;")
+_RE_ENTITY_NUM = re.compile(r"&#\d+;")
+_RE_WS = re.compile(r"\s+")
+
+
+def _strip_html_regex(html: str) -> str:
+    text = _RE_STYLE.sub(" ", html)
+    text = _RE_SCRIPT.sub(" ", text)
+    text = _RE_TAG.sub(" ", text)
+    text = _RE_ENTITY_NAMED.sub(" ", text)   # HTML entities
+    text = _RE_ENTITY_NUM.sub(" ", text)
+    text = _RE_WS.sub(" ", text)
     return text.strip()
 
 
+# One alternation instead of a search per heading: the text is scanned once.
+_ITEM_HEADING_RE = re.compile(
+    r"Item\s*(?:"
+    r"(?P<item1a>1A[.\s]*[-\u2013\u2014]?\s*Risk\s*Factors)"
+    r"|(?P<item1b>1B[.\s]*[-\u2013\u2014]?\s*Unresolved)"
+    r"|(?P<item1>1[.\s]*[-\u2013\u2014]?\s*Business)"
+    r"|(?P<item2>2[.\s]*[-\u2013\u2014]?\s*Properties)"
+    r")",
+    re.IGNORECASE,
+)
+
+
 def _extract_filing_sections(text: str) -> dict[str, str]:
     """Try to locate Item 1 (Business) and Item 1A (Risk Factors) in 10-K text."""
     sections: dict[str, str] = {}
 
-    item1_match = re.search(
-        r"Item\s*1[.\s]*[-\u2013\u2014]?\s*Business", text, re.IGNORECASE,
-    )
-    item1a_match = re.search(
-        r"Item\s*1A[.\s]*[-\u2013\u2014]?\s*Risk\s*Factors", text, re.IGNORECASE,
-    )
-    item1b_match = re.search(
-        r"Item\s*1B[.\s]*[-\u2013\u2014]?\s*Unresolved", text, re.IGNORECASE,
-    )
-    item2_match = re.search(
-        r"Item\s*2[.\s]*[-\u2013\u2014]?\s*Properties", text, re.IGNORECASE,
-    )
+    # First occurrence of each heading wins, as with independent searches.
+    first: dict[str, re.Match[str]] = {}
+    for match in _ITEM_HEADING_RE.finditer(text):
+        first.setdefault(match.lastgroup, match)
+        if len(first) == 4:
+            break
+    item1_match = first.get("item1")
+    item1a_match = first.get("item1a")
+    item1b_match = first.get("item1b")
+    item2_match = first.get("item2")
 
     if item1_match:
         start = item1_match.start()
@@ -467,26 +841,28 @@ def _extract_filing_sections(text: str) -> dict[str, str]:
     return sections
 
 
-def fetch_sec_business_context(cik: str) -> dict[str, Any]:
-    """Fetch company metadata and 10-K text for Gate 1 business context."""
-    normalized_cik = str(cik).strip().zfill(10)
-    cik_number = str(int(normalized_cik))  # remove leading zeros for archive URL
+@cached(ttl=_RESPONSE_TTL_SECONDS, cache_if=_is_ok_response)
+async def fetch_sec_business_context_async(cik: str) -> dict[str, Any]:
+    """Fetch company metadata and 10-K text for Gate 1 business context.
+
+    The 10-K URL comes from the submissions payload, so the document download
+    is started as soon as that URL is known rather than after metadata parsing.
+    """
+    normalized_cik, cik_number = _normalize_cik(cik)  # unpadded form is used in archive URLs
     inputs_used = ["cik", "submissions", "10-K_filing_text"]
 
-    try:
-        headers = {"User-Agent": os.getenv("SEC_USER_AGENT", "Mizan mizan@example.com")}
+    if cik_number is None:
+        return error_response(
+            gate=GATE_NAME_CONTEXT,
+            code="SEC_INVALID_CIK",
+            message=f"CIK must be a 10-digit numeric string, got '{cik}'",
+            inputs_used=inputs_used,
+        )
 
+    try:
         # 1. Fetch submissions metadata
         sub_url = f"https://data.sec.gov/submissions/CIK{normalized_cik}.json"
-        sub_resp = httpx.get(sub_url, headers=headers, timeout=15.0)
-        sub_resp.raise_for_status()
-        sub_data = sub_resp.json()
-
-        company_name = sub_data.get("name", "")
-        sic = sub_data.get("sic", "")
-        sic_description = sub_data.get("sicDescription", "")
-        entity_type = sub_data.get("entityType", "")
-        category = sub_data.get("category", "")
+        sub_data = await _sec_get_json(sub_url)
 
         # 2. Find latest 10-K / 20-F / 40-F filing
         recent = sub_data.get("filings", {}).get("recent", {})
@@ -501,9 +877,9 @@ def fetch_sec_business_context(cik: str) -> dict[str, Any]:
                 tenk_index = i
                 break
 
-        filing_text_sections: dict[str, str] = {}
         filing_source: str | None = None
         filing_date: str | None = None
+        doc_task: asyncio.Task[str] | None = None
 
         if (
             tenk_index is not None
@@ -521,11 +897,18 @@ def fetch_sec_business_context(cik: str) -> dict[str, Any]:
                 f"{cik_number}/{accession_dir}/{primary_doc}"
             )
             filing_source = doc_url
+            doc_task = asyncio.create_task(_fetch_filing_document(doc_url))
+
+        company_name = sub_data.get("name", "")
+        sic = sub_data.get("sic", "")
+        sic_description = sub_data.get("sicDescription", "")
+        entity_type = sub_data.get("entityType", "")
+        category = sub_data.get("category", "")
 
+        filing_text_sections: dict[str, str] = {}
+        if doc_task is not None:
             try:
-                doc_resp = httpx.get(doc_url, headers=headers, timeout=30.0)
-                doc_resp.raise_for_status()
-                html_text = doc_resp.text[:500_000]  # cap at 500 KB
+                html_text = (await doc_task)[:500_000]  # cap at 500 KB
                 clean_text = _strip_html(html_text)
                 filing_text_sections = _extract_filing_sections(clean_text)
             except Exception as text_err:
@@ -534,7 +917,7 @@ def fetch_sec_business_context(cik: str) -> dict[str, Any]:
                     "warning",
                     "sec_filing_text_extraction_failed",
                     gate=GATE_NAME_CONTEXT,
-                    url=doc_url,
+                    url=filing_source,
                     error=str(text_err),
                 )
 
@@ -599,3 +982,36 @@ def fetch_sec_business_context(cik: str) -> dict[str, Any]:
             message=f"SEC business context fetch failed: {error}",
             inputs_used=inputs_used,
         )
+
+
+def sec_get(url: str) -> httpx.Response:
+    """Blocking GET over the shared SEC client, for synchronous callers.
+
+    Goes through the same keep-alive pool, per-host cap and rate limiter as
+    the async fetchers, so other SEC traffic (e.g. Gate 0's tickers file)
+    neither opens its own connections nor bypasses the pacing.
+    """
+    return run_sync(_sec_client().get(url))
+
+
+def fetch_sec_data(cik: str, force_refresh: bool = False) -> dict[str, Any]:
+    """Sync wrapper around `fetch_sec_data_async`."""
+    return run_sync(fetch_sec_data_async(cik, force_refresh=force_refresh))
+
+
+async def fetch_sec_data_many_async(ciks: Iterable[str]) -> list[dict[str, Any]]:
+    """Fetch company facts for several CIKs concurrently, in input order.
+
+    Requests share the pooled client, so they are paced by its rate limiter.
+    """
+    return list(await asyncio.gather(*(fetch_sec_data_async(cik) for cik in ciks)))
+
+
+def fetch_sec_data_many(ciks: Iterable[str]) -> list[dict[str, Any]]:
+    """Sync wrapper around `fetch_sec_data_many_async`."""
+    return run_sync(fetch_sec_data_many_async(ciks))
+
+
+def fetch_sec_business_context(cik: str, force_refresh: bool = False) -> dict[str, Any]:
+    """Sync wrapper around `fetch_sec_business_context_async`."""
+    return run_sync(fetch_sec_business_context_async(cik, force_refresh=force_refresh))
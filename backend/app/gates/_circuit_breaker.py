@@ -0,0 +1,59 @@
+"""Sliding-window circuit breaker for optional LLM overlays.
+
+WHY: during a partial Gemini outage every analysis still waits out the
+     client timeout before the overlay is dropped, so tail latency tracks
+     the provider's.  Once most recent calls have failed, the breaker opens
+     and callers skip the LLM for a cool-down period, returning their
+     deterministic result immediately.  After the cool-down the window
+     starts afresh.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+
+
+class CircuitBreaker:
+    """Opens when more than `failure_ratio` of the last `window` calls failed.
+
+    Needs at least `min_calls` outcomes before it can open, so one early
+    failure does not disable the overlay.
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        failure_ratio: float = 0.5,
+        cooldown_seconds: float = 30.0,
+        min_calls: int = 10,
+    ) -> None:
+        self.failure_ratio = failure_ratio
+        self.cooldown_seconds = cooldown_seconds
+        self.min_calls = min_calls
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """True when a call may go ahead."""
+        return time.monotonic() >= self._open_until
+
+    def record(self, success: bool) -> bool:
+        """Record one call outcome; returns True if this outcome opened the breaker."""
+        with self._lock:
+            self._outcomes.append(success)
+            if len(self._outcomes) < self.min_calls:
+                return False
+            failures = self._outcomes.count(False)
+            if failures <= self.failure_ratio * len(self._outcomes):
+                return False
+            self._open_until = time.monotonic() + self.cooldown_seconds
+            self._outcomes.clear()
+            return True
+
+    def reset(self) -> None:
+        with self._lock:
+            self._outcomes.clear()
+            self._open_until = 0.0
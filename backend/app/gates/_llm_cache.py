@@ -0,0 +1,103 @@
+"""On-disk cache of parsed LLM payloads, keyed by model + prompt (or inputs).
+
+WHY: the agentic gates run at temperature 0 over prompts built entirely
+     from filings and deterministic numbers, so re-analysing the same
+     company regenerates the same answer at >1s and API cost per call.
+     Parsed payloads are persisted per prompt hash and reused until they
+     expire (`MIZAN_LLM_CACHE_TTL_DAYS`, default 30; 0 disables the cache).
+     Gates whose prompts are filled from a handful of market numbers key on
+     `input_key` instead, so near-identical inputs share one entry.
+     Cache I/O failures are logged and treated as misses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any
+
+import orjson
+
+from app.llm_config import GEMINI_MODEL
+from app.response_utils import structured_log
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_DAYS = 30.0
+KEY_SIGNIFICANT_DIGITS = 4
+
+
+def _quantize(value: Any) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(f"{value:.{KEY_SIGNIFICANT_DIGITS}g}")
+    return value
+
+
+def input_key(gate: str, inputs: dict[str, Any], template: str = "") -> str:
+    """Cache key for a gate call, numbers rounded to 4 significant digits.
+
+    e.g. an interest rate of 0.03640001 and 0.0364 map to the same entry.
+    Passing the prompt template retires old entries when the wording changes.
+    """
+    quantized = {name: _quantize(value) for name, value in inputs.items()}
+    return json.dumps({"gate": gate, "inputs": quantized, "template": template}, sort_keys=True)
+
+
+class LLMResponseCache:
+    """JSON file per key hash; entry age is taken from the file mtime.
+
+    Keys are full prompts or `input_key` strings.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: float) -> None:
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(f"{GEMINI_MODEL}\0{key}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.ttl_seconds:
+                return None
+            with open(path, "rb") as handle:
+                payload = orjson.loads(handle.read())
+        except (OSError, ValueError):
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def set(self, key: str, payload: dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(orjson.dumps(payload))
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as error:
+            structured_log(logger, "warning", "llm_cache_write_failed", error=str(error))
+
+
+llm_cache = LLMResponseCache(
+    directory=os.path.expanduser(os.getenv("MIZAN_LLM_CACHE", "~/.cache/mizan-llm")),
+    ttl_seconds=float(os.getenv("MIZAN_LLM_CACHE_TTL_DAYS", str(DEFAULT_TTL_DAYS))) * 86400,
+)
@@ -6,13 +6,26 @@ Outputs explicit match_type: EXACT | FUZZY | AMBIGUOUS
 
 from __future__ import annotations
 
-from difflib import SequenceMatcher
+import array
+from dataclasses import dataclass
 import logging
 import os
+import re
+import tempfile
+import threading
+import time
 from typing import Any
 
 import httpx
+import numpy as np
+import orjson
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pure-Python fallback in _similarity / _fuzzy_matches
+    fuzz = process = None
+
+from app.data_fetchers.sec_fetcher import sec_get
 from app.response_utils import error_response, ok_response, structured_log
 
 logger = logging.getLogger(__name__)
@@ -20,22 +33,369 @@ logger = logging.getLogger(__name__)
 GATE_NAME = "Gate 0 – Identity"
 SEC_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
 
+# WHY: the tickers file is ~10 MB and changes at most daily, yet it was
+#      downloaded and re-normalised on every lookup.  The preprocessed list is
+#      kept in memory for a day and mirrored to disk, which also serves as the
+#      fallback when SEC is unreachable.
+_TICKERS_TTL_SECONDS = 24 * 60 * 60
+_TICKERS_LOCK = threading.Lock()
+_TICKERS_CACHE: dict[str, Any] = {"ts": 0.0, "index": None}
+
+# (normalized ticker, normalized title, suffix-stripped title, company name, padded CIK)
+CompanyEntry = tuple[str, str, str, str, str]
 
 def _normalized(value: str) -> str:
     """Normalize to upper-case, collapsed whitespace for matching."""
-    return " ".join(value.strip().upper().split())
+    # split() already drops leading/trailing whitespace, so no strip() pass;
+    # split/join also measures ~3x faster than a `\s+` regex substitution.
+    return " ".join(value.upper().split())
+
+
+_SUFFIXES = (" INC", " CORP", " CO", " LTD", " PLC", " LLC", " LP", " NV", " SA", " AG", " SE")
+# Suffixes are stripped in list order, so a stack of them reads in reverse
+# order from the end ("... LTD CO INC").  One anchored regex with optional
+# groups in that order matches the same tail in a single C-level scan; the
+# leftmost match is the longest strippable tail.
+_SUFFIX_RE = re.compile("".join(f"(?:{re.escape(suffix)})?" for suffix in reversed(_SUFFIXES)) + "$")
 
 
 def _strip_suffixes(value: str) -> str:
     """Remove common corporate suffixes to improve fuzzy matching."""
-    for suffix in (" INC", " CORP", " CO", " LTD", " PLC", " LLC", " LP", " NV", " SA", " AG", " SE"):
-        if value.endswith(suffix):
-            value = value[: -len(suffix)].strip()
-    return value
+    return value[: _SUFFIX_RE.search(value).start()].strip()
+
+
+# Scores below these can never change the outcome, so they are cut off early.
+_FUZZY_THRESHOLD = 0.55
+_SUBSTRING_FLOOR = 0.75
+
+
+# Two reusable DP rows per thread for the pure-Python fallback.
+_DP_ROWS = threading.local()
+
+
+def _dp_rows(size: int) -> tuple[array.array, array.array]:
+    rows = getattr(_DP_ROWS, "rows", None)
+    if rows is None or len(rows[0]) < size:
+        capacity = max(size, 512)
+        rows = (array.array("i", bytes(4 * capacity)), array.array("i", bytes(4 * capacity)))
+        _DP_ROWS.rows = rows
+    return rows
+
 
+def _indel_ratio(left: str, right: str, score_cutoff: float = 0.0) -> float:
+    """Pure-Python fuzz.ratio: 2*LCS/(len(left)+len(right)), 0.0 below the cutoff.
+
+    Two rolling LCS rows (reused across calls) instead of a full matrix, and
+    the scan stops as soon as the remaining rows cannot reach the cutoff.
+    """
+    total = len(left) + len(right)
+    if total == 0:
+        return 1.0
+    if len(right) > len(left):
+        left, right = right, left
+    width = len(right)
+    if 2.0 * width / total < score_cutoff:
+        return 0.0
+    needed = score_cutoff * total / 2.0
+
+    previous, current = _dp_rows(width + 1)
+    for column in range(width + 1):
+        previous[column] = 0
+    current[0] = 0
+    remaining = len(left)
+    for char in left:
+        remaining -= 1
+        for column in range(1, width + 1):
+            if right[column - 1] == char:
+                current[column] = previous[column - 1] + 1
+            elif previous[column] >= current[column - 1]:
+                current[column] = previous[column]
+            else:
+                current[column] = current[column - 1]
+        previous, current = current, previous
+        if previous[width] + remaining < needed:
+            return 0.0
+
+    ratio = 2.0 * previous[width] / total
+    return ratio if ratio >= score_cutoff else 0.0
+
+
+def _similarity(left: str, right: str, score_cutoff: float = 0.0) -> float:
+    """2*matches/total similarity in [0, 1]; 0.0 when below `score_cutoff`.
+
+    RapidFuzz computes this Indel (LCS-based) ratio in C and uses the cutoff
+    to bail out of the comparison early, starting with the length-difference
+    bound; `_indel_ratio` is the same measure in Python.
+    """
+    if fuzz is not None:
+        return fuzz.ratio(left, right, score_cutoff=score_cutoff * 100.0) / 100.0
+    return _indel_ratio(left, right, score_cutoff)
 
-def _similarity(left: str, right: str) -> float:
-    return SequenceMatcher(None, left, right).ratio()
+
+def _tickers_cache_path() -> str:
+    cache_dir = os.path.expanduser(os.getenv("MIZAN_SEC_CACHE", "~/.cache/mizan-sec"))
+    return os.path.join(cache_dir, "company_tickers.json")
+
+
+def _read_cached_tickers(max_age: float | None) -> tuple[bytes, float] | None:
+    """Disk copy of the tickers payload and its mtime, if present and fresh enough."""
+    path = _tickers_cache_path()
+    try:
+        modified = os.path.getmtime(path)
+        if max_age is not None and time.time() - modified >= max_age:
+            return None
+        with open(path, "rb") as handle:
+            return handle.read(), modified
+    except OSError:
+        return None
+
+
+def _write_cached_tickers(content: bytes) -> None:
+    path = _tickers_cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(content)
+        os.replace(tmp_path, path)
+    except OSError as error:
+        structured_log(logger, "warning", "identity_cache_write_failed", gate=GATE_NAME, error=str(error))
+
+
+def _prepare_companies(companies: dict[str, Any]) -> list[CompanyEntry]:
+    """Normalise every SEC entry once so lookups only compare strings."""
+    entries: list[CompanyEntry] = []
+    for entry in companies.values():
+        ticker = _normalized(str(entry.get("ticker", "")))
+        title = _normalized(str(entry.get("title", "")))
+        cik = entry.get("cik_str")
+
+        if not ticker or not title or cik is None:
+            continue
+
+        entries.append((
+            ticker,
+            title,
+            _strip_suffixes(title),
+            str(entry.get("title", "")).strip(),
+            str(cik).zfill(10),
+        ))
+    return entries
+
+
+def _char_counts(values: list[str], vocab: dict[str, int]) -> np.ndarray:
+    counts = np.zeros((len(values), len(vocab)), dtype=np.uint8)
+    for row, value in enumerate(values):
+        for char in value:
+            counts[row, vocab[char]] += 1
+    return counts
+
+
+@dataclass(frozen=True)
+class CompanyIndex:
+    """Preprocessed SEC companies, an exact ticker/title lookup, and
+    per-string character-count matrices for fuzzy-candidate pruning.
+
+    WHY: fuzzy scoring every company is the dominant CPU cost of a lookup.
+         A shared character multiset bounds any common subsequence, so
+         2*overlap/(la+lb) is an upper bound on the similarity ratio, and a
+         substring needs every one of its characters.  Checking those bounds
+         for all entries is a couple of NumPy reductions, and entries that
+         fail them cannot match at all — unlike n-gram postings, which miss
+         transposition-style matches ("FORD" vs "FRDV") and so could turn an
+         ambiguous lookup into a confident one.
+
+    Stored column-wise; output dicts are only built for returned matches.
+    """
+
+    company_names: list[str]
+    ciks: list[str]
+    exact_positions: dict[str, list[int]]
+    vocab: dict[str, int]
+    ticker_texts: np.ndarray
+    title_texts: np.ndarray
+    stripped_texts: np.ndarray
+    ticker_counts: np.ndarray
+    title_counts: np.ndarray
+    stripped_counts: np.ndarray
+    ticker_lengths: np.ndarray
+    title_lengths: np.ndarray
+    stripped_lengths: np.ndarray
+
+    @classmethod
+    def build(cls, entries: list[CompanyEntry]) -> "CompanyIndex":
+        exact_positions: dict[str, list[int]] = {}
+        vocab: dict[str, int] = {}
+        for position, (ticker, title, *_) in enumerate(entries):
+            exact_positions.setdefault(ticker, []).append(position)
+            if title != ticker:
+                exact_positions.setdefault(title, []).append(position)
+            for char in ticker + title:
+                vocab.setdefault(char, len(vocab))
+        columns = list(zip(*entries)) or [()] * 5
+        tickers, titles, stripped, names, ciks = (list(column) for column in columns)
+        return cls(
+            company_names=names,
+            ciks=ciks,
+            exact_positions=exact_positions,
+            vocab=vocab,
+            ticker_texts=np.array(tickers, dtype=object),
+            title_texts=np.array(titles, dtype=object),
+            stripped_texts=np.array(stripped, dtype=object),
+            ticker_counts=_char_counts(tickers, vocab),
+            title_counts=_char_counts(titles, vocab),
+            stripped_counts=_char_counts(stripped, vocab),
+            ticker_lengths=np.array([len(value) for value in tickers], dtype=np.float64),
+            title_lengths=np.array([len(value) for value in titles], dtype=np.float64),
+            stripped_lengths=np.array([len(value) for value in stripped], dtype=np.float64),
+        )
+
+    def record(self, position: int) -> dict[str, str]:
+        return {
+            "ticker": self.ticker_texts[position],
+            "company_name": self.company_names[position],
+            "cik": self.ciks[position],
+        }
+
+    def exact(self, search_term: str) -> list[int]:
+        """Positions whose ticker or title equals `search_term`, in original order."""
+        return self.exact_positions.get(search_term, [])
+
+    def _query(self, value: str) -> tuple[np.ndarray, bool]:
+        """Character counts of `value`, and whether all its characters are known."""
+        counts = np.zeros(len(self.vocab), dtype=np.int32)
+        known = True
+        for char in value:
+            column = self.vocab.get(char)
+            if column is None:
+                known = False
+            else:
+                counts[column] += 1
+        return counts, known
+
+    def _ratio_bound(self, counts: np.ndarray, length: int, matrix: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        overlap = np.minimum(matrix, counts).sum(axis=1, dtype=np.int64)
+        return 2.0 * overlap / np.maximum(lengths + length, 1.0)
+
+    def candidates(self, search_term: str, search_stripped: str, cutoff: float) -> np.ndarray:
+        """Positions of entries that could still be an exact, substring or >= `cutoff` match."""
+        term_counts, term_known = self._query(search_term)
+        stripped_counts, stripped_known = self._query(search_stripped)
+        slack = cutoff - 1e-9
+        keep = (
+            (self._ratio_bound(term_counts, len(search_term), self.ticker_counts, self.ticker_lengths) >= slack)
+            | (self._ratio_bound(term_counts, len(search_term), self.title_counts, self.title_lengths) >= slack)
+            | (self._ratio_bound(stripped_counts, len(search_stripped), self.stripped_counts, self.stripped_lengths) >= slack)
+        )
+        if term_known:
+            keep |= (self.title_counts >= term_counts).all(axis=1)
+        if stripped_known:
+            keep |= (self.stripped_counts >= stripped_counts).all(axis=1)
+        return np.flatnonzero(keep)
+
+
+def _fuzzy_matches(index: CompanyIndex, search_term: str, search_stripped: str) -> list[tuple[float, int]]:
+    """(score, index position) for every fuzzy match, in original entry order.
+
+    Substring hits score max(similarity, 0.75); everything else must reach
+    the 0.55 threshold.  The FUZZY output dict is only built for the winner.
+    """
+    positions = index.candidates(search_term, search_stripped, _FUZZY_THRESHOLD)
+    if process is None:
+        return _fuzzy_matches_scalar(index, positions, search_term, search_stripped)
+
+    tickers = index.ticker_texts[positions]
+    titles = index.title_texts[positions]
+    stripped = index.stripped_texts[positions]
+
+    def scores(query: str, choices: np.ndarray) -> np.ndarray:
+        # One C call per column instead of one per pair; float64 keeps the
+        # scores bit-identical to fuzz.ratio for the tie/ambiguity checks.
+        return process.cdist(
+            [query], choices, scorer=fuzz.ratio, score_cutoff=_FUZZY_THRESHOLD * 100.0,
+            dtype=np.float64,
+        )[0] / 100.0
+
+    substring = np.fromiter(
+        ((search_stripped in title_stripped) or (search_term in title) for title, title_stripped in zip(titles, stripped)),
+        dtype=bool,
+        count=len(positions),
+    )
+    general = np.maximum.reduce([
+        scores(search_term, tickers),
+        scores(search_term, titles),
+        scores(search_stripped, stripped),
+    ])
+    strong = np.maximum(np.maximum(scores(search_stripped, tickers), scores(search_stripped, stripped)), _SUBSTRING_FLOOR)
+    final = np.where(substring, strong, general)
+    keep = substring | (general >= _FUZZY_THRESHOLD)
+    return [(float(final[i]), int(positions[i])) for i in np.flatnonzero(keep)]
+
+
+def _fuzzy_matches_scalar(
+    index: CompanyIndex,
+    positions: np.ndarray,
+    search_term: str,
+    search_stripped: str,
+) -> list[tuple[float, int]]:
+    fuzzy_matches: list[tuple[float, int]] = []
+    for position in positions.tolist():
+        ticker = index.ticker_texts[position]
+        title = index.title_texts[position]
+        title_stripped = index.stripped_texts[position]
+
+        # Substring match in title → treat as strong fuzzy
+        if search_stripped in title_stripped or search_term in title:
+            score = max(
+                _similarity(search_stripped, ticker, _SUBSTRING_FLOOR),
+                _similarity(search_stripped, title_stripped, _SUBSTRING_FLOOR),
+            )
+            fuzzy_matches.append((max(score, _SUBSTRING_FLOOR), position))
+            continue
+
+        # General fuzzy (with suffix-stripped comparison for robustness)
+        score = max(
+            _similarity(search_term, ticker, _FUZZY_THRESHOLD),
+            _similarity(search_term, title, _FUZZY_THRESHOLD),
+            _similarity(search_stripped, title_stripped, _FUZZY_THRESHOLD),
+        )
+        if score >= _FUZZY_THRESHOLD:
+            fuzzy_matches.append((score, position))
+    return fuzzy_matches
+
+
+def _load_company_index() -> CompanyIndex:
+    """Preprocessed SEC company list, refreshed at most once per TTL.
+
+    Cold start prefers a fresh disk copy; on HTTP failure a stale in-memory
+    or on-disk copy is used before giving up.
+    """
+    with _TICKERS_LOCK:
+        index = _TICKERS_CACHE["index"]
+        if index is not None and time.time() - _TICKERS_CACHE["ts"] < _TICKERS_TTL_SECONDS:
+            return index
+
+        cached = _read_cached_tickers(_TICKERS_TTL_SECONDS) if index is None else None
+        if cached is None:
+            try:
+                # Shares the SEC fetcher's pooled HTTP/2 client and rate limiter.
+                response = sec_get(SEC_TICKERS_URL)
+                response.raise_for_status()
+                _write_cached_tickers(response.content)
+                cached = (response.content, time.time())
+            except httpx.HTTPError as error:
+                if index is not None:
+                    structured_log(logger, "warning", "identity_tickers_stale", gate=GATE_NAME, error=str(error))
+                    return index
+                cached = _read_cached_tickers(None)
+                if cached is None:
+                    raise
+                structured_log(logger, "warning", "identity_tickers_from_disk", gate=GATE_NAME, error=str(error))
+
+        content, fetched_at = cached
+        index = CompanyIndex.build(_prepare_companies(orjson.loads(content)))
+        _TICKERS_CACHE.update(ts=fetched_at, index=index)
+        return index
 
 
 def resolve_identity(company_input: str) -> dict[str, Any]:
@@ -61,60 +421,15 @@ def resolve_identity(company_input: str) -> dict[str, Any]:
         )
 
     try:
-        headers = {
-            "User-Agent": os.getenv("SEC_USER_AGENT", "Mizan mizan@example.com")
-        }
-        response = httpx.get(SEC_TICKERS_URL, headers=headers, timeout=10.0)
-        response.raise_for_status()
-        companies = response.json()
-
-        exact_matches: list[dict[str, Any]] = []
-        fuzzy_matches: list[tuple[float, dict[str, Any]]] = []
-
-        for entry in companies.values():
-            ticker = _normalized(str(entry.get("ticker", "")))
-            title = _normalized(str(entry.get("title", "")))
-            cik = entry.get("cik_str")
-
-            if not ticker or not title or cik is None:
-                continue
-
-            record = {
-                "ticker": ticker,
-                "company_name": str(entry.get("title", "")).strip(),
-                "cik": str(cik).zfill(10),
-            }
-
-            # Exact ticker match
-            if search_term == ticker:
-                exact_matches.append({**record, "match_type": "EXACT"})
-                continue
-
-            # Exact title match
-            if search_term == title:
-                exact_matches.append({**record, "match_type": "EXACT"})
-                continue
-
-            # Substring match in title → treat as strong fuzzy
-            title_stripped = _strip_suffixes(title)
-            if search_stripped in title_stripped or search_term in title:
-                score = max(_similarity(search_stripped, ticker), _similarity(search_stripped, title_stripped))
-                fuzzy_matches.append((max(score, 0.75), {**record, "match_type": "FUZZY"}))
-                continue
-
-            # General fuzzy (with suffix-stripped comparison for robustness)
-            score = max(
-                _similarity(search_term, ticker),
-                _similarity(search_term, title),
-                _similarity(search_stripped, title_stripped),
-            )
-            if score >= 0.55:
-                fuzzy_matches.append((score, {**record, "match_type": "FUZZY"}))
+        index = _load_company_index()
+
+        # Exact ticker or title match: dict lookup, resolved before any
+        # fuzzy scoring; only the selected record is materialised.
+        exact_positions = index.exact(search_term)
 
-        # --- Resolution logic ---
-        if len(exact_matches) == 1:
-            selected = exact_matches[0]
-            data = {**selected, "confidence_score": 1.0}
+        if len(exact_positions) == 1:
+            selected = index.record(exact_positions[0])
+            data = {**selected, "match_type": "EXACT", "confidence_score": 1.0}
             one_liner = f"Resolved {raw_input} → {selected['ticker']} (CIK {selected['cik']}) via EXACT match"
             structured_log(
                 logger, "info", "identity_resolved",
@@ -125,8 +440,8 @@ def resolve_identity(company_input: str) -> dict[str, Any]:
                 confidence=100, one_liner=one_liner,
             )
 
-        if len(exact_matches) > 1:
-            candidates = [match["ticker"] for match in exact_matches[:5]]
+        if len(exact_positions) > 1:
+            candidates = [index.ticker_texts[position] for position in exact_positions[:5]]
             return error_response(
                 gate=GATE_NAME,
                 code="IDENTITY_AMBIGUOUS",
@@ -135,6 +450,8 @@ def resolve_identity(company_input: str) -> dict[str, Any]:
                 binding_constraint="DATA_AVAILABILITY",
             )
 
+        # --- Fuzzy resolution ---
+        fuzzy_matches = _fuzzy_matches(index, search_term, search_stripped)
         if not fuzzy_matches:
             return error_response(
                 gate=GATE_NAME,
@@ -145,11 +462,11 @@ def resolve_identity(company_input: str) -> dict[str, Any]:
             )
 
         fuzzy_matches.sort(key=lambda item: item[0], reverse=True)
-        top_score, top_record = fuzzy_matches[0]
+        top_score, top_position = fuzzy_matches[0]
         second_score = fuzzy_matches[1][0] if len(fuzzy_matches) > 1 else 0.0
 
         if len(fuzzy_matches) > 1 and abs(top_score - second_score) <= 0.05:
-            top_candidates = [f"{record['ticker']}({score:.2f})" for score, record in fuzzy_matches[:3]]
+            top_candidates = [f"{index.ticker_texts[position]}({score:.2f})" for score, position in fuzzy_matches[:3]]
             return error_response(
                 gate=GATE_NAME,
                 code="IDENTITY_AMBIGUOUS",
@@ -159,8 +476,10 @@ def resolve_identity(company_input: str) -> dict[str, Any]:
             )
 
         # Clear fuzzy winner
+        top_record = index.record(top_position)
         data = {
             **top_record,
+            "match_type": "FUZZY",
             "confidence_score": round(top_score, 4),
         }
         confidence_int = int(round(top_score * 100))
@@ -11,25 +11,60 @@ WHY: Establish qualitative context about the business without influencing
      OUTPUT: business_summary, key_risk_categories, geographic_exposure,
              business_complexity.  NO opinions, NO investment language.
      If filings missing → status=PARTIAL
+
+     The LLM call is async (`ainvoke`) so the orchestrator can overlap it
+     with the Gate 2 supervisor call; `analyze_business_context` is the
+     blocking wrapper.
 """
 
 from __future__ import annotations
 
 import logging
-import os
+import re
 from typing import Any
 
+from app.async_utils import run_sync
+from app.gates._llm_cache import llm_cache
 from app.gates.llm_output_parser import parse_json_object
-from app.llm_config import get_gemini_llm
+from app.llm_config import HAS_LLM_KEY, get_gemini_llm
 from app.response_utils import error_response, ok_response, partial_response, structured_log
 
 logger = logging.getLogger(__name__)
 
 GATE_NAME = "Gate 1 – Business Context"
-VALID_COMPLEXITY = {"LOW", "MEDIUM", "HIGH"}
-
-
-def analyze_business_context(
+VALID_COMPLEXITY = frozenset({"LOW", "MEDIUM", "HIGH"})
+
+# WHY: 10-K sections are mostly boilerplate, and prompt tokens drive both
+#      Gemini latency and cost.  Each section is condensed to its opening
+#      sentence plus the sentences that mention a structural-risk topic.
+CONTEXT_CHAR_BUDGET = 2000
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z\"(])")
+_RISK_KEYWORD_RE = re.compile(
+    r"revenue|competit|regulat|customer|supplier|geograph|international|foreign"
+    r"|segment|concentrat|litigation|indebted|currenc|tariff|cyclical|depend",
+    re.IGNORECASE,
+)
+
+
+def _condense(text: str, budget: int = CONTEXT_CHAR_BUDGET) -> str:
+    """Keep the lead sentence and risk-relevant sentences, in order, up to `budget` chars."""
+    if len(text) <= budget:
+        return text
+    sentences = _SENTENCE_SPLIT_RE.split(text)
+    kept = [sentences[0]]
+    used = len(sentences[0])
+    for sentence in sentences[1:]:
+        if used >= budget:
+            break
+        if _RISK_KEYWORD_RE.search(sentence):
+            kept.append(sentence)
+            used += len(sentence) + 1
+    if len(kept) == 1:
+        return text[:budget]
+    return " ".join(kept)[:budget]
+
+
+async def analyze_business_context_async(
     company_name: str,
     sic_description: str,
     business_description: str | None = None,
@@ -69,7 +104,7 @@ def analyze_business_context(
     if not risk_factors:
         missing_inputs.append("risk_factors")
 
-    if not os.getenv("GOOGLE_API_KEY"):
+    if not HAS_LLM_KEY:
         return error_response(
             gate=GATE_NAME,
             code="BUSINESS_CONTEXT_LLM_KEY_MISSING",
@@ -78,8 +113,6 @@ def analyze_business_context(
         )
 
     try:
-        llm = get_gemini_llm(temperature=0)
-
         # Build context block from available data
         context_parts = [f"Company: {company_name}"]
         if sic and sic_description:
@@ -90,11 +123,11 @@ def analyze_business_context(
             context_parts.append(f"Entity type: {entity_type}")
         if business_description:
             context_parts.append(
-                f"Business description (from 10-K):\n{business_description[:8000]}"
+                f"Business description (from 10-K):\n{_condense(business_description)}"
             )
         if risk_factors:
             context_parts.append(
-                f"Risk factors (from 10-K):\n{risk_factors[:8000]}"
+                f"Risk factors (from 10-K):\n{_condense(risk_factors)}"
             )
 
         context_block = "\n\n".join(context_parts)
@@ -137,8 +170,12 @@ Rules for business_complexity:
 - HIGH: Complex multi-segment, global operations, heavy regulation, or conglomerate structure
 """
 
-        result = llm.invoke(prompt)
-        payload = parse_json_object(getattr(result, "content", result))
+        payload = llm_cache.get(prompt)
+        cache_hit = payload is not None
+        if payload is None:
+            llm = get_gemini_llm(temperature=0, json_mode=True)
+            result = await llm.ainvoke(prompt)
+            payload = parse_json_object(getattr(result, "content", result))
 
         business_summary = str(payload.get("business_summary", "")).strip()
         key_risk_categories = payload.get("key_risk_categories", [])
@@ -152,6 +189,8 @@ Rules for business_complexity:
                 message="LLM returned empty business_summary",
                 inputs_used=inputs_used,
             )
+        if not cache_hit:
+            llm_cache.set(prompt, payload)
 
         # Safe defaults for context-only gate — never block pipeline
         if business_complexity not in VALID_COMPLEXITY:
@@ -208,3 +247,22 @@ Rules for business_complexity:
             message=f"Business context classification failed: {error}",
             inputs_used=inputs_used,
         )
+
+
+def analyze_business_context(
+    company_name: str,
+    sic_description: str,
+    business_description: str | None = None,
+    risk_factors: str | None = None,
+    entity_type: str | None = None,
+    sic: str | None = None,
+) -> dict[str, Any]:
+    """Blocking wrapper around `analyze_business_context_async`."""
+    return run_sync(analyze_business_context_async(
+        company_name=company_name,
+        sic_description=sic_description,
+        business_description=business_description,
+        risk_factors=risk_factors,
+        entity_type=entity_type,
+        sic=sic,
+    ))
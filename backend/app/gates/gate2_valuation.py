@@ -9,6 +9,9 @@ VALUATION SUPERVISOR AGENT — explains outcome, flags pathological cases,
   assigns confidence.  NEVER alters numbers.
 
 valuation_band: DEEP_VALUE | FAIR | EXPENSIVE | IMPAIRED
+
+The supervisor call is async (`ainvoke`) so the orchestrator can overlap it
+with Gate 1; `calculate_valuation` is the blocking wrapper.
 """
 
 from __future__ import annotations
@@ -17,10 +20,13 @@ import logging
 import os
 from typing import Any
 
+import numpy as np
 from dotenv import load_dotenv
 
+from app.async_utils import run_sync
+from app.gates._llm_cache import llm_cache
 from app.gates.llm_output_parser import parse_json_object
-from app.llm_config import get_gemini_llm
+from app.llm_config import HAS_LLM_KEY, get_gemini_llm
 from app.response_utils import (
     error_response,
     format_compact_number,
@@ -38,6 +44,13 @@ GATE_NAME = "Gate 2 – Valuation"
 REQUIRED_MARGIN = float(os.getenv("REQUIRED_MARGIN_OF_SAFETY", "0.30"))
 VALUATION_MULTIPLE = float(os.getenv("VALUATION_MULTIPLE", "10"))
 
+# Band lookup for batch screens: searchsorted(..., side="right") maps
+# MOS < 0 → 0, 0 <= MOS < 0.5 → 1, MOS >= 0.5 → 2 (same cut-offs as
+# `_valuation_band`).
+_BAND_THRESHOLDS = np.array([0.0, 0.50])
+_BAND_LABELS = np.array(["EXPENSIVE", "FAIR", "DEEP_VALUE", "IMPAIRED"])
+_IMPAIRED_BAND = 3
+
 
 def _valuation_band(margin_of_safety: float) -> str:
     if margin_of_safety >= 0.50:
@@ -83,7 +96,16 @@ def _display_margin_of_safety(margin_of_safety: float | None) -> str | None:
 # Valuation Supervisor Agent — explains, never computes
 # ---------------------------------------------------------------------------
 
-def _run_valuation_supervisor(data: dict[str, Any]) -> dict[str, Any]:
+def _is_valid_supervisor_payload(payload: Any) -> bool:
+    """Only well-formed supervisor replies are cached or reused from cache."""
+    return (
+        isinstance(payload, dict)
+        and bool(str(payload.get("supervisor_commentary") or "").strip())
+        and isinstance(payload.get("pathological_flags"), list)
+    )
+
+
+async def _run_valuation_supervisor_async(data: dict[str, Any]) -> dict[str, Any]:
     """LLM supervisor that explains the valuation outcome.
 
     RULES:
@@ -91,11 +113,10 @@ def _run_valuation_supervisor(data: dict[str, Any]) -> dict[str, Any]:
     - NEVER override pass/fail.
     - Explain outcome, flag pathological cases, assign confidence.
     """
-    if not os.getenv("GOOGLE_API_KEY"):
+    if not HAS_LLM_KEY:
         return {"supervisor_commentary": "Supervisor unavailable (no API key)", "pathological_flags": []}
 
     try:
-        llm = get_gemini_llm(temperature=0)
         prompt = f"""You are a valuation supervisor for an internal risk system.
 
 You are given the COMPLETED deterministic valuation output below.
@@ -130,8 +151,15 @@ Return valid JSON only:
   "pathological_flags": ["list of flags if any, empty list if none"]
 }}"""
 
-        result = llm.invoke(prompt)
-        payload = parse_json_object(getattr(result, "content", result))
+        payload = llm_cache.get(prompt)
+        # An entry that no longer validates is re-asked rather than reused.
+        cache_hit = payload is not None and _is_valid_supervisor_payload(payload)
+        if not cache_hit:
+            llm = get_gemini_llm(temperature=0, json_mode=True)
+            result = await llm.ainvoke(prompt)
+            payload = parse_json_object(getattr(result, "content", result))
+            if _is_valid_supervisor_payload(payload):
+                llm_cache.set(prompt, payload)
         commentary = str(payload.get("supervisor_commentary", "")).strip()
         flags = payload.get("pathological_flags", [])
         if not isinstance(flags, list):
@@ -147,7 +175,7 @@ Return valid JSON only:
 # Main calculation
 # ---------------------------------------------------------------------------
 
-def calculate_valuation(
+async def calculate_valuation_async(
     market_price: float | None,
     net_income: float | None,
     free_cashflow: float | None,
@@ -171,14 +199,13 @@ def calculate_valuation(
         "valuation_policy(net_debt)",
     ]
 
-    required_inputs = {
-        "market_price": market_price,
-        "net_income": net_income,
-        "total_debt": total_debt,
-        "cash": cash,
-        "shares_outstanding": shares_outstanding,
-    }
-    missing = missing_required_fields(required_inputs)
+    missing = missing_required_fields((
+        ("market_price", market_price),
+        ("net_income", net_income),
+        ("total_debt", total_debt),
+        ("cash", cash),
+        ("shares_outstanding", shares_outstanding),
+    ))
     if missing:
         return error_response(
             gate=GATE_NAME,
@@ -198,12 +225,17 @@ def calculate_valuation(
         )
 
     try:
-        if free_cashflow is None:
-            owner_earnings = float(net_income)
+        # Coerce each input once; everything below works on plain floats.
+        price = float(market_price)
+        income = float(net_income)
+        fcf = None if free_cashflow is None else float(free_cashflow)
+
+        if fcf is None or income <= fcf:
+            owner_earnings = income
             owner_earnings_source = "NET_INCOME"
         else:
-            owner_earnings = min(float(net_income), float(free_cashflow))
-            owner_earnings_source = "NET_INCOME" if float(net_income) <= float(free_cashflow) else "FREE_CASH_FLOW"
+            owner_earnings = fcf
+            owner_earnings_source = "FREE_CASH_FLOW"
 
         net_debt = float(total_debt) - float(cash)
         multiple_used, required_margin_used = valuation_policy(net_debt)
@@ -224,7 +256,7 @@ def calculate_valuation(
             one_liner = "FAIL — Intrinsic value is non-positive (IMPAIRED)"
             gate_confidence = 90  # high confidence in the FAIL
         else:
-            margin_of_safety = (intrinsic_price - float(market_price)) / intrinsic_price
+            margin_of_safety = (intrinsic_price - price) / intrinsic_price
             passes = margin_of_safety >= required_margin_used
             valuation_band = _valuation_band(margin_of_safety)
             mos_pct = margin_of_safety * 100
@@ -233,23 +265,28 @@ def calculate_valuation(
                 one_liner = f"PASS — {valuation_band} with MOS {mos_pct:.1f}% (required {req_pct:.0f}%)"
                 gate_confidence = 85
             else:
-                price_ratio = float(market_price) / intrinsic_price if intrinsic_price != 0 else 0
+                price_ratio = price / intrinsic_price
                 one_liner = f"FAIL — Price is {price_ratio:.1f}x intrinsic value (MOS {mos_pct:+.1f}% vs required {req_pct:.0f}%)"
                 gate_confidence = 85
 
+        intrinsic_price_rounded = round_float(intrinsic_price, 2)
+        market_price_rounded = round_float(price, 2)
+        multiple_rounded = round_float(multiple_used, 4)
+        required_margin_rounded = round_float(required_margin_used, 4)
+
         data = {
             "owner_earnings": round_float(owner_earnings, 2),
             "owner_earnings_source_used": owner_earnings_source,
             "net_debt": round_float(net_debt, 2),
             "effective_net_debt": round_float(effective_net_debt, 2),
             "intrinsic_equity": round_float(intrinsic_equity, 2),
-            "intrinsic_price": round_float(intrinsic_price, 2),
-            "market_price": round_float(float(market_price), 2),
+            "intrinsic_price": intrinsic_price_rounded,
+            "market_price": market_price_rounded,
             "margin_of_safety": round_float(margin_of_safety, 4) if margin_of_safety is not None else None,
-            "required_margin": round_float(required_margin_used, 4),
+            "required_margin": required_margin_rounded,
             "valuation_anchor": {
-                "multiple_used": round_float(multiple_used, 4),
-                "required_margin_used": round_float(required_margin_used, 4),
+                "multiple_used": multiple_rounded,
+                "required_margin_used": required_margin_rounded,
                 "policy": "NET_DEBT_ADJUSTED",
             },
             "valuation_band": valuation_band,
@@ -271,15 +308,15 @@ def calculate_valuation(
                 "owner_earnings": format_compact_number(owner_earnings),
                 "net_debt": format_compact_number(net_debt),
                 "intrinsic_equity": format_compact_number(intrinsic_equity),
-                "intrinsic_price": f"{round_float(intrinsic_price, 2):.2f}",
-                "market_price": f"{round_float(float(market_price), 2):.2f}",
+                "intrinsic_price": f"{intrinsic_price_rounded:.2f}",
+                "market_price": f"{market_price_rounded:.2f}",
                 "margin_of_safety": _display_margin_of_safety(margin_of_safety),
                 "required_margin": format_decimal_with_percent_label(required_margin_used),
             },
         }
 
         # --- Valuation Supervisor Agent (explains, never computes) ---
-        supervisor = _run_valuation_supervisor(data)
+        supervisor = await _run_valuation_supervisor_async(data)
         data["supervisor"] = supervisor
 
         structured_log(
@@ -289,8 +326,8 @@ def calculate_valuation(
             market_price=data["market_price"],
             margin_of_safety=data["margin_of_safety"],
             valuation_band=data["valuation_band"],
-            multiple_used=round_float(multiple_used, 4),
-            required_margin_used=round_float(required_margin_used, 4),
+            multiple_used=multiple_rounded,
+            required_margin_used=required_margin_rounded,
             passes=passes,
         )
         return ok_response(
@@ -310,3 +347,82 @@ def calculate_valuation(
             message=f"Valuation calculation failed: {error}",
             inputs_used=inputs_used,
         )
+
+
+def calculate_valuation(
+    market_price: float | None,
+    net_income: float | None,
+    free_cashflow: float | None,
+    total_debt: float | None,
+    cash: float | None,
+    shares_outstanding: float | None,
+) -> dict[str, Any]:
+    """Blocking wrapper around `calculate_valuation_async`."""
+    return run_sync(calculate_valuation_async(
+        market_price=market_price,
+        net_income=net_income,
+        free_cashflow=free_cashflow,
+        total_debt=total_debt,
+        cash=cash,
+        shares_outstanding=shares_outstanding,
+    ))
+
+
+# ---------------------------------------------------------------------------
+# Batch screening — same deterministic math, vectorised, no supervisor
+# ---------------------------------------------------------------------------
+
+def calculate_valuations_batch(
+    market_prices: np.ndarray,
+    net_incomes: np.ndarray,
+    free_cashflows: np.ndarray,
+    total_debts: np.ndarray,
+    cashes: np.ndarray,
+    shares_outstanding: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Vectorised `calculate_valuation` core for screening many tickers.
+
+    Inputs are equal-length float arrays; a NaN free cash flow falls back to
+    net income as in the scalar path.  Rows with non-positive shares get NaN
+    outputs and `passes=False`.  Values are unrounded and no supervisor
+    commentary is produced.
+    """
+    market_prices = np.asarray(market_prices, dtype=np.float64)
+    net_incomes = np.asarray(net_incomes, dtype=np.float64)
+    free_cashflows = np.asarray(free_cashflows, dtype=np.float64)
+    shares = np.asarray(shares_outstanding, dtype=np.float64)
+
+    has_fcf = ~np.isnan(free_cashflows)
+    owner_earnings = np.where(has_fcf, np.fmin(net_incomes, free_cashflows), net_incomes)
+    uses_fcf = has_fcf & (net_incomes > free_cashflows)
+
+    net_debt = np.asarray(total_debts, dtype=np.float64) - np.asarray(cashes, dtype=np.float64)
+    net_cash = net_debt <= 0
+    multiple = np.where(net_cash, VALUATION_MULTIPLE + 2.0, VALUATION_MULTIPLE)
+    required_margin = np.where(net_cash, max(0.20, REQUIRED_MARGIN - 0.05), REQUIRED_MARGIN)
+    effective_net_debt = np.maximum(net_debt, 0.0)
+
+    intrinsic_equity = owner_earnings * multiple - effective_net_debt
+    with np.errstate(divide="ignore", invalid="ignore"):
+        intrinsic_price = np.where(shares > 0, intrinsic_equity / shares, np.nan)
+        impaired = ~(intrinsic_price > 0)
+        margin_of_safety = np.where(
+            impaired, np.nan, (intrinsic_price - market_prices) / intrinsic_price
+        )
+
+    band_index = np.searchsorted(_BAND_THRESHOLDS, np.nan_to_num(margin_of_safety), side="right")
+    band_index[impaired] = _IMPAIRED_BAND
+
+    return {
+        "owner_earnings": owner_earnings,
+        "owner_earnings_source_used": np.where(uses_fcf, "FREE_CASH_FLOW", "NET_INCOME"),
+        "net_debt": net_debt,
+        "effective_net_debt": effective_net_debt,
+        "intrinsic_equity": intrinsic_equity,
+        "intrinsic_price": intrinsic_price,
+        "margin_of_safety": margin_of_safety,
+        "multiple_used": multiple,
+        "required_margin": required_margin,
+        "valuation_band": _BAND_LABELS[band_index],
+        "passes": ~impaired & (margin_of_safety >= required_margin),
+    }
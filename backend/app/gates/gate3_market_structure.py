@@ -6,23 +6,30 @@ Rules:
 - If volume / flow / prediction data missing → NO_RELEVANT_DATA_FOUND
 - No forced classification
 - LLM must reference ONLY provided values
+
+The LLM call is async (`ainvoke`) so the orchestrator can overlap it with
+Gate 4; `analyze_market_structure` is the blocking wrapper.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import os
 import re
-from typing import Any
+from typing import Any, Sequence
+
+import pandas as pd
 
+from app.async_utils import run_sync
+from app.gates._llm_cache import input_key, llm_cache
 from app.gates.llm_output_parser import parse_json_object
-from app.llm_config import get_gemini_llm
+from app.llm_config import HAS_LLM_KEY, get_gemini_llm
 from app.response_utils import missing_required_fields, ok_response, structured_log
 
 logger = logging.getLogger(__name__)
 
 GATE_NAME = "Gate 3 – Market Structure"
-VALID_CLASSIFICATIONS = {"TAILWIND", "NEUTRAL", "HEADWIND", "NO_RELEVANT_DATA_FOUND"}
+VALID_CLASSIFICATIONS = frozenset({"TAILWIND", "NEUTRAL", "HEADWIND", "NO_RELEVANT_DATA_FOUND"})
 VARIABLE_REFERENCES = {
     "last_price": ["last price", "last_price"],
     "last_volume": ["last volume", "last_volume"],
@@ -34,34 +41,93 @@ VARIABLE_REFERENCES = {
     "no_price": ["no price", "no_price"],
     "macro_signal": ["macro signal", "macro_signal"],
 }
+# Shared by every response; a tuple so no envelope can mutate it.
+_INPUTS_USED = (
+    "last_price",
+    "last_volume",
+    "avg_volume",
+    "volume_spike",
+    "price_direction",
+    "flow_signal",
+    "yes_price",
+    "no_price",
+    "macro_signal",
+)
+# Flat, de-duplicated alias list so per-sentence checks skip the dict walk.
+_ALL_ALIASES = tuple(dict.fromkeys(alias for aliases in VARIABLE_REFERENCES.values() for alias in aliases))
+# One case-insensitive alternation: a single C-level scan per sentence.
+_ALIAS_RE = re.compile("|".join(map(re.escape, _ALL_ALIASES)), re.IGNORECASE)
+
+PROMPT_TEMPLATE = """You are a strict classifier for market structure in an internal risk system.
 
+Allowed classifications: TAILWIND, NEUTRAL, HEADWIND, NO_RELEVANT_DATA_FOUND
 
-def _count_sentences(text: str) -> int:
-    chunks = [part.strip() for part in re.split(r"[.!?]+", text) if part.strip()]
-    return len(chunks)
+Hard constraints:
+- Do NOT compute new metrics.
+- Do NOT invent thresholds.
+- Do NOT add macro opinions or predictions.
+- Every sentence in reasoning must reference at least one provided variable name.
+- Reasoning must be at most 3 sentences.
+- Use Bloomberg terminal tone: precise, neutral, professional.
+- If the data is ambiguous or conflicting, prefer NEUTRAL or NO_RELEVANT_DATA_FOUND.
+- Do NOT force a classification when data is insufficient.
 
+Inputs:
+- last price: {last_price}
+- last volume: {last_volume}
+- average volume: {avg_volume}
+- volume spike: {volume_spike}
+- price direction: {price_direction}
+- flow signal: {flow_signal}
+- yes price: {yes_price}
+- no price: {no_price}
+- macro signal: {macro_signal}
 
-def _first_n_sentences(text: str, n: int) -> str:
-    chunks = [part.strip() for part in re.split(r"(?<=[.!?])\s+", text) if part.strip()]
-    if len(chunks) <= n:
-        return text.strip()
-    return " ".join(chunks[:n]).strip()
+Return valid JSON only:
+{{
+  "classification": "TAILWIND" | "NEUTRAL" | "HEADWIND" | "NO_RELEVANT_DATA_FOUND",
+  "setup_label": "short non-numeric setup label",
+  "reasoning": "max 3 sentences, each referencing provided variables"
+}}
+"""
 
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+")
+MAX_REASONING_SENTENCES = 3
+
+# WHY: when every channel points the same way the LLM answer is a foregone
+#      conclusion, so those inputs are classified here without a round-trip.
+#      Only a volume spike well past the fetcher's 1.5x flag qualifies.
+DETERMINISTIC_VOLUME_SPIKE = 3.0
+DETERMINISTIC_CONFIDENCE = 70
+_ALIGNED_SIGNALS = {
+    ("UP", "POSITIVE", "SUPPORTIVE"): ("TAILWIND", "Aligned bullish flow"),
+    ("DOWN", "NEGATIVE", "HOSTILE"): ("HEADWIND", "Aligned bearish flow"),
+}
+_CONFLICTING_SIGNALS = frozenset({("POSITIVE", "HOSTILE"), ("NEGATIVE", "SUPPORTIVE")})
 
-def _sentence_chunks(text: str) -> list[str]:
-    return [part.strip() for part in re.split(r"(?<=[.!?])\s+", text.strip()) if part.strip()]
 
+def _sentence_spans(text: str) -> tuple[list[tuple[int, int]], bool]:
+    """(start, end) offsets of the first MAX_REASONING_SENTENCES sentences of
+    stripped `text`, and whether any text follows them.
 
-def _sentence_has_variable_reference(sentence: str) -> bool:
-    lower = sentence.lower()
-    return any(alias in lower for aliases in VARIABLE_REFERENCES.values() for alias in aliases)
+    One boundary scan serves both the length cap and the reference check,
+    and no per-sentence substrings are built.
+    """
+    spans: list[tuple[int, int]] = []
+    start = 0
+    for boundary in _SENTENCE_BOUNDARY_RE.finditer(text):
+        spans.append((start, boundary.start()))
+        start = boundary.end()
+        if len(spans) == MAX_REASONING_SENTENCES:
+            return spans, True
+    spans.append((start, len(text)))
+    return spans, False
 
 
-def _reasoning_has_sentence_level_references(reasoning: str) -> bool:
-    sentences = _sentence_chunks(reasoning)
-    if not sentences:
-        return False
-    return all(_sentence_has_variable_reference(sentence) for sentence in sentences)
+def _reasoning_has_sentence_level_references(text: str, spans: list[tuple[int, int]]) -> bool:
+    # Bounded searches avoid slicing; the loop stops at the first ungrounded sentence.
+    search = _ALIAS_RE.search
+    return bool(spans) and all(search(text, start, end) is not None for start, end in spans)
 
 
 def _is_no_data(
@@ -73,23 +139,46 @@ def _is_no_data(
     no_price: float | None,
 ) -> bool:
     """Deterministic pre-check: return True when there is insufficient market
-    structure data to justify an LLM classification call."""
-    if avg_volume is not None and avg_volume == 0:
-        return True
-    if last_volume is not None and last_volume == 0:
-        return True
-    if (
-        str(price_direction or "").upper() == "FLAT"
-        and str(flow_signal or "").upper() == "NEUTRAL"
-    ):
-        return True
+    structure data to justify an LLM classification call.
+
+    Identity and equality checks run first.  The string upper-casing is
+    only reached when every cheaper check has passed.
+    """
     if yes_price is None and no_price is None:
         return True
-    return False
+    if avg_volume == 0 or last_volume == 0:
+        return True
+    return (price_direction or "").upper() == "FLAT" and (flow_signal or "").upper() == "NEUTRAL"
+
+
+def _try_deterministic_classify(
+    volume_spike: float,
+    price_direction: str,
+    flow_signal: str,
+    macro_signal: str,
+) -> tuple[str, str, str, int] | None:
+    """(classification, setup_label, reasoning, confidence) for one-sided
+    inputs; None leaves the call to the LLM."""
+    direction = price_direction.upper()
+    flow = flow_signal.upper()
+    macro = macro_signal.upper()
+    aligned = _ALIGNED_SIGNALS.get((direction, flow, macro))
+    if aligned is not None and volume_spike > DETERMINISTIC_VOLUME_SPIKE:
+        classification, setup_label = aligned
+        reasoning = (
+            f"Volume spike of {volume_spike:.2f}x average volume accompanies price direction {direction}. "
+            f"Flow signal {flow} and macro signal {macro} point the same way."
+        )
+        return classification, setup_label, reasoning, DETERMINISTIC_CONFIDENCE
+    if (flow, macro) in _CONFLICTING_SIGNALS:
+        reasoning = f"Flow signal {flow} conflicts with macro signal {macro}."
+        # Same confidence the LLM path assigns to NEUTRAL.
+        return "NEUTRAL", "Conflicting flow and macro signals", reasoning, 60
+    return None
 
 
 def _no_relevant_data_response(
-    inputs_used: list[str],
+    inputs_used: Sequence[str],
     reason: str,
     missing_inputs: list[str] | None = None,
 ) -> dict[str, Any]:
@@ -110,7 +199,32 @@ def _no_relevant_data_response(
     )
 
 
-def analyze_market_structure(
+def _classified_response(
+    inputs_used: Sequence[str],
+    classification: str,
+    setup_label: str,
+    reasoning: str,
+    gate_confidence: int,
+) -> dict[str, Any]:
+    data = {
+        "classification": classification,
+        "confidence": gate_confidence,
+        "analysis": reasoning,
+        "setup_label": setup_label,
+        "reasoning": reasoning,
+        "units": {
+            "volume_spike": "ratio",
+            "yes_price": "raw_market_price",
+            "no_price": "raw_market_price",
+        },
+    }
+    return ok_response(
+        gate=GATE_NAME, data=data, inputs_used=inputs_used,
+        confidence=gate_confidence, one_liner=f"{classification} — {setup_label}",
+    )
+
+
+async def analyze_market_structure_async(
     last_price: float | None,
     last_volume: int | None,
     avg_volume: int | None,
@@ -122,29 +236,18 @@ def analyze_market_structure(
     macro_signal: str | None,
 ) -> dict[str, Any]:
     """Classify market setup as TAILWIND, NEUTRAL, HEADWIND, or NO_RELEVANT_DATA_FOUND."""
-    inputs_used = [
-        "last_price",
-        "last_volume",
-        "avg_volume",
-        "volume_spike",
-        "price_direction",
-        "flow_signal",
-        "yes_price",
-        "no_price",
-        "macro_signal",
-    ]
+    inputs_used = _INPUTS_USED
 
     # yes_price and no_price are OPTIONAL (Dome/Polymarket auxiliary signals)
-    required_inputs = {
-        "last_price": last_price,
-        "last_volume": last_volume,
-        "avg_volume": avg_volume,
-        "volume_spike": volume_spike,
-        "price_direction": price_direction,
-        "flow_signal": flow_signal,
-        "macro_signal": macro_signal,
-    }
-    missing = missing_required_fields(required_inputs)
+    missing = missing_required_fields((
+        ("last_price", last_price),
+        ("last_volume", last_volume),
+        ("avg_volume", avg_volume),
+        ("volume_spike", volume_spike),
+        ("price_direction", price_direction),
+        ("flow_signal", flow_signal),
+        ("macro_signal", macro_signal),
+    ))
     if missing:
         return _no_relevant_data_response(
             inputs_used=inputs_used,
@@ -161,49 +264,46 @@ def analyze_market_structure(
             reason="Signal channels are inactive or conflicting for this period.",
         )
 
-    if not os.getenv("GOOGLE_API_KEY"):
+    deterministic = _try_deterministic_classify(volume_spike, price_direction, flow_signal, macro_signal)
+    if deterministic is not None:
+        classification, setup_label, reasoning, gate_confidence = deterministic
+        structured_log(
+            logger, "info", "market_structure_classified",
+            gate=GATE_NAME, classification=classification, deterministic=True,
+        )
+        return _classified_response(inputs_used, classification, setup_label, reasoning, gate_confidence)
+
+    if not HAS_LLM_KEY:
         return _no_relevant_data_response(
             inputs_used=inputs_used,
             reason="LLM key unavailable; returning non-classification fallback.",
         )
 
     try:
-        llm = get_gemini_llm(temperature=0)
-        prompt = f"""You are a strict classifier for market structure in an internal risk system.
-
-Allowed classifications: TAILWIND, NEUTRAL, HEADWIND, NO_RELEVANT_DATA_FOUND
-
-Hard constraints:
-- Do NOT compute new metrics.
-- Do NOT invent thresholds.
-- Do NOT add macro opinions or predictions.
-- Every sentence in reasoning must reference at least one provided variable name.
-- Reasoning must be at most 3 sentences.
-- Use Bloomberg terminal tone: precise, neutral, professional.
-- If the data is ambiguous or conflicting, prefer NEUTRAL or NO_RELEVANT_DATA_FOUND.
-- Do NOT force a classification when data is insufficient.
-
-Inputs:
-- last price: {last_price}
-- last volume: {last_volume}
-- average volume: {avg_volume}
-- volume spike: {volume_spike}
-- price direction: {price_direction}
-- flow signal: {flow_signal}
-- yes price: {yes_price if yes_price is not None else "N/A"}
-- no price: {no_price if no_price is not None else "N/A"}
-- macro signal: {macro_signal}
-
-Return valid JSON only:
-{{
-  "classification": "TAILWIND" | "NEUTRAL" | "HEADWIND" | "NO_RELEVANT_DATA_FOUND",
-  "setup_label": "short non-numeric setup label",
-  "reasoning": "max 3 sentences, each referencing provided variables"
-}}
-"""
-
-        result = llm.invoke(prompt)
-        payload = parse_json_object(getattr(result, "content", result))
+        market_inputs = {
+            "last_price": last_price,
+            "last_volume": last_volume,
+            "avg_volume": avg_volume,
+            "volume_spike": volume_spike,
+            "price_direction": price_direction,
+            "flow_signal": flow_signal,
+            "yes_price": yes_price,
+            "no_price": no_price,
+            "macro_signal": macro_signal,
+        }
+        cache_key = input_key(GATE_NAME, market_inputs, template=PROMPT_TEMPLATE)
+        payload = llm_cache.get(cache_key)
+        cache_hit = payload is not None
+        if payload is None:
+            # Prompt and client are only needed on a cache miss.
+            prompt = PROMPT_TEMPLATE.format_map({
+                **market_inputs,
+                "yes_price": "N/A" if yes_price is None else yes_price,
+                "no_price": "N/A" if no_price is None else no_price,
+            })
+            llm = get_gemini_llm(temperature=0, json_mode=True)
+            result = await llm.ainvoke(prompt)
+            payload = parse_json_object(getattr(result, "content", result))
         classification = str(payload.get("classification", "")).strip().upper()
         setup_label = str(payload.get("setup_label", "")).strip()
         reasoning = str(payload.get("reasoning", "")).strip()
@@ -220,11 +320,16 @@ Return valid JSON only:
                 reason="Model returned empty market-structure analysis.",
             )
 
+        if not cache_hit:
+            llm_cache.set(cache_key, payload)
+
         if not setup_label:
             setup_label = classification.replace("_", " ").title()
 
-        if _count_sentences(reasoning) > 3:
-            reasoning = _first_n_sentences(reasoning, 3)
+        spans, truncated = _sentence_spans(reasoning)
+        grounded_text = reasoning
+        if truncated:
+            reasoning = " ".join(reasoning[start:end] for start, end in spans)
 
         # Confidence based on classification type
         if classification == "NO_RELEVANT_DATA_FOUND":
@@ -233,7 +338,7 @@ Return valid JSON only:
             gate_confidence = 60
         else:
             # For TAILWIND/HEADWIND, verify reasoning references variables
-            if _reasoning_has_sentence_level_references(reasoning):
+            if _reasoning_has_sentence_level_references(grounded_text, spans):
                 gate_confidence = 75
             else:
                 # Downgrade to NEUTRAL if reasoning is unsupported
@@ -246,28 +351,11 @@ Return valid JSON only:
                     reason="Model output lacked variable-grounded reasoning for classification.",
                 )
 
-        one_liner = f"{classification} — {setup_label}"
-
-        data = {
-            "classification": classification,
-            "confidence": gate_confidence,
-            "analysis": reasoning,
-            "setup_label": setup_label,
-            "reasoning": reasoning,
-            "units": {
-                "volume_spike": "ratio",
-                "yes_price": "raw_market_price",
-                "no_price": "raw_market_price",
-            },
-        }
         structured_log(
             logger, "info", "market_structure_classified",
             gate=GATE_NAME, classification=classification,
         )
-        return ok_response(
-            gate=GATE_NAME, data=data, inputs_used=inputs_used,
-            confidence=gate_confidence, one_liner=one_liner,
-        )
+        return _classified_response(inputs_used, classification, setup_label, reasoning, gate_confidence)
 
     except Exception as error:
         structured_log(logger, "error", "market_structure_unexpected_error", gate=GATE_NAME, error=str(error))
@@ -275,3 +363,74 @@ Return valid JSON only:
             inputs_used=inputs_used,
             reason=f"Internal market-structure failure: {error}",
         )
+
+
+def analyze_market_structure(
+    last_price: float | None,
+    last_volume: int | None,
+    avg_volume: int | None,
+    volume_spike: float | None,
+    price_direction: str | None,
+    flow_signal: str | None,
+    yes_price: float | None,
+    no_price: float | None,
+    macro_signal: str | None,
+) -> dict[str, Any]:
+    """Blocking wrapper around `analyze_market_structure_async`."""
+    return run_sync(analyze_market_structure_async(
+        last_price=last_price,
+        last_volume=last_volume,
+        avg_volume=avg_volume,
+        volume_spike=volume_spike,
+        price_direction=price_direction,
+        flow_signal=flow_signal,
+        yes_price=yes_price,
+        no_price=no_price,
+        macro_signal=macro_signal,
+    ))
+
+
+_REQUIRED_COLUMNS = [name for name in _INPUTS_USED if name not in ("yes_price", "no_price")]
+_BATCH_OUTPUT_COLUMNS = ["classification", "confidence", "setup_label", "reasoning"]
+
+
+def analyze_market_structure_batch(frame: pd.DataFrame) -> pd.DataFrame:
+    """Classify one row per ticker; columns are the scalar gate's arguments.
+
+    The missing-input and no-data pre-checks run as column operations, so
+    only the remaining rows are sent to `analyze_market_structure_async`.
+    Those calls run concurrently and still hit the deterministic fast path
+    and the LLM cache.  The result is indexed like `frame`.
+    """
+    frame = frame.reindex(columns=list(_INPUTS_USED))
+    missing_mask = frame[_REQUIRED_COLUMNS].isna().any(axis=1)
+    no_data_mask = (
+        (frame["avg_volume"] == 0)
+        | (frame["last_volume"] == 0)
+        | (
+            (frame["price_direction"].astype(str).str.upper() == "FLAT")
+            & (frame["flow_signal"].astype(str).str.upper() == "NEUTRAL")
+        )
+        | (frame["yes_price"].isna() & frame["no_price"].isna())
+    )
+
+    result = pd.DataFrame(index=frame.index, columns=_BATCH_OUTPUT_COLUMNS, dtype=object)
+    result.loc[missing_mask | no_data_mask, _BATCH_OUTPUT_COLUMNS] = [
+        "NO_RELEVANT_DATA_FOUND", 0, "No relevant market structure data", None,
+    ]
+    result.loc[missing_mask, "reasoning"] = "Missing required inputs."
+    result.loc[no_data_mask & ~missing_mask, "reasoning"] = (
+        "Signal channels are inactive or conflicting for this period."
+    )
+
+    pending = frame[~(missing_mask | no_data_mask)].astype(object).where(frame.notna(), None)
+    if not pending.empty:
+        async def classify_pending() -> list[dict[str, Any]]:
+            return await asyncio.gather(*(
+                analyze_market_structure_async(**row) for row in pending.to_dict("records")
+            ))
+
+        for label, response in zip(pending.index, run_sync(classify_pending())):
+            data = response["data"]
+            result.loc[label, _BATCH_OUTPUT_COLUMNS] = [data[column] for column in _BATCH_OUTPUT_COLUMNS]
+    return result
@@ -6,31 +6,74 @@ Rules:
 - Must cite cash, debt, interest_coverage, rates, credit_stress in reasoning.
 - If key financial inputs are missing → UNDETERMINED (never ERROR for data gaps).
 - LLM classifies only; never computes or invents thresholds.
+
+The LLM call is async (`ainvoke`) so the orchestrator can overlap it with
+Gate 3; `assess_impairment_risk` is the blocking wrapper.
 """
 
 from __future__ import annotations
 
 import logging
-import os
-from typing import Any
+from typing import Any, Sequence
 
+from app.async_utils import run_sync
+from app.gates._llm_cache import input_key, llm_cache
 from app.gates.llm_output_parser import parse_json_object
-from app.llm_config import get_gemini_llm
+from app.llm_config import HAS_LLM_KEY, get_gemini_llm
 from app.response_utils import missing_required_fields, ok_response, structured_log
 
 logger = logging.getLogger(__name__)
 
 GATE_NAME = "Gate 4 – Impairment Risk"
-VALID_RISK_LEVELS = {"LOW", "MEDIUM", "HIGH", "UNDETERMINED"}
-VALID_RISK_DRIVERS = {"LEVERAGE", "REFINANCING", "CASH_FLOW", "NONE"}
-VALID_CREDIT_STRESS = {"LOW", "MEDIUM", "HIGH"}
+VALID_RISK_LEVELS = frozenset({"LOW", "MEDIUM", "HIGH", "UNDETERMINED"})
+VALID_RISK_DRIVERS = frozenset({"LEVERAGE", "REFINANCING", "CASH_FLOW", "NONE"})
+VALID_CREDIT_STRESS = frozenset({"LOW", "MEDIUM", "HIGH"})
+
+# Reported in every Gate 4 diagnostics block, whichever path returns.
+_INPUTS_USED = (
+    "net_income",
+    "free_cashflow",
+    "cash",
+    "total_debt",
+    "net_debt",
+    "interest_expense",
+    "interest_coverage",
+    "shares_outstanding",
+    "interest_rate",
+    "credit_stress",
+    "credit_stress_index",
+)
 
 # Core impairment inputs — if ANY of these are missing, gate returns UNDETERMINED
 CORE_IMPAIRMENT_FIELDS = ["cash", "total_debt", "interest_rate", "credit_stress"]
 
+# WHY: prompt length drives Gemini latency, so the rules are kept terse,
+#      absent inputs are omitted rather than spelled out as "N/A", and the
+#      Gate 1 summary is only attached when coverage is not reported.
+PROMPT_TEMPLATE = """You are a strict impairment risk classifier in an internal risk system.
+Allowed risk_level: LOW, MEDIUM, HIGH (if data is thin, pick the most conservative level you can support).
+STRICT: use ONLY the inputs below; no new ratios, invented thresholds, forecasts or macro opinions.
+Reasoning: max 3 sentences, precise neutral tone, citing cash vs debt, interest coverage, and refinancing environment (rates/credit stress).
+{business_context_block}
+Inputs:
+{inputs_block}
+
+Return valid JSON only:
+{{"risk_level": "LOW" | "MEDIUM" | "HIGH", "risk_driver": "LEVERAGE" | "REFINANCING" | "CASH_FLOW" | "NONE", "reasoning": "..."}}
+"""
+BUSINESS_CONTEXT_MAX_CHARS = 500
+
+# "interest rate" and "credit stress" are covered by "rate" and "credit".
+_REFINANCING_TOKENS = ("refinanc", "credit", "rate")
+
+# WHY: a net-cash balance sheet with ample coverage in a calm credit market
+#      is LOW risk under any reading of the rules, so it skips the LLM call.
+DETERMINISTIC_MIN_COVERAGE = 5.0
+DETERMINISTIC_CONFIDENCE = 70
+
 
 def _undetermined_response(
-    inputs_used: list[str],
+    inputs_used: Sequence[str],
     reason: str,
     missing_inputs: list[str] | None = None,
 ) -> dict[str, Any]:
@@ -57,11 +100,56 @@ def _undetermined_response(
     )
 
 
+def _assessed_response(
+    inputs_used: Sequence[str],
+    risk_level: str,
+    risk_driver: str,
+    reasoning: str,
+    valid_reasoning: bool,
+    credit_stress: str,
+    credit_stress_index: float | None,
+    gate_confidence: int,
+    missing_inputs: list[str],
+) -> dict[str, Any]:
+    # Deduct for partial inputs
+    if missing_inputs:
+        gate_confidence = max(20, gate_confidence - 10)
+
+    one_liner = f"{risk_level} impairment risk — driver: {risk_driver}"
+
+    data = {
+        "risk_level": risk_level,
+        "risk_driver": risk_driver,
+        "credit_stress": credit_stress,
+        "credit_stress_index": float(credit_stress_index) if credit_stress_index is not None else None,
+        "reasoning": reasoning,
+        "reasoning_valid": valid_reasoning,
+        "units": {
+            "interest_rate": "decimal",
+            "credit_stress_index": "NFCI_raw_index",
+        },
+    }
+    if missing_inputs:
+        return ok_response(
+            gate=GATE_NAME,
+            data=data,
+            inputs_used=inputs_used,
+            confidence=gate_confidence,
+            one_liner=one_liner,
+            missing_inputs=missing_inputs,
+            binding_constraint="DATA_AVAILABILITY",
+        )
+    return ok_response(
+        gate=GATE_NAME, data=data, inputs_used=inputs_used,
+        confidence=gate_confidence, one_liner=one_liner,
+    )
+
+
 def _reasoning_meets_constraints(reasoning: str) -> tuple[bool, str]:
     text = reasoning.lower()
     has_cash_vs_debt = "cash" in text and "debt" in text
     has_coverage = "coverage" in text
-    has_refinancing = any(token in text for token in ["refinanc", "interest rate", "credit stress", "credit", "rate"])
+    has_refinancing = any(token in text for token in _REFINANCING_TOKENS)
 
     if not has_cash_vs_debt:
         return False, "Reasoning must explicitly cite cash vs debt"
@@ -72,7 +160,29 @@ def _reasoning_meets_constraints(reasoning: str) -> tuple[bool, str]:
     return True, ""
 
 
-def assess_impairment_risk(
+def _try_deterministic_low_risk(
+    cash: float,
+    total_debt: float,
+    interest_coverage: float | None,
+    interest_rate: float,
+    credit_stress: str,
+) -> str | None:
+    """Reasoning for an unambiguous LOW classification, else None."""
+    if (
+        interest_coverage is None
+        or credit_stress != "LOW"
+        or cash <= total_debt
+        or interest_coverage <= DETERMINISTIC_MIN_COVERAGE
+    ):
+        return None
+    return (
+        f"Cash of {cash:,.0f} exceeds total debt of {total_debt:,.0f}. "
+        f"Interest coverage of {interest_coverage:.2f}x leaves wide headroom over interest expense. "
+        f"Refinancing environment is benign with an interest rate of {interest_rate} and credit stress LOW."
+    )
+
+
+async def assess_impairment_risk_async(
     net_income: float | None,
     free_cashflow: float | None,
     cash: float | None,
@@ -87,19 +197,7 @@ def assess_impairment_risk(
     business_context: str | None = None,
 ) -> dict[str, Any]:
     """Assess permanent impairment risk as LOW, MEDIUM, HIGH, or UNDETERMINED."""
-    inputs_used = [
-        "net_income",
-        "free_cashflow",
-        "cash",
-        "total_debt",
-        "net_debt",
-        "interest_expense",
-        "interest_coverage",
-        "shares_outstanding",
-        "interest_rate",
-        "credit_stress",
-        "credit_stress_index",
-    ]
+    inputs_used = _INPUTS_USED
 
     # Check for core impairment fields first — if missing, return UNDETERMINED
     core_check = {
@@ -141,9 +239,8 @@ def assess_impairment_risk(
         "credit_stress_index": credit_stress_index,
     }
     all_missing = missing_required_fields(all_inputs)
-    has_partial_inputs = len(all_missing) > 0
 
-    normalized_credit_stress = str(credit_stress).upper()
+    normalized_credit_stress = credit_stress.upper() if isinstance(credit_stress, str) else ""
     if normalized_credit_stress not in VALID_CREDIT_STRESS:
         return _undetermined_response(
             inputs_used=inputs_used,
@@ -151,67 +248,72 @@ def assess_impairment_risk(
             missing_inputs=["credit_stress"],
         )
 
-    if float(interest_rate) > 1.0:
+    if interest_rate > 1.0:
         return _undetermined_response(
             inputs_used=inputs_used,
             reason="Cannot assess impairment — interest_rate must be decimal (e.g., 0.0364 for 3.64%).",
             missing_inputs=["interest_rate"],
         )
 
-    if not os.getenv("GOOGLE_API_KEY"):
+    deterministic_reasoning = _try_deterministic_low_risk(
+        cash, total_debt, interest_coverage, interest_rate, normalized_credit_stress,
+    )
+    if deterministic_reasoning is not None:
+        structured_log(logger, "info", "impairment_assessed", gate=GATE_NAME, risk_level="LOW", deterministic=True)
+        return _assessed_response(
+            inputs_used, "LOW", "NONE", deterministic_reasoning, True,
+            normalized_credit_stress, credit_stress_index, DETERMINISTIC_CONFIDENCE, all_missing,
+        )
+
+    if not HAS_LLM_KEY:
         return _undetermined_response(
             inputs_used=inputs_used,
             reason="Impairment model unavailable for this run.",
         )
 
     try:
-        llm = get_gemini_llm(temperature=0)
         # Gate 1 business context (language reference only — does NOT influence risk level)
-        business_context_block = ""
-        if business_context:
-            business_context_block = (
-                f"\nBusiness context (for language reference only — "
-                f"do NOT let this influence risk_level or risk_driver):\n"
-                f"{business_context[:2000]}\n"
-            )
-
-        prompt = f"""You are a strict impairment risk classifier in an internal risk system.
-
-Allowed risk_level: LOW, MEDIUM, HIGH
-(If data is insufficient for a confident assessment, choose the most conservative level you can support.)
-
-Hard rules:
-- Use ONLY the provided inputs below. Do NOT compute new ratios or invent thresholds.
-- No forward-looking claims. No macro opinions. No fluff.
-- Reasoning must be at most 3 sentences and MUST explicitly cite:
-  1) cash vs debt position,
-  2) interest coverage,
-  3) refinancing environment (rates/credit stress).
-- Use Bloomberg terminal tone: precise, neutral, professional.
-{business_context_block}
-Inputs:
-- net income: {net_income if net_income is not None else "N/A"}
-- free cash flow: {free_cashflow if free_cashflow is not None else "N/A"}
-- cash: {cash}
-- total debt: {total_debt}
-- net debt: {net_debt if net_debt is not None else "N/A"}
-- interest expense: {interest_expense if interest_expense is not None else "N/A"}
-- interest coverage: {interest_coverage}
-- shares outstanding: {shares_outstanding if shares_outstanding is not None else "N/A"}
-- interest rate: {interest_rate}
-- credit stress: {normalized_credit_stress}
-- credit stress index: {credit_stress_index if credit_stress_index is not None else "N/A"}
-
-Return valid JSON only:
-{{
-  "risk_level": "LOW" | "MEDIUM" | "HIGH",
-  "risk_driver": "LEVERAGE" | "REFINANCING" | "CASH_FLOW" | "NONE",
-  "reasoning": "max 3 sentences citing cash/debt, coverage, and rates/credit"
-}}
-"""
+        context_excerpt = None
+        if business_context and interest_coverage is None:
+            context_excerpt = business_context[:BUSINESS_CONTEXT_MAX_CHARS]
 
-        result = llm.invoke(prompt)
-        payload = parse_json_object(getattr(result, "content", result))
+        cache_key = input_key(GATE_NAME, {
+            **all_inputs,
+            "free_cashflow": free_cashflow,
+            "credit_stress": normalized_credit_stress,
+            "business_context": context_excerpt,
+        }, template=PROMPT_TEMPLATE)
+        payload = llm_cache.get(cache_key)
+        cache_hit = payload is not None
+        if payload is None:
+            # Prompt and client are only needed on a cache miss.
+            business_context_block = ""
+            if context_excerpt is not None:
+                business_context_block = (
+                    f"\nBusiness context (language reference only — must NOT influence "
+                    f"risk_level or risk_driver):\n{context_excerpt}\n"
+                )
+            labelled_inputs = (
+                ("net income", net_income),
+                ("free cash flow", free_cashflow),
+                ("cash", cash),
+                ("total debt", total_debt),
+                ("net debt", net_debt),
+                ("interest expense", interest_expense),
+                ("interest coverage", interest_coverage),
+                ("shares outstanding", shares_outstanding),
+                ("interest rate", interest_rate),
+                ("credit stress", normalized_credit_stress),
+                ("credit stress index", credit_stress_index),
+            )
+            inputs_block = "\n".join(f"- {label}: {value}" for label, value in labelled_inputs if value is not None)
+            prompt = PROMPT_TEMPLATE.format(
+                business_context_block=business_context_block,
+                inputs_block=inputs_block,
+            )
+            llm = get_gemini_llm(temperature=0, json_mode=True)
+            result = await llm.ainvoke(prompt)
+            payload = parse_json_object(getattr(result, "content", result))
         risk_level = str(payload.get("risk_level", "")).strip().upper()
         risk_driver = str(payload.get("risk_driver", "")).strip().upper()
         reasoning = str(payload.get("reasoning", "")).strip()
@@ -230,6 +332,8 @@ Return valid JSON only:
                 inputs_used=inputs_used,
                 reason="Impairment model returned empty reasoning.",
             )
+        if not cache_hit:
+            llm_cache.set(cache_key, payload)
 
         # Validate reasoning references key concepts
         valid_reasoning, reason_message = _reasoning_meets_constraints(reasoning)
@@ -250,39 +354,10 @@ Return valid JSON only:
         else:  # MEDIUM
             gate_confidence = 70 if valid_reasoning else 50
 
-        # Deduct for partial inputs
-        if has_partial_inputs:
-            gate_confidence = max(20, gate_confidence - 10)
-
-        one_liner = f"{risk_level} impairment risk — driver: {risk_driver}"
-
-        data = {
-            "risk_level": risk_level,
-            "risk_driver": risk_driver,
-            "credit_stress": normalized_credit_stress,
-            "credit_stress_index": float(credit_stress_index) if credit_stress_index is not None else None,
-            "reasoning": reasoning,
-            "reasoning_valid": valid_reasoning,
-            "units": {
-                "interest_rate": "decimal",
-                "credit_stress_index": "NFCI_raw_index",
-            },
-        }
         structured_log(logger, "info", "impairment_assessed", gate=GATE_NAME, risk_level=risk_level)
-
-        if has_partial_inputs:
-            return ok_response(
-                gate=GATE_NAME,
-                data=data,
-                inputs_used=inputs_used,
-                confidence=gate_confidence,
-                one_liner=one_liner,
-                missing_inputs=all_missing,
-                binding_constraint="DATA_AVAILABILITY",
-            )
-        return ok_response(
-            gate=GATE_NAME, data=data, inputs_used=inputs_used,
-            confidence=gate_confidence, one_liner=one_liner,
+        return _assessed_response(
+            inputs_used, risk_level, risk_driver, reasoning, valid_reasoning,
+            normalized_credit_stress, credit_stress_index, gate_confidence, all_missing,
         )
 
     except Exception as error:
@@ -291,3 +366,34 @@ Return valid JSON only:
             inputs_used=inputs_used,
             reason=f"Impairment risk assessment failed: {error}",
         )
+
+
+def assess_impairment_risk(
+    net_income: float | None,
+    free_cashflow: float | None,
+    cash: float | None,
+    total_debt: float | None,
+    net_debt: float | None,
+    interest_expense: float | None,
+    interest_coverage: float | None,
+    shares_outstanding: float | None,
+    interest_rate: float | None,
+    credit_stress: str | None,
+    credit_stress_index: float | None,
+    business_context: str | None = None,
+) -> dict[str, Any]:
+    """Blocking wrapper around `assess_impairment_risk_async`."""
+    return run_sync(assess_impairment_risk_async(
+        net_income=net_income,
+        free_cashflow=free_cashflow,
+        cash=cash,
+        total_debt=total_debt,
+        net_debt=net_debt,
+        interest_expense=interest_expense,
+        interest_coverage=interest_coverage,
+        shares_outstanding=shares_outstanding,
+        interest_rate=interest_rate,
+        credit_stress=credit_stress,
+        credit_stress_index=credit_stress_index,
+        business_context=business_context,
+    ))
@@ -5,20 +5,76 @@ explains the binding constraint and flags when the size is unusually
 small or large — it NEVER modifies the calculated numbers.
 
 If upstream verdict is REJECT, sizing is SKIPPED (not applicable).
+
+The agent call is started as soon as the factors are known and awaited
+only after the deterministic payload is built;
+`calculate_position_size` is the blocking wrapper.  A circuit breaker
+skips the agent while Gemini is failing, so sizing stays prompt.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import os
 from typing import Any
 
+import numpy as np
+
+from app.async_utils import run_sync
+from app.gates._circuit_breaker import CircuitBreaker
+from app.gates._llm_cache import llm_cache
+from app.gates.llm_output_parser import parse_json_object
+from app.llm_config import HAS_LLM_KEY, get_gemini_llm
 from app.response_utils import format_decimal_with_percent_label, missing_required_fields, ok_response, round_float, skipped_response, structured_log
 
 logger = logging.getLogger(__name__)
 
 GATE_NAME = "Gate 5 – Position Sizing"
-VALID_CREDIT_STRESS = {"LOW", "MEDIUM", "HIGH"}
+VALID_CREDIT_STRESS = frozenset({"LOW", "MEDIUM", "HIGH"})
+# The overlay is optional; a slower agent is dropped rather than waited on.
+SIZING_AGENT_TIMEOUT_SECONDS = 30.0
+# Skips the overlay for 30s once most of the last 20 agent calls failed.
+_agent_breaker = CircuitBreaker(window=20, failure_ratio=0.5, cooldown_seconds=30.0)
+
+# Band edges (inclusive upper bounds) and factors mirroring the ladders
+# below, for the vectorised batch path.
+_VOLATILITY_EDGES = np.array([0.20, 0.35, 0.50])
+_DRAWDOWN_EDGES = np.array([0.15, 0.30, 0.45])
+_CORRELATION_EDGES = np.array([0.30, 0.60, 0.80])
+_RATE_EDGES = np.array([0.03, 0.05, 0.07])
+_RISK_FACTORS = np.array([1.00, 0.85, 0.70, 0.55])
+_RATE_FACTORS = np.array([1.00, 0.90, 0.80, 0.70])
+_CREDIT_FACTORS = {"LOW": 1.00, "MEDIUM": 0.85, "HIGH": 0.70}
+# Ties on the minimum factor resolve in this order.
+_CONSTRAINT_PRECEDENCE = ("VOLATILITY", "DRAWDOWN", "CORRELATION", "MACRO")
+
+PROMPT_TEMPLATE = """You are an internal risk system sizing agent. Your ONLY job is to explain
+the computed position size in 1-2 sentences and flag if the size is unusually small or large.
+
+HARD RULES:
+- Do NOT change any numbers. The position size is {position_size:.1f}% NAV — that is final.
+- Do NOT recommend trades or provide investment advice.
+- Use Bloomberg terminal tone: precise, neutral, professional.
+- Reference the binding constraint and relevant factor values.
+
+Computed outputs:
+- position size: {position_size:.1f}% NAV
+- binding constraint: {binding_constraint}
+- factors: VOLATILITY={factors[VOLATILITY]:.2f}, DRAWDOWN={factors[DRAWDOWN]:.2f}, CORRELATION={factors[CORRELATION]:.2f}, MACRO={factors[MACRO]:.2f}
+
+Inputs used:
+- volatility: {volatility:.4f}
+- max drawdown: {max_drawdown:.4f}
+- interest rate: {interest_rate:.4f}
+- credit stress: {credit_stress}
+- correlation index: {correlation_index:.4f}
+
+Return valid JSON only:
+{{
+  "narrative": "1-2 sentences explaining the binding constraint and overall size",
+  "flag": "NORMAL" | "SMALL" | "LARGE"
+}}
+"""
 
 
 def _volatility_factor(volatility: float) -> float:
@@ -61,34 +117,42 @@ def _macro_factor(interest_rate: float, credit_stress: str) -> float:
     else:
         rate_factor = 0.70
 
-    credit_factor = {
-        "LOW": 1.00,
-        "MEDIUM": 0.85,
-        "HIGH": 0.70,
-    }[credit_stress]
+    credit_factor = _CREDIT_FACTORS[credit_stress]
     return min(rate_factor, credit_factor)
 
 
 def _binding_constraint(factors: dict[str, float]) -> str:
-    min_factor = min(factors.values())
-    precedence = ["VOLATILITY", "DRAWDOWN", "CORRELATION", "MACRO"]
-    for key in precedence:
-        if factors[key] == min_factor:
-            return key
-    return "MACRO"
+    # One pass in precedence order; strict `<` lets earlier keys win ties.
+    binding = _CONSTRAINT_PRECEDENCE[0]
+    lowest = factors[binding]
+    for key in _CONSTRAINT_PRECEDENCE[1:]:
+        value = factors[key]
+        if value < lowest:
+            binding, lowest = key, value
+    return binding
+
+
+_MECHANICAL_EXPLANATIONS = {
+    "VOLATILITY": "Volatility band set the lowest sizing factor, which bound maximum position size.",
+    "DRAWDOWN": "Drawdown band set the lowest sizing factor, which bound maximum position size.",
+    "CORRELATION": "Correlation band set the lowest sizing factor, which bound maximum position size.",
+    "MACRO": "Macro band from interest_rate and credit_stress set the lowest sizing factor, which bound maximum position size.",
+}
 
 
 def _mechanical_explanation(binding_constraint: str) -> str:
-    explanations = {
-        "VOLATILITY": "Volatility band set the lowest sizing factor, which bound maximum position size.",
-        "DRAWDOWN": "Drawdown band set the lowest sizing factor, which bound maximum position size.",
-        "CORRELATION": "Correlation band set the lowest sizing factor, which bound maximum position size.",
-        "MACRO": "Macro band from interest_rate and credit_stress set the lowest sizing factor, which bound maximum position size.",
-    }
-    return explanations[binding_constraint]
+    return _MECHANICAL_EXPLANATIONS[binding_constraint]
 
 
-def _run_sizing_agent(
+def _record_agent_outcome(success: bool) -> None:
+    if _agent_breaker.record(success):
+        structured_log(
+            logger, "warning", "sizing_agent_circuit_opened",
+            gate=GATE_NAME, cooldown_seconds=_agent_breaker.cooldown_seconds,
+        )
+
+
+async def _run_sizing_agent_async(
     position_size: float,
     binding_constraint: str,
     factors: dict[str, float],
@@ -101,54 +165,52 @@ def _run_sizing_agent(
     """Agentic overlay: LLM explains WHY the position size is what it is.
     Returns a dict with 'narrative' and 'flag' (NORMAL | SMALL | LARGE).
     Never modifies numbers."""
-    if not os.getenv("GOOGLE_API_KEY"):
+    if not HAS_LLM_KEY:
         return None
 
     try:
-        from app.gates.llm_output_parser import parse_json_object
-        from app.llm_config import get_gemini_llm
-
-        llm = get_gemini_llm(temperature=0)
-        prompt = f"""You are an internal risk system sizing agent. Your ONLY job is to explain
-the computed position size in 1-2 sentences and flag if the size is unusually small or large.
-
-HARD RULES:
-- Do NOT change any numbers. The position size is {position_size:.1f}% NAV — that is final.
-- Do NOT recommend trades or provide investment advice.
-- Use Bloomberg terminal tone: precise, neutral, professional.
-- Reference the binding constraint and relevant factor values.
-
-Computed outputs:
-- position size: {position_size:.1f}% NAV
-- binding constraint: {binding_constraint}
-- factors: VOLATILITY={factors['VOLATILITY']:.2f}, DRAWDOWN={factors['DRAWDOWN']:.2f}, CORRELATION={factors['CORRELATION']:.2f}, MACRO={factors['MACRO']:.2f}
-
-Inputs used:
-- volatility: {volatility:.4f}
-- max drawdown: {max_drawdown:.4f}
-- interest rate: {interest_rate:.4f}
-- credit stress: {credit_stress}
-- correlation index: {correlation_index:.4f}
-
-Return valid JSON only:
-{{
-  "narrative": "1-2 sentences explaining the binding constraint and overall size",
-  "flag": "NORMAL" | "SMALL" | "LARGE"
-}}
-"""
-        result = llm.invoke(prompt)
-        payload = parse_json_object(getattr(result, "content", result))
+        prompt = PROMPT_TEMPLATE.format_map({
+            "position_size": position_size,
+            "binding_constraint": binding_constraint,
+            "factors": factors,
+            "volatility": volatility,
+            "max_drawdown": max_drawdown,
+            "interest_rate": interest_rate,
+            "credit_stress": credit_stress,
+            "correlation_index": correlation_index,
+        })
+        # The prompt embeds every input at its printed precision, so it is
+        # already the quantised cache key: runs that round to the same
+        # figures share one narrative.
+        payload = llm_cache.get(prompt)
+        cache_hit = payload is not None
+        if payload is None:
+            if not _agent_breaker.allow():
+                structured_log(logger, "info", "sizing_agent_circuit_open", gate=GATE_NAME)
+                return None
+            llm = get_gemini_llm(temperature=0, json_mode=True)
+            try:
+                result = await llm.ainvoke(prompt)
+                payload = parse_json_object(getattr(result, "content", result))
+            except Exception:
+                _record_agent_outcome(False)
+                raise
+            _record_agent_outcome(True)
         narrative = str(payload.get("narrative", "")).strip()
         flag = str(payload.get("flag", "NORMAL")).strip().upper()
         if flag not in {"NORMAL", "SMALL", "LARGE"}:
             flag = "NORMAL"
-        return {"narrative": narrative, "flag": flag} if narrative else None
+        if not narrative:
+            return None
+        if not cache_hit:
+            llm_cache.set(prompt, payload)
+        return {"narrative": narrative, "flag": flag}
     except Exception as e:
         structured_log(logger, "warning", "sizing_agent_failed", gate=GATE_NAME, error=str(e))
         return None
 
 
-def calculate_position_size(
+async def calculate_position_size_async(
     volatility: float | None,
     max_drawdown: float | None,
     interest_rate: float | None,
@@ -186,15 +248,22 @@ def calculate_position_size(
             binding_constraint="NOT_APPLICABLE",
         )
 
-    required_inputs = {
-        "volatility": volatility,
-        "max_drawdown": max_drawdown,
-        "interest_rate": interest_rate,
-        "credit_stress": credit_stress,
-        "correlation_index": correlation_index,
-    }
-    missing = missing_required_fields(required_inputs)
-    if missing:
+    # Plain `is None` checks clear the common all-present case; the list of
+    # missing names is only built when one of them trips.
+    if (
+        volatility is None
+        or max_drawdown is None
+        or interest_rate is None
+        or credit_stress is None
+        or correlation_index is None
+    ):
+        missing = missing_required_fields((
+            ("volatility", volatility),
+            ("max_drawdown", max_drawdown),
+            ("interest_rate", interest_rate),
+            ("credit_stress", credit_stress),
+            ("correlation_index", correlation_index),
+        ))
         return skipped_response(
             gate=GATE_NAME,
             data={
@@ -211,7 +280,7 @@ def calculate_position_size(
 
     try:
         base_size = 10.0
-        normalized_credit_stress = str(credit_stress).upper()
+        normalized_credit_stress = credit_stress.upper() if isinstance(credit_stress, str) else ""
         if normalized_credit_stress not in VALID_CREDIT_STRESS:
             return skipped_response(
                 gate=GATE_NAME,
@@ -226,7 +295,9 @@ def calculate_position_size(
                 binding_constraint="DATA_AVAILABILITY",
             )
 
-        if float(interest_rate) > 1.0:
+        # Coerce once; every use below shares these floats.
+        interest_rate = float(interest_rate)
+        if interest_rate > 1.0:
             return skipped_response(
                 gate=GATE_NAME,
                 data={
@@ -240,11 +311,15 @@ def calculate_position_size(
                 binding_constraint="DATA_AVAILABILITY",
             )
 
+        volatility = float(volatility)
+        max_drawdown = float(max_drawdown)
+        correlation_index = float(correlation_index)
+
         factors = {
-            "VOLATILITY": _volatility_factor(float(volatility)),
-            "DRAWDOWN": _drawdown_factor(float(max_drawdown)),
-            "CORRELATION": _correlation_factor(float(correlation_index)),
-            "MACRO": _macro_factor(float(interest_rate), normalized_credit_stress),
+            "VOLATILITY": _volatility_factor(volatility),
+            "DRAWDOWN": _drawdown_factor(max_drawdown),
+            "CORRELATION": _correlation_factor(correlation_index),
+            "MACRO": _macro_factor(interest_rate, normalized_credit_stress),
         }
 
         position_size = base_size
@@ -254,32 +329,39 @@ def calculate_position_size(
         position_size = max(1.0, min(position_size, 10.0))
         binding_constraint = _binding_constraint(factors)
 
-        # Agentic overlay: LLM explains the binding constraint
-        agent_output = _run_sizing_agent(
+        # Agentic overlay: LLM explains the binding constraint.  Started now,
+        # awaited after the deterministic payload below is assembled.
+        agent_task = asyncio.ensure_future(_run_sizing_agent_async(
             position_size=position_size,
             binding_constraint=binding_constraint,
             factors=factors,
-            volatility=float(volatility),
-            max_drawdown=float(max_drawdown),
-            interest_rate=float(interest_rate),
+            volatility=volatility,
+            max_drawdown=max_drawdown,
+            interest_rate=interest_rate,
             credit_stress=normalized_credit_stress,
-            correlation_index=float(correlation_index),
-        )
+            correlation_index=correlation_index,
+        ))
 
         # Confidence: deterministic core is always high confidence
         gate_confidence = 75
 
-        one_liner = f"{round_float(position_size, 1):.1f}% NAV — bound by {binding_constraint}"
+        size_1dp = round_float(position_size, 1)
+        volatility_6dp = round_float(volatility, 6)
+        max_drawdown_6dp = round_float(max_drawdown, 6)
+        interest_rate_6dp = round_float(interest_rate, 6)
+        correlation_index_6dp = round_float(correlation_index, 6)
+
+        one_liner = f"{size_1dp:.1f}% NAV — bound by {binding_constraint}"
 
         data = {
-            "maximum_position_size": round_float(position_size, 1),
+            "maximum_position_size": size_1dp,
             "binding_constraint": binding_constraint,
             "explanation": _mechanical_explanation(binding_constraint),
-            "volatility": round_float(float(volatility), 6),
-            "max_drawdown": round_float(float(max_drawdown), 6),
-            "interest_rate": round_float(float(interest_rate), 6),
+            "volatility": volatility_6dp,
+            "max_drawdown": max_drawdown_6dp,
+            "interest_rate": interest_rate_6dp,
             "credit_stress": normalized_credit_stress,
-            "correlation_index": round_float(float(correlation_index), 6),
+            "correlation_index": correlation_index_6dp,
             "factors": factors,
             "units": {
                 "maximum_position_size": "percent_of_nav",
@@ -289,28 +371,35 @@ def calculate_position_size(
                 "correlation_index": "absolute_correlation_decimal",
             },
             "display": {
-                "maximum_position_size": f"{round_float(position_size, 1):.1f}%",
-                "volatility": format_decimal_with_percent_label(float(volatility)),
-                "max_drawdown": format_decimal_with_percent_label(float(max_drawdown)),
-                "interest_rate": format_decimal_with_percent_label(float(interest_rate)),
-                "correlation_index": str(round_float(float(correlation_index), 4)),
+                "maximum_position_size": f"{size_1dp:.1f}%",
+                "volatility": format_decimal_with_percent_label(volatility),
+                "max_drawdown": format_decimal_with_percent_label(max_drawdown),
+                "interest_rate": format_decimal_with_percent_label(interest_rate),
+                "correlation_index": str(round_float(correlation_index, 4)),
             },
             "macro_components": {
-                "interest_rate": round_float(float(interest_rate), 6),
+                "interest_rate": interest_rate_6dp,
                 "credit_stress": normalized_credit_stress,
             },
             "idiosyncratic_components": {
-                "volatility": round_float(float(volatility), 6),
-                "max_drawdown": round_float(float(max_drawdown), 6),
-                "correlation_index": round_float(float(correlation_index), 6),
+                "volatility": volatility_6dp,
+                "max_drawdown": max_drawdown_6dp,
+                "correlation_index": correlation_index_6dp,
             },
             "systematic_risk_components": {
-                "interest_rate": round_float(float(interest_rate), 6),
+                "interest_rate": interest_rate_6dp,
                 "credit_stress": normalized_credit_stress,
-                "correlation_index": round_float(float(correlation_index), 6),
+                "correlation_index": correlation_index_6dp,
             },
         }
 
+        try:
+            agent_output = await asyncio.wait_for(agent_task, SIZING_AGENT_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            structured_log(logger, "warning", "sizing_agent_timeout", gate=GATE_NAME)
+            _record_agent_outcome(False)
+            agent_output = None
+
         # Attach agent overlay if available
         if agent_output:
             data["agent_overlay"] = agent_output
@@ -345,3 +434,83 @@ def calculate_position_size(
             reason=f"Position sizing skipped due to internal error: {error}",
             binding_constraint="NOT_APPLICABLE",
         )
+
+
+def calculate_position_size(
+    volatility: float | None,
+    max_drawdown: float | None,
+    interest_rate: float | None,
+    credit_stress: str | None,
+    correlation_index: float | None,
+    upstream_reject: bool = False,
+) -> dict[str, Any]:
+    """Blocking wrapper around `calculate_position_size_async`."""
+    return run_sync(calculate_position_size_async(
+        volatility=volatility,
+        max_drawdown=max_drawdown,
+        interest_rate=interest_rate,
+        credit_stress=credit_stress,
+        correlation_index=correlation_index,
+        upstream_reject=upstream_reject,
+    ))
+
+
+def calculate_position_sizes_batch(
+    volatilities: np.ndarray,
+    max_drawdowns: np.ndarray,
+    interest_rates: np.ndarray,
+    credit_stresses: np.ndarray,
+    correlation_indices: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Vectorised deterministic core of `calculate_position_size`.
+
+    Inputs are equal-length arrays (credit stress as LOW/MEDIUM/HIGH
+    strings).  Band lookups use `searchsorted`; no agent overlay is run and
+    sizes are unrounded.  Rows the scalar gate would skip (NaN inputs,
+    unknown credit stress, non-decimal rate) get `valid=False`, a NaN size
+    and a DATA_AVAILABILITY binding constraint.
+    """
+    volatilities = np.asarray(volatilities, dtype=np.float64)
+    max_drawdowns = np.asarray(max_drawdowns, dtype=np.float64)
+    interest_rates = np.asarray(interest_rates, dtype=np.float64)
+    correlation_indices = np.asarray(correlation_indices, dtype=np.float64)
+    credit_factor = np.array(
+        [_CREDIT_FACTORS.get(str(level).upper(), np.nan) for level in credit_stresses],
+        dtype=np.float64,
+    )
+
+    # searchsorted's default side="left" keeps edge values in the lower band,
+    # matching the ladders' `<=` comparisons.
+    factors = np.stack([
+        _RISK_FACTORS[np.searchsorted(_VOLATILITY_EDGES, volatilities)],
+        _RISK_FACTORS[np.searchsorted(_DRAWDOWN_EDGES, max_drawdowns)],
+        _RISK_FACTORS[np.searchsorted(_CORRELATION_EDGES, correlation_indices)],
+        np.fmin(_RATE_FACTORS[np.searchsorted(_RATE_EDGES, interest_rates)], credit_factor),
+    ])
+    valid = (
+        ~np.isnan(volatilities)
+        & ~np.isnan(max_drawdowns)
+        & ~np.isnan(correlation_indices)
+        & ~np.isnan(credit_factor)
+        & (interest_rates <= 1.0)
+    )
+    # Multiply in the scalar gate's order so sizes agree to the last bit.
+    position_size = np.full(volatilities.shape, 10.0)
+    for factor in factors:
+        position_size *= factor
+    position_size = np.where(valid, np.clip(position_size, 1.0, 10.0), np.nan)
+    # argmin returns the first minimum, matching _CONSTRAINT_PRECEDENCE order.
+    binding_constraint = np.where(
+        valid,
+        np.array(_CONSTRAINT_PRECEDENCE)[factors.argmin(axis=0)],
+        "DATA_AVAILABILITY",
+    )
+    return {
+        "maximum_position_size": position_size,
+        "binding_constraint": binding_constraint,
+        "valid": valid,
+        "volatility_factor": factors[0],
+        "drawdown_factor": factors[1],
+        "correlation_factor": factors[2],
+        "macro_factor": factors[3],
+    }
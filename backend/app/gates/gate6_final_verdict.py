@@ -6,6 +6,7 @@ Hard rules:
 - UNDETERMINED impairment cannot INVEST
 - Market structure is signal-only and never vetoes
 - Gate 5 is ignored when SKIPPED
+- Gate 4 SKIPPED (valuation FAIL shortcut) is reported as not assessed
 """
 
 from __future__ import annotations
@@ -18,7 +19,17 @@ from app.response_utils import error_response, missing_required_fields, ok_respo
 logger = logging.getLogger(__name__)
 
 GATE_NAME = "Gate 6 – Final Verdict"
-_NON_BLOCKING_CLASSIFICATIONS = {"NO_SIGNAL", "NO_DATA", "NO_RELEVANT_DATA_FOUND"}
+_NON_BLOCKING_CLASSIFICATIONS = frozenset({"NO_SIGNAL", "NO_DATA", "NO_RELEVANT_DATA_FOUND"})
+_DECISION_LINES = {
+    "INVEST": "Decision: INVEST, as valuation discipline passes and impairment risk remains acceptable.",
+    "WATCH": "Decision: WATCH, pending clearer risk confirmation under current data constraints.",
+    "REJECT": "Decision: REJECT on valuation and risk discipline despite any underlying business strengths.",
+}
+_INVESTMENT_STANCES = {
+    "INVEST": "Valuation discipline met with acceptable impairment risk",
+    "WATCH": "Valuation/risk signals are incomplete or mixed",
+    "REJECT": "Valuation or impairment discipline not met",
+}
 
 
 def _extract_gate_parts(payload: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any], str]:
@@ -55,6 +66,7 @@ def _build_executive_summary(
     impairment_risk: str,
     impairment_reason: str,
     market_classification: str,
+    impairment_skipped: bool = False,
 ) -> str:
     business_line = (
         f"Business context indicates {business_summary}."
@@ -84,16 +96,15 @@ def _build_executive_summary(
             "Impairment context is UNDETERMINED because interest expense is not explicitly reported in SEC filings for this period."
         )
 
+    if impairment_skipped:
+        impairment_line = "Impairment analysis was skipped because the valuation failure already determines the verdict."
+
     if market_classification in _NON_BLOCKING_CLASSIFICATIONS:
         market_line = "Market-structure signals are not reliable for this period and do not alter the core valuation decision."
     else:
         market_line = f"Market-structure context is {market_classification} and is treated as a non-veto timing signal."
 
-    decision_line = {
-        "INVEST": "Decision: INVEST, as valuation discipline passes and impairment risk remains acceptable.",
-        "WATCH": "Decision: WATCH, pending clearer risk confirmation under current data constraints.",
-        "REJECT": "Decision: REJECT on valuation and risk discipline despite any underlying business strengths.",
-    }[verdict]
+    decision_line = _DECISION_LINES[verdict]
 
     return " ".join([business_line, valuation_line, impairment_line, market_line, decision_line])
 
@@ -116,18 +127,20 @@ def aggregate_verdict(
 
     gate2_data, gate2_diag, _ = _extract_gate_parts(gate2_output)
     gate3_data, gate3_diag, _ = _extract_gate_parts(gate3_output)
-    gate4_data, gate4_diag, _ = _extract_gate_parts(gate4_output)
+    gate4_data, gate4_diag, gate4_status = _extract_gate_parts(gate4_output)
     gate5_data, gate5_diag, gate5_status = _extract_gate_parts(gate5_output)
 
-    required_fields = {
-        "gate3_output.classification": gate3_data.get("classification"),
-        "gate4_output.risk_level": gate4_data.get("risk_level"),
-    }
-    if gate2_data.get("pass") is None and gate2_data.get("passes") is None:
-        required_fields["gate2_output.pass"] = None
-
-    missing = missing_required_fields(required_fields)
-    if missing:
+    classification_value = gate3_data.get("classification")
+    risk_level_value = gate4_data.get("risk_level")
+    pass_missing = gate2_data.get("pass") is None and gate2_data.get("passes") is None
+
+    if classification_value is None or risk_level_value is None or pass_missing:
+        missing = missing_required_fields((
+            ("gate3_output.classification", classification_value),
+            ("gate4_output.risk_level", risk_level_value),
+        ))
+        if pass_missing:
+            missing.append("gate2_output.pass")
         return error_response(
             gate=GATE_NAME,
             code="FINAL_VERDICT_MISSING_INPUTS",
@@ -142,8 +155,12 @@ def aggregate_verdict(
         margin_of_safety = gate2_data.get("margin_of_safety")
         margin_of_safety = float(margin_of_safety) if margin_of_safety is not None else None
 
-        market_classification = str(gate3_data.get("classification", "NO_RELEVANT_DATA_FOUND")).upper()
-        impairment_risk = str(gate4_data.get("risk_level", "UNDETERMINED")).upper()
+        # Both were read (and checked non-None) for the missing-input guard;
+        # the raw labels also feed gate_summary below.
+        raw_classification = str(classification_value)
+        raw_risk_level = str(risk_level_value)
+        market_classification = raw_classification.upper()
+        impairment_risk = raw_risk_level.upper()
         impairment_reason = str(gate4_data.get("reason", gate4_data.get("reasoning", "")))
 
         gate5_skipped = gate5_status == "SKIPPED" or str(gate5_data.get("status", "")).upper() == "SKIPPED"
@@ -188,6 +205,7 @@ def aggregate_verdict(
             impairment_risk=impairment_risk,
             impairment_reason=impairment_reason,
             market_classification=market_classification,
+            impairment_skipped=gate4_status == "SKIPPED",
         )
 
         gate5_line = (
@@ -206,11 +224,7 @@ def aggregate_verdict(
             "summary": summary,
             "key_drivers": ["Valuation", "Impairment risk", "Market structure"],
             "confidence_score": round_float(confidence / 100.0, 2),
-            "investment_stance": {
-                "INVEST": "Valuation discipline met with acceptable impairment risk",
-                "WATCH": "Valuation/risk signals are incomplete or mixed",
-                "REJECT": "Valuation or impairment discipline not met",
-            }[verdict],
+            "investment_stance": _INVESTMENT_STANCES[verdict],
             "setup_label": setup_label,
             "risk_notes": " | ".join([
                 f"Valuation band: {valuation_band}",
@@ -223,8 +237,8 @@ def aggregate_verdict(
             "impairment_risk": impairment_risk,
             "gate_summary": {
                 "gate2_valuation": str(gate2_data.get("one_liner", valuation_band)),
-                "gate3_market_structure": str(gate3_data.get("classification", "NO_RELEVANT_DATA_FOUND")),
-                "gate4_impairment": str(gate4_data.get("risk_level", "UNDETERMINED")),
+                "gate3_market_structure": raw_classification,
+                "gate4_impairment": raw_risk_level,
                 "gate5_position_sizing": gate5_line,
             },
             "business_summary": business_summary,
@@ -3,22 +3,43 @@ import json
 import re
 from typing import Any, Dict
 
+import orjson
+
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{[\s\S]*?\})\s*```", re.IGNORECASE)
 
-def parse_json_object(raw: Any) -> Dict[str, Any]:
-    text = str(raw).strip()
 
+def _loads(text: str) -> Any:
+    # orjson is the fast path; stdlib json still accepts the NaN/Infinity
+    # literals orjson rejects, and raises the same JSONDecodeError type.
     try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
         return json.loads(text)
-    except json.JSONDecodeError:
-        pass
 
-    fenced = re.search(r"```(?:json)?\s*(\{[\s\S]*?\})\s*```", text, re.IGNORECASE)
-    if fenced:
-        return json.loads(fenced.group(1))
+
+def parse_json_object(raw: Any) -> Dict[str, Any]:
+    # Structured responses need no text round-trip.
+    if isinstance(raw, dict):
+        return raw
+
+    text = str(raw).strip()
+
+    # Fenced or prefixed replies cannot be a bare object; skip the doomed
+    # parse and its exception.
+    if text.startswith("{"):
+        try:
+            return _loads(text)
+        except json.JSONDecodeError:
+            pass
+
+    if "```" in text:
+        fenced = _FENCED_JSON_RE.search(text)
+        if fenced:
+            return _loads(fenced.group(1))
 
     start = text.find("{")
     end = text.rfind("}")
     if start != -1 and end != -1 and end > start:
-        return json.loads(text[start:end + 1])
+        return _loads(text[start:end + 1])
 
     raise ValueError("Unable to parse JSON object from model output")
@@ -1,20 +1,93 @@
 """
 Shared LLM configuration for the project.
 Ensures all LLM usage is Gemini-based and consistent.
+
+WHY: every gate asked for a fresh client on each run, paying client setup
+     and a new connection pool per LLM call.  Clients are reused per
+     temperature.  Concurrent analyses of the same company issue identical
+     prompts, so an in-flight `ainvoke` is shared instead of repeated.
+     langchain_google_genai takes over a second to import, so it is loaded
+     with the first client; keyless runs never pay for it.
 """
+from __future__ import annotations
+
+import asyncio
+import functools
 import os
+from typing import TYPE_CHECKING, Any
 from dotenv import load_dotenv
-from langchain_google_genai import ChatGoogleGenerativeAI
+
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
 load_dotenv()
 
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+# Read once after load_dotenv(); gates check HAS_LLM_KEY instead of the
+# environment on every call.
+GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+HAS_LLM_KEY = bool(GOOGLE_API_KEY)
+# Per-request client timeout, so a hung call fails instead of holding a
+# worker; callers fall back to their deterministic output.
+GEMINI_TIMEOUT_SECONDS = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "20"))
+
+
+class CoalescingLLM:
+    """Client proxy whose `ainvoke` joins an identical prompt already in flight.
+
+    Waiters are shielded, so one caller timing out does not cancel the
+    request for the others.  Everything else is delegated to the client.
+    """
+
+    def __init__(self, llm: ChatGoogleGenerativeAI) -> None:
+        self._llm = llm
+        self._in_flight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
+
+    async def ainvoke(self, prompt: Any, **kwargs: Any) -> Any:
+        if kwargs or not isinstance(prompt, str):
+            return await self._llm.ainvoke(prompt, **kwargs)
+        key = (asyncio.get_running_loop(), prompt)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._llm.ainvoke(prompt))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
 
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._llm, name)
 
-def get_gemini_llm(temperature: float = 0) -> ChatGoogleGenerativeAI:
-    """Return a Gemini LLM client with shared project defaults."""
-    return ChatGoogleGenerativeAI(
-        model=GEMINI_MODEL,
+
+@functools.lru_cache(maxsize=8)
+def _cached_llm(
+    model: str,
+    temperature: float,
+    api_key: str | None,
+    json_mode: bool = False,
+) -> CoalescingLLM:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return CoalescingLLM(ChatGoogleGenerativeAI(
+        model=model,
         temperature=temperature,
-        google_api_key=os.getenv("GOOGLE_API_KEY")
-    )
+        google_api_key=api_key,
+        timeout=GEMINI_TIMEOUT_SECONDS,
+        response_mime_type="application/json" if json_mode else None,
+    ))
+
+
+def get_gemini_llm(temperature: float = 0, json_mode: bool = False) -> CoalescingLLM:
+    """Return a shared Gemini LLM client with project defaults.
+
+    `json_mode` asks Gemini for an `application/json` response, so the reply
+    is a bare JSON object that `parse_json_object` decodes on its first try.
+    """
+    return _cached_llm(GEMINI_MODEL, float(temperature), GOOGLE_API_KEY, json_mode)
+
+
+def reset_llm_cache() -> None:
+    """Drop the shared clients so the next call builds fresh ones (tests).
+
+    The model name and API key stay as read at import.
+    """
+    _cached_llm.cache_clear()
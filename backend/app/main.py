@@ -7,8 +7,14 @@ This module handles HTTP routing, CORS, and error boundaries only.
 """
 from __future__ import annotations
 
+import asyncio
+import os
+from typing import Any, AsyncIterator
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import orjson
 from pydantic import BaseModel, Field
 import logging
 
@@ -19,19 +25,40 @@ from app.response_utils import structured_log
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# WHY: run_pipeline blocks for the whole gate chain (LLM calls included), so
+#      it runs in a worker thread to keep the event loop serving other
+#      requests.  The semaphore caps concurrent pipelines so a burst cannot
+#      exhaust the default thread pool or the upstream rate limits.
+MAX_CONCURRENT_ANALYSES = int(os.getenv("MIZAN_MAX_CONCURRENT_ANALYSES", "8"))
+_analysis_slots = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+_stream_tasks: set[asyncio.Task] = set()
+
 app = FastAPI(
     title="Mizan",
     description="Internal Financial Decision Engine",
-    version="2.0.0"
+    version="2.0.0",
+    # The /analyze payload (gates 0-6 with display blocks) is large; orjson
+    # encodes it in C rather than through stdlib json.
+    default_response_class=ORJSONResponse,
 )
 
-# CORS (internal tool, but allow for testing)
+# CORS: known frontends only.  Browsers cache the preflight for
+# CORS_MAX_AGE_SECONDS, so repeat /analyze calls skip the OPTIONS round-trip.
+# MIZAN_CORS_ORIGINS takes a comma-separated list to add other consumers.
+CORS_ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("MIZAN_CORS_ORIGINS", "https://mizan.internal,http://localhost:3000").split(",")
+    if origin.strip()
+]
+CORS_MAX_AGE_SECONDS = 600
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=CORS_ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=CORS_MAX_AGE_SECONDS,
 )
 
 
@@ -71,7 +98,8 @@ async def analyze_company(request: AnalysisRequest):
     """
     try:
         structured_log(logger, "info", "analysis_request_received", company_input=request.company_input)
-        response = run_pipeline(request.company_input)
+        async with _analysis_slots:
+            response = await asyncio.to_thread(run_pipeline, request.company_input)
         return response
 
     except Exception as error:
@@ -79,6 +107,53 @@ async def analyze_company(request: AnalysisRequest):
         raise HTTPException(status_code=500, detail=str(error))
 
 
+def _sse_frame(event: str, payload: Any) -> bytes:
+    data = orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return b"event: " + event.encode() + b"\ndata: " + data + b"\n\n"
+
+
+@app.post("/analyze/stream")
+async def analyze_company_stream(request: AnalysisRequest):
+    """
+    Streaming variant of /analyze (Server-Sent Events).
+
+    Emits one `event: gate` frame ({"stage", "result"}) per fetcher and gate
+    envelope as the pipeline records it, then a terminal `event: final`
+    frame carrying the same envelope /analyze returns, or `event: error`.
+    """
+    structured_log(logger, "info", "analysis_stream_requested", company_input=request.company_input)
+    loop = asyncio.get_running_loop()
+    frames: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+    def on_result(stage: str, result: dict[str, Any]) -> None:
+        # Called on the pipeline's worker thread; serialised there too.
+        frame = _sse_frame("gate", {"stage": stage, "result": result})
+        loop.call_soon_threadsafe(frames.put_nowait, frame)
+
+    async def run() -> None:
+        try:
+            async with _analysis_slots:
+                response = await asyncio.to_thread(run_pipeline, request.company_input, on_result)
+            frames.put_nowait(_sse_frame("final", response))
+        except Exception as error:
+            structured_log(logger, "error", "analysis_unexpected_error", company_input=request.company_input, error=str(error))
+            frames.put_nowait(_sse_frame("error", {"detail": str(error)}))
+        finally:
+            frames.put_nowait(None)
+
+    # Kept referenced until done: a client disconnect must not drop a
+    # pipeline mid-run while it holds a semaphore slot.
+    pipeline_task = asyncio.create_task(run())
+    _stream_tasks.add(pipeline_task)
+    pipeline_task.add_done_callback(_stream_tasks.discard)
+
+    async def stream() -> AsyncIterator[bytes]:
+        while (frame := await frames.get()) is not None:
+            yield frame
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
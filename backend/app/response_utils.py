@@ -10,7 +10,9 @@ from __future__ import annotations
 from datetime import datetime, timezone
 import json
 import logging
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping, Sequence
+
+import orjson
 
 
 # ---------------------------------------------------------------------------
@@ -22,23 +24,6 @@ def utc_timestamp() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-# ---------------------------------------------------------------------------
-# Diagnostics block
-# ---------------------------------------------------------------------------
-
-def build_diagnostics(
-    inputs_used: list[str],
-    missing_inputs: list[str] | None = None,
-    binding_constraint: str | None = None,
-) -> dict[str, Any]:
-    """Build canonical diagnostics block for every gate and fetcher response."""
-    return {
-        "inputs_used": inputs_used,
-        "missing_inputs": missing_inputs or [],
-        "binding_constraint": binding_constraint,
-    }
-
-
 # ---------------------------------------------------------------------------
 # Response envelopes
 # ---------------------------------------------------------------------------
@@ -46,7 +31,7 @@ def build_diagnostics(
 def ok_response(
     gate: str,
     data: dict[str, Any],
-    inputs_used: list[str],
+    inputs_used: Sequence[str],
     confidence: int = 100,
     one_liner: str = "",
     binding_constraint: str | None = None,
@@ -60,20 +45,20 @@ def ok_response(
         "status": "OK",
         "gate": gate,
         "data": data,
-        "confidence": max(0, min(100, confidence)),
+        "confidence": 0 if confidence < 0 else 100 if confidence > 100 else confidence,
         "one_liner": one_liner or data.get("one_liner", ""),
-        "diagnostics": build_diagnostics(
-            inputs_used=inputs_used,
-            missing_inputs=missing_inputs or [],
-            binding_constraint=binding_constraint,
-        ),
+        "diagnostics": {
+            "inputs_used": inputs_used,
+            "missing_inputs": missing_inputs or [],
+            "binding_constraint": binding_constraint,
+        },
     }
 
 
 def partial_response(
     gate: str,
     data: dict[str, Any],
-    inputs_used: list[str],
+    inputs_used: Sequence[str],
     missing_inputs: list[str],
     confidence: int = 50,
     one_liner: str = "",
@@ -84,13 +69,13 @@ def partial_response(
         "status": "PARTIAL",
         "gate": gate,
         "data": data,
-        "confidence": max(0, min(100, confidence)),
+        "confidence": 0 if confidence < 0 else 100 if confidence > 100 else confidence,
         "one_liner": one_liner,
-        "diagnostics": build_diagnostics(
-            inputs_used=inputs_used,
-            missing_inputs=missing_inputs,
-            binding_constraint=binding_constraint,
-        ),
+        "diagnostics": {
+            "inputs_used": inputs_used,
+            "missing_inputs": missing_inputs or [],
+            "binding_constraint": binding_constraint,
+        },
     }
 
 
@@ -98,7 +83,7 @@ def error_response(
     gate: str,
     code: str,
     message: str,
-    inputs_used: list[str],
+    inputs_used: Sequence[str],
     missing_inputs: list[str] | None = None,
     binding_constraint: str | None = "DATA_AVAILABILITY",
 ) -> dict[str, Any]:
@@ -113,18 +98,18 @@ def error_response(
             "code": code,
             "message": message,
         },
-        "diagnostics": build_diagnostics(
-            inputs_used=inputs_used,
-            missing_inputs=missing_inputs or [],
-            binding_constraint=binding_constraint,
-        ),
+        "diagnostics": {
+            "inputs_used": inputs_used,
+            "missing_inputs": missing_inputs or [],
+            "binding_constraint": binding_constraint,
+        },
     }
 
 
 def skipped_response(
     gate: str,
     data: dict[str, Any],
-    inputs_used: list[str],
+    inputs_used: Sequence[str],
     reason: str,
     missing_inputs: list[str] | None = None,
     binding_constraint: str | None = "NOT_APPLICABLE",
@@ -136,11 +121,11 @@ def skipped_response(
         "data": data,
         "confidence": 0,
         "one_liner": reason,
-        "diagnostics": build_diagnostics(
-            inputs_used=inputs_used,
-            missing_inputs=missing_inputs or [],
-            binding_constraint=binding_constraint,
-        ),
+        "diagnostics": {
+            "inputs_used": inputs_used,
+            "missing_inputs": missing_inputs or [],
+            "binding_constraint": binding_constraint,
+        },
     }
 
 
@@ -148,9 +133,14 @@ def skipped_response(
 # Validation helpers
 # ---------------------------------------------------------------------------
 
-def missing_required_fields(values: Mapping[str, Any]) -> list[str]:
-    """Return missing keys where value is None."""
-    return [key for key, value in values.items() if value is None]
+def missing_required_fields(values: Mapping[str, Any] | Iterable[tuple[str, Any]]) -> list[str]:
+    """Return missing keys where value is None.
+
+    Accepts a mapping or `(name, value)` pairs; pairs let callers skip
+    building a dict that is only ever enumerated.
+    """
+    items = values.items() if isinstance(values, Mapping) else values
+    return [key for key, value in items if value is None]
 
 
 # ---------------------------------------------------------------------------
@@ -190,6 +180,9 @@ def format_decimal_with_percent_label(value: float | None, digits: int = 4) -> s
 # Confidence computation (purely mechanical)
 # ---------------------------------------------------------------------------
 
+_CONFIDENCE_GATES = frozenset({"gate 2", "gate 3", "gate 4"})
+
+
 def compute_pipeline_confidence(
     gate_results: list[dict[str, Any]],
 ) -> int:
@@ -206,18 +199,22 @@ def compute_pipeline_confidence(
     if not gate_results:
         return 0
 
-    def _find_gate_data(prefix: str) -> dict[str, Any]:
-        for result in gate_results:
-            gate_name = str(result.get("gate", "")).lower()
-            if gate_name.startswith(prefix):
-                data = result.get("data")
-                if isinstance(data, dict):
-                    return data
-        return {}
-
-    gate2 = _find_gate_data("gate 2")
-    gate3 = _find_gate_data("gate 3")
-    gate4 = _find_gate_data("gate 4")
+    # One pass: the first dict payload per "gate N" prefix, plus whether any
+    # result reports missing inputs.
+    gate_data: dict[str, dict[str, Any]] = {}
+    key_data_missing = False
+    for result in gate_results:
+        prefix = str(result.get("gate", "")).lower()[:6]
+        if prefix in _CONFIDENCE_GATES and prefix not in gate_data:
+            data = result.get("data")
+            if isinstance(data, dict):
+                gate_data[prefix] = data
+        if not key_data_missing and result.get("diagnostics", {}).get("missing_inputs", []):
+            key_data_missing = True
+
+    gate2 = gate_data.get("gate 2", {})
+    gate3 = gate_data.get("gate 3", {})
+    gate4 = gate_data.get("gate 4", {})
 
     confidence = 50
 
@@ -233,10 +230,6 @@ def compute_pipeline_confidence(
     if market_structure == "HEADWIND":
         confidence -= 10
 
-    key_data_missing = any(
-        bool(result.get("diagnostics", {}).get("missing_inputs", []))
-        for result in gate_results
-    )
     if key_data_missing:
         confidence -= 10
 
@@ -247,18 +240,42 @@ def compute_pipeline_confidence(
 # Logging
 # ---------------------------------------------------------------------------
 
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+def _json_log_default(value: Any) -> str:
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
 def structured_log(
     logger: logging.Logger,
     level: str,
     event: str,
     **fields: Any,
 ) -> None:
-    """Emit JSON-style structured log records."""
+    """Emit JSON-style structured log records.
+
+    Records below the logger's effective level return before the timestamp
+    and JSON payload are built.  orjson renders the datetime in the same
+    ISO-8601 form as `utc_timestamp`; payloads it rejects (e.g. ints beyond
+    64 bits) fall back to stdlib json.
+    """
+    if not logger.isEnabledFor(_LOG_LEVELS.get(level.lower(), logging.INFO)):
+        return
     payload = {
         "event": event,
-        "timestamp": utc_timestamp(),
+        "timestamp": datetime.now(timezone.utc),
         **fields,
     }
-    message = json.dumps(payload, default=str)
+    try:
+        message = orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        message = json.dumps(payload, default=_json_log_default)
     level_method = getattr(logger, level.lower(), logger.info)
     level_method(message)
@@ -1,15 +1,24 @@
 """
 Test script for Mizan API
 Run this to verify the system works end-to-end
+
+    python test_api.py                  # one request, full response printed
+    python test_api.py --load 20        # 20 concurrent requests, latency summary
 """
+import argparse
+import asyncio
 import httpx
 import json
+import time
+
+URL = "http://localhost:8000/analyze"
+LOAD_TICKERS = ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "JPM", "XOM", "KO", "PFE", "CAT"]
 
 
 def test_analyze_endpoint():
     """Test the /analyze endpoint with a sample company"""
     
-    url = "http://localhost:8000/analyze"
+    url = URL
     payload = {
         "company_input": "AAPL"
     }
@@ -48,5 +57,60 @@ def test_analyze_endpoint():
         print(f"❌ Error: {e}")
 
 
+async def _timed_post(client: httpx.AsyncClient, payload: dict) -> tuple[float, str]:
+    """POST one analysis; returns (latency_ms, outcome) where outcome is the
+    pipeline status or the HTTP/transport/decode error class."""
+    start = time.perf_counter_ns()
+    try:
+        response = await client.post(URL, json=payload)
+        response.raise_for_status()
+        body = response.json()
+        outcome = body.get("status", "UNKNOWN") if isinstance(body, dict) else "UNKNOWN"
+    except (httpx.HTTPError, ValueError) as e:
+        outcome = type(e).__name__
+    return (time.perf_counter_ns() - start) / 1e6, outcome
+
+
+def _positive_int(value: str) -> int:
+    count = int(value)
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {count}")
+    return count
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def run_load_probe(requests: int, tickers: list[str]) -> None:
+    """Fire `requests` concurrent /analyze calls (cycling through `tickers`)
+    and report latency min/median/p95/max and the non-OK count."""
+    payloads = [{"company_input": tickers[i % len(tickers)]} for i in range(requests)]
+    print(f"Load probe: {requests} concurrent POST {URL} over {len(tickers)} tickers")
+
+    limits = httpx.Limits(max_connections=50)
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=120.0) as client:
+        wall_start = time.perf_counter_ns()
+        results = await asyncio.gather(*(_timed_post(client, payload) for payload in payloads))
+        wall_ms = (time.perf_counter_ns() - wall_start) / 1e6
+
+    latencies = sorted(latency for latency, _ in results)
+    non_ok = [outcome for _, outcome in results if outcome != "OK"]
+    print(f"wall    {wall_ms:10.1f} ms")
+    print(f"min     {latencies[0]:10.1f} ms")
+    print(f"median  {_percentile(latencies, 50):10.1f} ms")
+    print(f"p95     {_percentile(latencies, 95):10.1f} ms")
+    print(f"max     {latencies[-1]:10.1f} ms")
+    print(f"non-OK  {len(non_ok)} / {requests}" + (f"  {sorted(set(non_ok))}" if non_ok else ""))
+
+
 if __name__ == "__main__":
-    test_analyze_endpoint()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--load", type=_positive_int, metavar="N", help="issue N concurrent requests instead of one")
+    parser.add_argument("--tickers", nargs="+", default=LOAD_TICKERS, help="tickers cycled by --load")
+    args = parser.parse_args()
+    if args.load is not None:
+        asyncio.run(run_load_probe(args.load, args.tickers))
+    else:
+        test_analyze_endpoint()